@@ -0,0 +1,81 @@
+"""
+Measures the selection of the files of a large project when building
+a source distribution and a wheel.
+
+    python -m benchmarks.build
+"""
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+
+import poetry.puzzle.provider  # noqa  # isort:skip
+
+from poetry.factory import Factory  # isort:skip
+from poetry.io.null_io import NullIO  # isort:skip
+from poetry.masonry.builders.sdist import SdistBuilder  # isort:skip
+from poetry.masonry.builders.wheel import WheelBuilder  # isort:skip
+from poetry.utils._compat import Path  # isort:skip
+from poetry.utils.env import NullEnv  # isort:skip
+
+
+PYPROJECT = """\
+[tool.poetry]
+name = "project"
+version = "1.0.0"
+description = ""
+authors = ["Poetry <poetry@example.com>"]
+exclude = ["**/*.log", "project/pkg0/**/fixtures/*", "**/tmp/"]
+
+[tool.poetry.dependencies]
+python = "*"
+"""
+
+
+def create_project(packages, modules):  # type: (int, int) -> Path
+    path = Path(tempfile.mkdtemp())
+    path.joinpath("pyproject.toml").write_text(PYPROJECT)
+    path.joinpath(".gitignore").write_text(u"*.bak\n")
+
+    package = path / "project"
+    package.mkdir()
+    package.joinpath("__init__.py").touch()
+    for i in range(packages):
+        subpackage = package / "pkg{}".format(i)
+        for directory in ["", "data", "fixtures", "tmp"]:
+            subpackage.joinpath(directory).mkdir(exist_ok=True)
+
+        subpackage.joinpath("__init__.py").touch()
+        for j in range(modules):
+            subpackage.joinpath("module{}.py".format(j)).touch()
+            subpackage.joinpath("data", "data{}.txt".format(j)).touch()
+            subpackage.joinpath("fixtures", "fixture{}.bak".format(j)).touch()
+            subpackage.joinpath("tmp", "tmp{}.log".format(j)).touch()
+
+    subprocess.check_call(["git", "init", "-q", str(path)])
+
+    return path
+
+
+def run(path):  # type: (Path) -> float
+    project = Factory().create_poetry(path)
+    target = Path(tempfile.mkdtemp())
+
+    start = time.time()
+    try:
+        SdistBuilder(project, NullEnv(), NullIO()).build(target)
+        WheelBuilder.make_in(project, NullEnv(), NullIO(), target)
+    finally:
+        shutil.rmtree(str(target))
+
+    return time.time() - start
+
+
+if __name__ == "__main__":
+    path = create_project(40, 50)
+    try:
+        files = sum(len(f) for _, _, f in os.walk(str(path / "project")))
+        print("sdist and wheel of {} files: {:.3f}s".format(files, run(path)))
+    finally:
+        shutil.rmtree(str(path))
@@ -0,0 +1,85 @@
+"""
+Benchmarks the construction of the dependency graph after resolution.
+
+Usage: python -m benchmarks.build_graph [--nodes N] [--repeat N]
+"""
+import argparse
+import random
+import time
+
+from clikit.io import NullIO
+
+from poetry.packages import Package
+from poetry.packages import ProjectPackage
+from poetry.puzzle.solver import Solver
+from poetry.repositories import Pool
+from poetry.repositories import Repository
+
+
+def build_packages(nodes, seed=0):  # type: (int, int) -> tuple
+    """
+    Builds a diamond-heavy graph of packages: each package depends
+    on a few packages of the next layer and on a handful of packages
+    which almost every package depends on, like six or attrs.
+    """
+    rng = random.Random(seed)
+    root = ProjectPackage("root", "1.0.0")
+    hubs = [Package("hub-{}".format(i), "1.0.0") for i in range(5)]
+    packages = [Package("package-{}".format(i), "1.0.0") for i in range(nodes - 5)]
+
+    width = 10
+    layers = [packages[i : i + width] for i in range(0, len(packages), width)]
+
+    for package in layers[0]:
+        root.add_dependency(package.name, "*")
+
+    for current, following in zip(layers, layers[1:]):
+        for package in current:
+            for dependency in rng.sample(following, min(len(following), 3)):
+                package.add_dependency(dependency.name, "*")
+
+    for package in packages:
+        for hub in rng.sample(hubs, 2):
+            package.add_dependency(
+                hub.name,
+                {
+                    "version": "*",
+                    "markers": 'python_version >= "3.{}"'.format(rng.randint(4, 8)),
+                },
+            )
+
+    for hub, dependency in zip(hubs, hubs[1:]):
+        hub.add_dependency(dependency.name, "*")
+
+    return root, packages + hubs
+
+
+def run(root, packages):  # type: (ProjectPackage, list) -> float
+    solver = Solver(root, Pool(), Repository(), Repository(), NullIO())
+
+    start = time.time()
+    graph = solver._build_graph(root, packages)
+    solver._get_tags_for_packages(graph)
+
+    return time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    root, packages = build_packages(args.nodes)
+
+    timings = [run(root, packages) for _ in range(args.repeat)]
+
+    print(
+        "Built the graph of {} packages: best of {}: {:.3f}s".format(
+            args.nodes, args.repeat, min(timings)
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Measures the loading of a lock file, as done by install, export and show.
+
+    python -m benchmarks.lock
+"""
+import time
+
+from typing import Tuple
+
+import poetry.puzzle.provider  # noqa  # isort:skip
+
+from tomlkit import parse  # isort:skip
+
+from poetry.packages import Locker  # isort:skip
+from poetry.utils._compat import Path  # isort:skip
+
+
+LOCK = Path(__file__).parent.parent / "poetry.lock"
+
+
+def run(repeat):  # type: (int) -> Tuple[float, float]
+    content = LOCK.read_text(encoding="utf-8")
+
+    start = time.time()
+    for _ in range(repeat):
+        parse(content)
+    tomlkit = time.time() - start
+
+    start = time.time()
+    for _ in range(repeat):
+        locker = Locker(LOCK, {})
+        locker.is_fresh()
+        locker.locked_repository(True)
+
+    return tomlkit, time.time() - start
+
+
+if __name__ == "__main__":
+    tomlkit, locker = run(10)
+    print("poetry.lock parsed by tomlkit x 10: {:.3f}s".format(tomlkit))
+    print("poetry.lock loaded by the locker x 10: {:.3f}s".format(locker))
@@ -0,0 +1,52 @@
+"""
+Measures the evaluation of the markers of the packages of a lock file
+against an environment, as done when installing.
+
+    python -m benchmarks.markers
+"""
+import time
+
+from typing import Tuple
+
+import poetry.puzzle.provider  # noqa  # isort:skip
+
+from poetry.utils.env import SystemEnv  # isort:skip
+from poetry.utils._compat import Path  # isort:skip
+from poetry.version.markers import parse_marker  # isort:skip
+from poetry.version.markers import validate_markers  # isort:skip
+
+
+MARKERS = [
+    'python_version >= "2.7" and python_version < "2.8"',
+    'python_version >= "3.5" and python_version < "4.0"',
+    'sys_platform == "win32"',
+    'sys_platform == "win32" and python_version >= "3.5"',
+    'platform_python_implementation == "CPython" and python_version < "3.8"',
+    'python_version < "3.4" or python_version >= "3.6" and sys_platform != "win32"',
+    'implementation_name == "cpython" and platform_machine == "x86_64"',
+    'python_version in "2.7 3.4 3.5" and os_name == "nt"',
+    'python_full_version >= "3.6.1" and platform_system == "Linux"',
+    'extra == "testing" and python_version >= "3.6"',
+]
+
+
+def run(entries, repeat):  # type: (int, int) -> Tuple[float, float]
+    environment = SystemEnv(Path("/")).marker_env
+    markers = [parse_marker(MARKERS[i % len(MARKERS)]) for i in range(entries)]
+
+    start = time.time()
+    for _ in range(repeat):
+        [marker.validate(environment) for marker in markers]
+    one_by_one = time.time() - start
+
+    start = time.time()
+    for _ in range(repeat):
+        validate_markers(markers, environment)
+
+    return one_by_one, time.time() - start
+
+
+if __name__ == "__main__":
+    one_by_one, batch = run(400, 100)
+    print("400 lock markers x 100, one by one: {:.3f}s".format(one_by_one))
+    print("400 lock markers x 100, batch: {:.3f}s".format(batch))
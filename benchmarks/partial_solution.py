@@ -0,0 +1,70 @@
+"""
+Benchmarks the bookkeeping of the solver's partial solution.
+
+Usage: python -m benchmarks.partial_solution [--packages N] [--rounds N] [--repeat N]
+"""
+import argparse
+import time
+
+from poetry.puzzle.provider import Provider  # noqa isort:skip
+from poetry.mixology.incompatibility import Incompatibility
+from poetry.mixology.incompatibility_cause import DependencyCause
+from poetry.mixology.partial_solution import PartialSolution
+from poetry.mixology.term import Term
+from poetry.packages import Dependency
+from poetry.packages import Package
+
+
+def run(packages, rounds):  # type: (int, int) -> float
+    """
+    Decides a version for many unrelated packages, each with a few derivations,
+    then repeatedly decides, inspects and backtracks a conflicting package
+    as the solver does when it resolves conflicts.
+    """
+    solution = PartialSolution()
+    cause = Incompatibility([Term(Dependency("root", "*"), True)], DependencyCause())
+
+    for i in range(packages):
+        name = "package-{}".format(i)
+        solution.derive(Dependency(name, ">=1.0.0"), True, cause)
+        solution.derive(Dependency(name, ">=2.0.0"), False, cause)
+        solution.decide(Package(name, "1.5.0"))
+
+    level = solution.decision_level
+    terms = [
+        Term(Dependency("package-{}".format(i), "<2.0.0"), True)
+        for i in range(0, packages, max(1, packages // 20))
+    ]
+
+    start = time.time()
+    for v in range(rounds):
+        solution.derive(Dependency("conflict", ">={}.0.0".format(v)), True, cause)
+        solution.decide(Package("conflict", "{}.0.0".format(v)))
+
+        for term in terms:
+            solution.satisfier(term)
+            solution.relation(term)
+
+        solution.backtrack(level)
+
+    return time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--packages", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    timings = [run(args.packages, args.rounds) for _ in range(args.repeat)]
+
+    print(
+        "{} rounds over {} packages: best of {}: {:.3f}s".format(
+            args.rounds, args.packages, args.repeat, min(timings)
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
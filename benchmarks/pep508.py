@@ -0,0 +1,45 @@
+"""
+Measures the parsing of PEP 508 requirements, as done for the dependencies
+of every package retrieved from the repositories.
+
+    python -m benchmarks.pep508
+"""
+import time
+
+import poetry.puzzle.provider  # noqa  # isort:skip
+
+from poetry.packages import dependency_from_pep_508  # isort:skip
+
+
+REQUIREMENTS = [
+    "six>=1.10",
+    "requests (>=2.18,<3.0)",
+    'enum34; python_version < "3.4"',
+    'typing (>=3.6,<4.0); python_version >= "2.7" and python_version < "2.8"',
+    'pywin32 (>=223); sys_platform == "win32"',
+    'pytest (>=3.0); extra == "testing"',
+    "cachecontrol[filecache] (>=0.12.4,<0.13.0)",
+    'colorama; sys_platform == "win32" and python_version >= "3.5"',
+    'importlib-metadata (>=0.23); python_version < "3.8"',
+    'futures (>=3.3.0,<4.0.0); python_version >= "2.7" and python_version < "2.8"',
+]
+
+
+def run(distinct, repeat):  # type: (int, int) -> float
+    requirements = [
+        "p{}-{}".format(i, requirement)
+        for i in range(distinct)
+        for requirement in REQUIREMENTS
+    ]
+
+    start = time.time()
+    for _ in range(repeat):
+        for requirement in requirements:
+            dependency_from_pep_508(requirement)
+
+    return time.time() - start
+
+
+if __name__ == "__main__":
+    print("5000 distinct requirements: {:.3f}s".format(run(500, 1)))
+    print("10 requirements parsed 500 times: {:.3f}s".format(run(1, 500)))
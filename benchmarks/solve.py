@@ -0,0 +1,90 @@
+"""
+Benchmarks the resolution of a large synthetic dependency graph.
+
+Usage: python -m benchmarks.solve [--packages N] [--versions N] [--repeat N]
+"""
+import argparse
+import random
+import time
+
+from clikit.io import NullIO
+
+from poetry.puzzle.provider import Provider  # isort:skip
+from poetry.mixology.version_solver import VersionSolver  # isort:skip
+from poetry.packages import Package
+from poetry.packages.project_package import ProjectPackage
+from poetry.repositories import Pool
+from poetry.repositories import Repository
+
+
+def build_repository(packages, versions, seed=0):  # type: (int, int, int) -> Repository
+    """
+    Builds a repository of packages depending on each other.
+
+    Each package only depends on packages with a higher index
+    so that the graph is acyclic, and newer versions
+    have stricter requirements so that the solver has to backtrack.
+    """
+    rng = random.Random(seed)
+    repository = Repository()
+
+    for i in range(packages):
+        for v in range(versions):
+            package = Package(
+                "package-{}".format(i), "{}.{}.0".format(v // 5 + 1, v % 5)
+            )
+
+            candidates = list(range(i + 1, packages))
+            for j in rng.sample(candidates, min(len(candidates), rng.randint(2, 5))):
+                major = min(versions // 5, 1 + (v * rng.randint(1, 3)) // 5)
+                constraint = rng.choice(
+                    [
+                        "^{}.0".format(major),
+                        ">={}.{},<{}.0".format(major, rng.randint(0, 4), major + 1),
+                        "~{}.{}".format(major, rng.randint(0, 4)),
+                        ">={}.0 || <{}.0".format(major, max(major - 1, 1)),
+                    ]
+                )
+                package.add_dependency("package-{}".format(j), constraint)
+
+            repository.add_package(package)
+
+    return repository
+
+
+def solve(repository, roots):  # type: (Repository, int) -> float
+    root = ProjectPackage("root", "0.0.0")
+    for i in range(roots):
+        root.add_dependency("package-{}".format(i), "*")
+
+    pool = Pool()
+    pool.add_repository(repository)
+    provider = Provider(root, pool, NullIO())
+
+    start = time.time()
+    VersionSolver(root, provider).solve()
+
+    return time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--packages", type=int, default=80)
+    parser.add_argument("--versions", type=int, default=25)
+    parser.add_argument("--roots", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    repository = build_repository(args.packages, args.versions)
+
+    timings = [solve(repository, args.roots) for _ in range(args.repeat)]
+
+    print(
+        "Solved {} packages with {} versions each: best of {}: {:.3f}s".format(
+            args.packages, args.versions, args.repeat, min(timings)
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
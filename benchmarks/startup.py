@@ -0,0 +1,95 @@
+"""
+Measures the startup of common commands: the time spent importing modules,
+as reported by `python -X importtime`, and the total run time.
+
+The commands are run in a minimal project with an existing virtualenv.
+
+    python -m benchmarks.startup
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from typing import List
+from typing import Tuple
+
+
+COMMANDS = ["--version", "help", "env info -p", "run true", "add --help"]
+
+SCRIPT = "import sys; from poetry.console import main; sys.argv[0] = 'poetry'; main()"
+
+PYPROJECT = """\
+[tool.poetry]
+name = "project"
+version = "1.0.0"
+description = ""
+authors = ["Poetry <poetry@example.com>"]
+
+[tool.poetry.dependencies]
+python = "*"
+"""
+
+
+def create_project():  # type: () -> str
+    path = tempfile.mkdtemp()
+    with open(os.path.join(path, "pyproject.toml"), "w") as f:
+        f.write(PYPROJECT)
+
+    os.makedirs(os.path.join(path, ".venv", "bin"))
+
+    return path
+
+
+def run(command, repeat, cwd):  # type: (str, int, str) -> Tuple[float, float]
+    """
+    Returns the best import and run times, in seconds, of a command.
+    """
+    imports = []
+    runs = []
+    for _ in range(repeat):
+        start = time.time()
+        process = subprocess.Popen(
+            [sys.executable, "-X", "importtime", "-c", SCRIPT] + command.split(),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            cwd=cwd,
+            env=dict(os.environ, PYTHONPATH=os.getcwd()),
+        )
+        _, err = process.communicate()
+        runs.append(time.time() - start)
+        imports.append(_top_level_import_time(err.splitlines()))
+
+    return min(imports), min(runs)
+
+
+def _top_level_import_time(lines):  # type: (List[str]) -> float
+    total = 0
+    for line in lines:
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, cumulative, name = line.split("|")
+        # Only count the modules imported at the top level,
+        # their cumulative times include the imports they trigger
+        if not name[1:].startswith(" "):
+            total += int(cumulative)
+
+    return total / 1e6
+
+
+if __name__ == "__main__":
+    project = create_project()
+    try:
+        for command in COMMANDS:
+            imports, total = run(command, 5, project)
+            print(
+                "poetry {}: imports {:.3f}s, total {:.3f}s".format(
+                    command, imports, total
+                )
+            )
+    finally:
+        shutil.rmtree(project)
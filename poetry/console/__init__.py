@@ -1,5 +1,13 @@
-from .application import Application
+import sys
 
 
 def main():
+    if sys.argv[1:2] == ["run"]:
+        from .fast_run import run
+
+        # Only returns if the command cannot be run without the application
+        run(sys.argv[2:])
+
+    from .application import Application
+
     return Application().run()
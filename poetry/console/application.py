@@ -1,33 +1,66 @@
+from importlib import import_module
+
 from cleo import Application as BaseApplication
+from clikit.api.args.raw_args import RawArgs
+from clikit.api.command import Command
+from clikit.api.resolver import ResolvedCommand
 
 from poetry import __version__
 
-from .commands.about import AboutCommand
-from .commands.add import AddCommand
-from .commands.build import BuildCommand
-from .commands.cache.cache import CacheCommand
-from .commands.check import CheckCommand
-from .commands.config import ConfigCommand
-from .commands.debug.debug import DebugCommand
-from .commands.env.env import EnvCommand
-from .commands.export import ExportCommand
-from .commands.init import InitCommand
-from .commands.install import InstallCommand
-from .commands.lock import LockCommand
-from .commands.new import NewCommand
-from .commands.publish import PublishCommand
-from .commands.remove import RemoveCommand
-from .commands.run import RunCommand
-from .commands.search import SearchCommand
-from .commands.self.self import SelfCommand
-from .commands.shell import ShellCommand
-from .commands.show import ShowCommand
-from .commands.update import UpdateCommand
-from .commands.version import VersionCommand
+from .commands.command import Command as BaseCommand
 from .config import ApplicationConfig
 
 
+COMMANDS = [
+    "about",
+    "add",
+    "build",
+    "check",
+    "config",
+    "export",
+    "init",
+    "install",
+    "lock",
+    "new",
+    "publish",
+    "remove",
+    "run",
+    "search",
+    "shell",
+    "show",
+    "update",
+    "version",
+    # Cache commands
+    "cache",
+    # Debug command
+    "debug",
+    # Env command
+    "env",
+    # Self commands
+    "self",
+]
+
+
+def load_command(name):  # type: (str) -> BaseCommand
+    """
+    Imports the module of a command and instantiates it.
+
+    The commands having sub commands live in a package of their own.
+    """
+    module = import_module("poetry.console.commands.{}".format(name))
+    if hasattr(module, "__path__"):
+        module = import_module("{}.{}".format(module.__name__, name))
+
+    return getattr(module, "{}Command".format(name.capitalize()))()
+
+
 class Application(BaseApplication):
+    """
+    The commands are only registered when needed:
+    running a command only imports its own module
+    instead of the modules of all the commands.
+    """
+
     def __init__(self):
         super(Application, self).__init__(
             "poetry", __version__, config=ApplicationConfig("poetry", __version__)
@@ -35,8 +68,29 @@ class Application(BaseApplication):
 
         self._poetry = None
 
-        for command in self.get_default_commands():
-            self.add(command)
+    def get_command(self, name):  # type: (str) -> Command
+        if name in COMMANDS:
+            self._load_command(name)
+
+        return super(Application, self).get_command(name)
+
+    def has_command(self, name):  # type: (str) -> bool
+        if name in COMMANDS:
+            return True
+
+        return super(Application, self).has_command(name)
+
+    def resolve_command(self, args):  # type: (RawArgs) -> ResolvedCommand
+        # Only the command being run is needed,
+        # unless the arguments do not name one (to list the commands,
+        # display the help or suggest alternatives).
+        name = next((t for t in args.tokens if not t.startswith("-")), None)
+        if name in COMMANDS:
+            self._load_command(name)
+        else:
+            self._load_commands()
+
+        return super(Application, self).resolve_command(args)
 
     @property
     def poetry(self):
@@ -54,40 +108,15 @@ class Application(BaseApplication):
         self._poetry = None
 
     def get_default_commands(self):  # type: () -> list
-        commands = [
-            AboutCommand(),
-            AddCommand(),
-            BuildCommand(),
-            CheckCommand(),
-            ConfigCommand(),
-            ExportCommand(),
-            InitCommand(),
-            InstallCommand(),
-            LockCommand(),
-            NewCommand(),
-            PublishCommand(),
-            RemoveCommand(),
-            RunCommand(),
-            SearchCommand(),
-            ShellCommand(),
-            ShowCommand(),
-            UpdateCommand(),
-            VersionCommand(),
-        ]
-
-        # Cache commands
-        commands += [CacheCommand()]
-
-        # Debug command
-        commands += [DebugCommand()]
-
-        # Env command
-        commands += [EnvCommand()]
-
-        # Self commands
-        commands += [SelfCommand()]
-
-        return commands
+        return [load_command(name) for name in COMMANDS]
+
+    def _load_command(self, name):  # type: (str) -> None
+        if not super(Application, self).has_command(name):
+            self.add(load_command(name))
+
+    def _load_commands(self):  # type: () -> None
+        for name in COMMANDS:
+            self._load_command(name)
 
 
 if __name__ == "__main__":
@@ -1,18 +0,0 @@
-from .about import AboutCommand
-from .add import AddCommand
-from .build import BuildCommand
-from .check import CheckCommand
-from .config import ConfigCommand
-from .export import ExportCommand
-from .init import InitCommand
-from .install import InstallCommand
-from .lock import LockCommand
-from .new import NewCommand
-from .publish import PublishCommand
-from .remove import RemoveCommand
-from .run import RunCommand
-from .search import SearchCommand
-from .shell import ShellCommand
-from .show import ShowCommand
-from .update import UpdateCommand
-from .version import VersionCommand
@@ -9,7 +9,14 @@ class BuildCommand(EnvCommand):
     description = "Builds a package, as a tarball and a wheel by default."
 
     options = [
-        option("format", "f", "Limit the format to either sdist or wheel.", flag=False)
+        option("format", "f", "Limit the format to either sdist or wheel.", flag=False),
+        option(
+            "jobs",
+            "j",
+            "The maximum number of parallel jobs (defaults to the number of CPUs).",
+            flag=False,
+        ),
+        option("force", None, "Rebuild the distributions even if they are up to date."),
     ]
 
     def handle(self):
@@ -19,6 +26,21 @@ class BuildCommand(EnvCommand):
         if self.option("format"):
             fmt = self.option("format")
 
+        jobs = self.option("jobs")
+        if jobs is not None:
+            try:
+                jobs = int(jobs)
+            except ValueError:
+                jobs = 0
+
+            if jobs < 1:
+                self.line_error(
+                    "<error>The number of jobs must be a positive integer, "
+                    "got {}.</error>".format(self.option("jobs"))
+                )
+
+                return 1
+
         package = self.poetry.package
         self.line(
             "Building <c1>{}</c1> (<b>{}</b>)".format(
@@ -26,5 +48,7 @@ class BuildCommand(EnvCommand):
             )
         )
 
-        builder = Builder(self.poetry, self.env, self.io)
+        builder = Builder(
+            self.poetry, self.env, self.io, jobs=jobs, force=self.option("force"),
+        )
         builder.build(fmt)
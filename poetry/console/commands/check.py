@@ -1,7 +1,3 @@
-from poetry.factory import Factory
-from poetry.utils._compat import Path
-from poetry.utils.toml_file import TomlFile
-
 from .command import Command
 
 
@@ -11,6 +7,10 @@ class CheckCommand(Command):
     description = "Checks the validity of the <comment>pyproject.toml</comment> file."
 
     def handle(self):
+        from poetry.factory import Factory
+        from poetry.utils._compat import Path
+        from poetry.utils.toml_file import TomlFile
+
         # Load poetry config and display errors, if any
         poetry_file = Factory.locate(Path.cwd())
         config = TomlFile(str(poetry_file)).read()["tool"]["poetry"]
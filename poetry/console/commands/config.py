@@ -4,8 +4,6 @@ import re
 from cleo import argument
 from cleo import option
 
-from poetry.factory import Factory
-
 from .command import Command
 
 
@@ -41,6 +39,8 @@ To remove a repository (repo is a short alias for repositories):
     def unique_config_values(self):
         from poetry.config.config import boolean_normalizer
         from poetry.config.config import boolean_validator
+        from poetry.config.config import int_normalizer
+        from poetry.config.config import int_validator
         from poetry.locations import CACHE_DIR
         from poetry.utils._compat import Path
 
@@ -57,12 +57,15 @@ To remove a repository (repo is a short alias for repositories):
                 lambda val: str(Path(val)),
                 str(Path(CACHE_DIR) / "virtualenvs"),
             ),
+            "installer.max-workers": (int_validator, int_normalizer, None),
+            "pool.timeout": (int_validator, int_normalizer, None),
         }
 
         return unique_config_values
 
     def handle(self):
         from poetry.config.file_config_source import FileConfigSource
+        from poetry.factory import Factory
         from poetry.locations import CONFIG_DIR
         from poetry.utils._compat import Path
         from poetry.utils._compat import basestring
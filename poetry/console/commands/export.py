@@ -1,7 +1,5 @@
 from cleo import option
 
-from poetry.utils.exporter import Exporter
-
 from .command import Command
 
 
@@ -26,6 +24,8 @@ class ExportCommand(Command):
     ]
 
     def handle(self):
+        from poetry.utils.exporter import Exporter
+
         fmt = self.option("format")
 
         if fmt not in Exporter.ACCEPTED_FORMATS:
@@ -11,7 +11,6 @@ from typing import Tuple
 from typing import Union
 
 from cleo import option
-from tomlkit import inline_table
 
 from poetry.utils._compat import OrderedDict
 from poetry.utils._compat import Path
@@ -464,6 +463,8 @@ The <c1>init</c1> command creates a basic <comment>pyproject.toml</> file in the
     def _format_requirements(
         self, requirements
     ):  # type: (List[Dict[str, str]]) -> Dict[str, Union[str, Dict[str, str]]]
+        from tomlkit import inline_table
+
         requires = {}
         for requirement in requirements:
             name = requirement.pop("name")
@@ -1,3 +1,5 @@
+from cleo import option
+
 from .env_command import EnvCommand
 
 
@@ -6,12 +8,23 @@ class LockCommand(EnvCommand):
     name = "lock"
     description = "Locks the project dependencies."
 
+    options = [
+        option(
+            "no-update", None, "Do not update locked versions, only refresh lock file."
+        ),
+    ]
+
     help = """
 The <info>lock</info> command reads the <comment>pyproject.toml</> file from the
 current directory, processes it, and locks the dependencies in the <comment>poetry.lock</>
 file.
 
 <info>poetry lock</info>
+
+By default, every dependency is resolved again to its latest compatible version.
+With the <comment>--no-update</> option, the versions from the existing lock file
+are kept whenever they are still compatible with <comment>pyproject.toml</>, so that
+only the dependencies affected by the changes are resolved again.
 """
 
     loggers = ["poetry.repositories.pypi_repository"]
@@ -20,9 +33,14 @@ file.
         from poetry.installation.installer import Installer
 
         installer = Installer(
-            self.io, self.env, self.poetry.package, self.poetry.locker, self.poetry.pool
+            self.io,
+            self.env,
+            self.poetry.package,
+            self.poetry.locker,
+            self.poetry.pool,
+            config=self.poetry.config,
         )
 
-        installer.lock()
+        installer.lock(update=not self.option("no-update"))
 
         return installer.run()
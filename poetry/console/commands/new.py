@@ -3,8 +3,6 @@ import sys
 from cleo import argument
 from cleo import option
 
-from poetry.utils.helpers import module_name
-
 from .command import Command
 
 
@@ -24,6 +22,7 @@ class NewCommand(Command):
         from poetry.semver import parse_constraint
         from poetry.utils._compat import Path
         from poetry.utils.env import SystemEnv
+        from poetry.utils.helpers import module_name
         from poetry.vcs.git import GitConfig
 
         if self.option("src"):
@@ -30,21 +30,9 @@ class RunCommand(EnvCommand):
         return self.env.execute(*args)
 
     def run_script(self, script, args):
-        if isinstance(script, dict):
-            script = script["callable"]
+        from ..fast_run import script_command
 
-        module, callable_ = script.split(":")
-
-        src_in_sys_path = "sys.path.append('src'); " if self._module.is_in_src() else ""
-
-        cmd = ["python", "-c"]
-
-        cmd += [
-            "import sys; "
-            "from importlib import import_module; "
-            "sys.argv = {!r}; {}"
-            "import_module('{}').{}()".format(args, src_in_sys_path, module, callable_)
-        ]
+        cmd = script_command(script, args, src_in_sys_path=self._module.is_in_src())
 
         return self.env.execute(*cmd)
 
@@ -3,10 +3,8 @@ import os
 import shutil
 import subprocess
 import sys
-import tarfile
 
 from functools import cmp_to_key
-from gzip import GzipFile
 
 from cleo import argument
 from cleo import option
@@ -14,14 +12,6 @@ from cleo import option
 from ..command import Command
 
 
-try:
-    from urllib.error import HTTPError
-    from urllib.request import urlopen
-except ImportError:
-    from urllib2 import HTTPError
-    from urllib2 import urlopen
-
-
 class SelfUpdateCommand(Command):
 
     name = "update"
@@ -145,8 +135,19 @@ class SelfUpdateCommand(Command):
         )
 
     def _update(self, version):
+        import tarfile
+
+        from gzip import GzipFile
+
         from poetry.utils.helpers import temporary_directory
 
+        try:
+            from urllib.error import HTTPError
+            from urllib.request import urlopen
+        except ImportError:
+            from urllib2 import HTTPError
+            from urllib2 import urlopen
+
         platform = sys.platform
         if platform == "linux2":
             platform = "linux"
@@ -1,6 +1,5 @@
 import sys
 
-from distutils.util import strtobool
 from os import environ
 
 from .env_command import EnvCommand
@@ -17,6 +16,8 @@ If one doesn't exist yet, it will be created.
 """
 
     def handle(self):
+        from distutils.util import strtobool
+
         from poetry.utils.shell import Shell
 
         # Check if it's already activated or doesn't exist and won't be created
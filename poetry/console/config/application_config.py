@@ -75,12 +75,12 @@ class ApplicationConfig(BaseApplicationConfig):
             logger.setLevel(level)
 
     def set_env(self, event, event_name, _):  # type: (PreHandleEvent, str, Any) -> None
-        from poetry.utils.env import EnvManager
-
         command = event.command.config.handler  # type: EnvCommand
         if not isinstance(command, EnvCommand):
             return
 
+        from poetry.utils.env import EnvManager
+
         io = event.io
         poetry = command.poetry
 
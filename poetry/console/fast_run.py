@@ -0,0 +1,214 @@
+"""
+A fast path for `poetry run`.
+
+Running a command only requires to know where the project's virtualenv is
+and, for scripts, what they point to. Both are found here from the
+pyproject.toml file, the configuration files and the envs.toml file,
+without creating the project, its package and its repositories and without
+loading the console application.
+
+Whenever the outcome of the regular `run` command cannot be reproduced
+exactly, for instance when the virtualenv still has to be created,
+the fast path gives up and the regular command is used instead.
+"""
+import os
+import sys
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from poetry.config.config import Config
+from poetry.locations import CACHE_DIR
+from poetry.locations import CONFIG_DIR
+from poetry.utils._compat import Path
+from poetry.utils.helpers import canonicalize_name
+from poetry.utils.helpers import generate_env_name
+from poetry.utils.helpers import module_name
+from poetry.utils.toml_reader import TOMLReaderError
+from poetry.utils.toml_reader import loads
+
+
+ENVS_FILE = "envs.toml"
+
+
+def run(args, cwd=None):  # type: (List[str], Optional[Path]) -> Optional[int]
+    """
+    Executes the given command in the project's virtualenv,
+    replacing the current process.
+
+    Returns None, without doing anything, if the fast path cannot be used.
+    """
+    if not args or sys.platform == "win32":
+        return
+
+    try:
+        command = prepare(args, cwd or Path.cwd())
+    except Exception:
+        return
+
+    if command is None:
+        return
+
+    bin, args, env = command
+    try:
+        return os.execvpe(bin, [bin] + args, env)
+    except OSError:
+        # Let the regular command report the error
+        return
+
+
+def prepare(args, cwd):  # type: (List[str], Path) -> Optional[tuple]
+    """
+    Returns the executable, arguments and environment variables
+    to run the given command with, or None if the fast path cannot be used.
+    """
+    poetry_file = _locate(cwd)
+    if poetry_file is None:
+        return
+
+    local_config = _read(poetry_file).get("tool", {}).get("poetry")
+    if not local_config or "name" not in local_config:
+        return
+
+    config = Config()
+    for config_file in [
+        Path(CONFIG_DIR) / "config.toml",
+        poetry_file.parent / "poetry.toml",
+    ]:
+        if config_file.exists():
+            config.merge(_read(config_file))
+
+    venv = _find_venv(
+        canonicalize_name(local_config["name"]), poetry_file.parent, config
+    )
+    if venv is None:
+        return
+
+    scripts = local_config.get("scripts")
+    if scripts and args[0] in scripts:
+        if _is_in_src(poetry_file.parent, local_config):
+            # Whether the src directory is added to sys.path
+            # is left to the regular command
+            return
+
+        args = script_command(scripts[args[0]], args)
+
+    bin_dir = venv / "bin"
+    bin = args[0]
+    bin_path = (bin_dir / bin).with_suffix("")
+    if bin_path.exists():
+        bin = str(bin_path)
+
+    env = dict(os.environ)
+    env["PATH"] = os.pathsep.join([str(bin_dir), os.environ["PATH"]])
+    env["VIRTUAL_ENV"] = str(venv)
+    env.pop("PYTHONHOME", None)
+    env.pop("__PYVENV_LAUNCHER__", None)
+
+    return bin, args[1:], env
+
+
+def script_command(
+    script, args, src_in_sys_path=False
+):  # type: (Any, List[str], bool) -> List[str]
+    """
+    Returns the command running the given script entry point.
+    """
+    if isinstance(script, dict):
+        script = script["callable"]
+
+    module, callable_ = script.split(":")
+
+    return [
+        "python",
+        "-c",
+        "import sys; "
+        "from importlib import import_module; "
+        "sys.argv = {!r}; {}"
+        "import_module('{}').{}()".format(
+            args,
+            "sys.path.append('src'); " if src_in_sys_path else "",
+            module,
+            callable_,
+        ),
+    ]
+
+
+def _locate(cwd):  # type: (Path) -> Optional[Path]
+    for path in [cwd] + list(cwd.parents):
+        poetry_file = path / "pyproject.toml"
+        if poetry_file.exists():
+            return poetry_file
+
+
+def _is_in_src(root, local_config):  # type: (Path, Dict[str, Any]) -> bool
+    """
+    Mirrors the discovery of the project's packages made by Module.
+    """
+    packages = local_config.get("packages")
+    if packages:
+        return any(package.get("from") for package in packages)
+
+    name = module_name(local_config["name"])
+    if (root / name).is_dir() or (root / (name + ".py")).is_file():
+        return False
+
+    src = root / "src"
+
+    return (src / name).is_dir() or (src / (name + ".py")).is_file()
+
+
+def _read(path):  # type: (Path) -> Dict[str, Any]
+    with path.open(encoding="utf-8") as f:
+        content = f.read()
+
+    try:
+        return loads(content)
+    except TOMLReaderError:
+        import tomlkit
+
+        return tomlkit.parse(content)
+
+
+def _find_venv(name, cwd, config):  # type: (str, Path, Config) -> Optional[Path]
+    """
+    Mirrors EnvManager.create_venv() for an existing virtualenv.
+    """
+    python_minor = ".".join([str(v) for v in sys.version_info[:2]])
+
+    venv_path = config.get("virtualenvs.path")
+    if venv_path is None:
+        venv_path = Path(CACHE_DIR) / "virtualenvs"
+    else:
+        venv_path = Path(venv_path)
+
+    envs_file = venv_path / ENVS_FILE
+    env = None
+    base_env_name = generate_env_name(name, str(cwd))
+    if envs_file.exists():
+        env = _read(envs_file).get(base_env_name)
+        if env:
+            python_minor = env["minor"]
+
+    env_prefix = os.environ.get("VIRTUAL_ENV", os.environ.get("CONDA_PREFIX"))
+    conda_env_name = os.environ.get("CONDA_DEFAULT_ENV")
+    in_venv = env_prefix is not None and conda_env_name != "base"
+
+    if in_venv and env is None:
+        return Path(env_prefix)
+
+    if (cwd / ".venv").is_dir():
+        return cwd / ".venv"
+
+    if not config.get("virtualenvs.create", True):
+        # The system environment is used, which the regular command handles
+        return
+
+    venv = venv_path / "{}-py{}".format(base_env_name, python_minor.strip())
+    if not venv.exists():
+        # The virtualenv has to be created first
+        return
+
+    return venv
@@ -163,6 +163,7 @@ class Factory:
             config.merge(local_config_file.read())
 
         poetry = Poetry(poetry_file, local_config, package, locker, config)
+        poetry.pool.timeout = config.get("pool.timeout")
 
         # Configuring sources
         for source in local_config.get("source", []):
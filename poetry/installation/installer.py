@@ -1,9 +1,14 @@
+import itertools
+import multiprocessing
+
+from typing import Callable
 from typing import List
 from typing import Union
 
 from clikit.api.io import IO
 from clikit.io import NullIO
 
+from poetry.config.config import Config
 from poetry.packages import Locker
 from poetry.packages import Package
 from poetry.puzzle import Solver
@@ -31,6 +36,7 @@ class Installer:
         locker,  # type: Locker
         pool,  # type: Pool
         installed=None,  # type: (Union[InstalledRepository, None])
+        config=None,  # type: (Union[Config, None])
     ):
         self._io = io
         self._env = env
@@ -38,6 +44,11 @@ class Installer:
         self._locker = locker
         self._pool = pool
 
+        if config is None:
+            config = Config()
+
+        self._config = config
+
         self._dry_run = False
         self._update = False
         self._verbose = False
@@ -61,6 +72,10 @@ class Installer:
         return self._installer
 
     def run(self):
+        # Refresh the lock file from the locked versions if possible
+        if not self._update and self._lock and self._locker.is_locked():
+            return self._do_refresh()
+
         # Force update if there is no lock file present
         if not self._update and not self._locker.is_locked():
             self._update = True
@@ -104,11 +119,14 @@ class Installer:
 
         return self
 
-    def lock(self):  # type: () -> Installer
+    def lock(self, update=True):  # type: (bool) -> Installer
         """
         Prepare the installer for locking only.
+
+        If update is False, the currently locked versions are kept
+        as long as they satisfy the dependencies of the project.
         """
-        self.update()
+        self.update(update=update)
         self.execute_operations(False)
         self._lock = True
 
@@ -132,6 +150,31 @@ class Installer:
 
         return self
 
+    def _do_refresh(self):
+        # Checking extras
+        for extra in self._extras:
+            if extra not in self._package.extras:
+                raise ValueError("Extra [{}] is not specified.".format(extra))
+
+        self._io.write_line("<info>Refreshing lock file</>")
+
+        # No package is whitelisted so that the solver picks
+        # the locked versions, only resolving again the dependencies
+        # that are new or no longer satisfied by the lock file.
+        locked_repository = self._locker.locked_repository(True)
+        solver = Solver(
+            self._package, self._pool, Repository(), locked_repository, self._io
+        )
+
+        ops = solver.solve(use_latest=[])
+
+        local_repo = Repository()
+        self._populate_local_repo(local_repo, ops)
+
+        self._write_lock_file(local_repo, force=True)
+
+        return 0
+
     def _do_install(self, local_repo):
         locked_repository = Repository()
         if self._update:
@@ -282,26 +325,88 @@ class Installer:
             )
 
         self._io.write_line("")
-        for op in ops:
-            self._execute(op)
+        self._execute_all(ops)
 
-    def _write_lock_file(self, repo):  # type: (Repository) -> None
-        if self._update and self._write_lock:
+    def _write_lock_file(self, repo, force=False):  # type: (Repository, bool) -> None
+        if self._write_lock and (force or self._update):
             updated_lock = self._locker.set_lock_data(self._package, repo.packages)
 
             if updated_lock:
                 self._io.write_line("")
                 self._io.write_line("<info>Writing lock file</>")
 
-    def _execute(self, operation):  # type: (Operation) -> None
+    def _execute_all(self, operations):  # type: (List[Operation]) -> None
+        """
+        Execute the given operations.
+
+        Operations sharing the same priority do not depend on each other
+        so they are executed concurrently, each group of operations
+        being completed before the next one starts.
+        """
+        max_workers = self._get_max_workers()
+
+        for _, group in itertools.groupby(operations, key=lambda op: op.priority):
+            tasks = []
+            for operation in group:
+                task = self._execute(operation)
+                if task is not None:
+                    tasks.append(task)
+
+            if max_workers == 1 or len(tasks) < 2:
+                for task in tasks:
+                    task()
+
+                continue
+
+            self._run_concurrently(tasks, max_workers)
+
+    def _run_concurrently(
+        self, tasks, max_workers
+    ):  # type: (List[Callable[[], None]], int) -> None
+        from concurrent.futures import ThreadPoolExecutor
+
+        executor = ThreadPoolExecutor(max_workers=min(max_workers, len(tasks)))
+        futures = [executor.submit(task) for task in tasks]
+        try:
+            for future in futures:
+                future.result()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+
+            raise
+        finally:
+            executor.shutdown(wait=True)
+
+    def _get_max_workers(self):  # type: () -> int
+        max_workers = self._config.get("installer.max-workers")
+        if max_workers is None:
+            try:
+                cpu_count = multiprocessing.cpu_count()
+            except NotImplementedError:
+                cpu_count = 1
+
+            # Installing packages is mostly I/O bound
+            max_workers = min(32, cpu_count + 4)
+
+        return max(1, int(max_workers))
+
+    def _execute(
+        self, operation
+    ):  # type: (Operation) -> Union[Callable[[], None], None]
         """
         Execute a given operation.
+
+        The output is written right away but the actual work is returned
+        as a callable, if there is any, so that it can be scheduled.
         """
         method = operation.job_type
 
-        getattr(self, "_execute_{}".format(method))(operation)
+        return getattr(self, "_execute_{}".format(method))(operation)
 
-    def _execute_install(self, operation):  # type: (Install) -> None
+    def _execute_install(
+        self, operation
+    ):  # type: (Install) -> Union[Callable[[], None], None]
         if operation.skipped:
             if self.is_verbose() and (self._execute_operations or self.is_dry_run()):
                 self._io.write_line(
@@ -324,9 +429,11 @@ class Installer:
         if not self._execute_operations:
             return
 
-        self._installer.install(operation.package)
+        return lambda: self._installer.install(operation.package)
 
-    def _execute_update(self, operation):  # type: (Update) -> None
+    def _execute_update(
+        self, operation
+    ):  # type: (Update) -> Union[Callable[[], None], None]
         source = operation.initial_package
         target = operation.target_package
 
@@ -354,9 +461,11 @@ class Installer:
         if not self._execute_operations:
             return
 
-        self._installer.update(source, target)
+        return lambda: self._installer.update(source, target)
 
-    def _execute_uninstall(self, operation):  # type: (Uninstall) -> None
+    def _execute_uninstall(
+        self, operation
+    ):  # type: (Uninstall) -> Union[Callable[[], None], None]
         if operation.skipped:
             if self.is_verbose() and (self._execute_operations or self.is_dry_run()):
                 self._io.write_line(
@@ -379,7 +488,7 @@ class Installer:
         if not self._execute_operations:
             return
 
-        self._installer.remove(operation.package)
+        return lambda: self._installer.remove(operation.package)
 
     def _populate_local_repo(self, local_repo, ops):
         for op in ops:
@@ -430,33 +539,26 @@ class Installer:
         self, ops, repo
     ):  # type: (List[Operation], Repository) -> None
         extra_packages = self._get_extra_packages(repo)
-        for op in ops:
-            if isinstance(op, Update):
-                package = op.target_package
-            else:
-                package = op.package
-
+        packages = [
+            op.target_package if isinstance(op, Update) else op.package for op in ops
+        ]
+        valid_for_markers = self._env.are_valid_for_markers(
+            [package.marker for package in packages]
+        )
+        current_python = parse_constraint(
+            ".".join(str(v) for v in self._env.version_info[:3])
+        )
+        for op, package, valid_for_marker in zip(ops, packages, valid_for_markers):
             if op.job_type == "uninstall":
                 continue
 
-            current_python = parse_constraint(
-                ".".join(str(v) for v in self._env.version_info[:3])
-            )
-            if not package.python_constraint.allows(
-                current_python
-            ) or not self._env.is_valid_for_marker(package.marker):
+            if (
+                not package.python_constraint.allows(current_python)
+                or not valid_for_marker
+            ):
                 op.skip("Not needed for the current environment")
                 continue
 
-            if self._update:
-                extras = {}
-                for extra, deps in self._package.extras.items():
-                    extras[extra] = [dep.name for dep in deps]
-            else:
-                extras = {}
-                for extra, deps in self._locker.lock_data.get("extras", {}).items():
-                    extras[extra] = [dep.lower() for dep in deps]
-
             # If a package is optional and not requested
             # in any extra we skip it
             if package.optional:
@@ -9,10 +9,12 @@ from clikit.io import NullIO
 
 from poetry.repositories.pool import Pool
 from poetry.utils._compat import encode
+from poetry.utils.artifact_cache import ArtifactCache
 from poetry.utils.env import Env
 from poetry.utils.helpers import safe_rmtree
 
 from .base_installer import BaseInstaller
+from .wheel_installer import WheelInstaller
 
 
 try:
@@ -26,6 +28,8 @@ class PipInstaller(BaseInstaller):
         self._env = env
         self._io = io
         self._pool = pool
+        self._wheel_installer = WheelInstaller(env, io, pool)
+        self._artifact_cache = ArtifactCache()
 
     def install(self, package, update=False):
         if package.source_type == "directory":
@@ -38,6 +42,18 @@ class PipInstaller(BaseInstaller):
 
             return
 
+        # Wheels are installed directly when possible,
+        # pip being used for everything else.
+        link = self._wheel_installer.find_link(package)
+        if link is not None:
+            if update and not self._wheel_installer.remove(package):
+                # The installed distribution was not installed from a wheel
+                self.remove(package)
+
+            self._wheel_installer.install(package, link=link)
+
+            return
+
         args = ["install", "--no-deps"]
 
         if (
@@ -87,6 +103,11 @@ class PipInstaller(BaseInstaller):
                 self.run(*args)
             finally:
                 os.unlink(req)
+        elif package.source_type == "url":
+            # The archive is shared with the inspection of the package
+            args.append(str(self._artifact_cache.get(package.source_url)))
+
+            self.run(*args)
         else:
             req = self.requirement(package)
             if not isinstance(req, list):
@@ -106,6 +127,9 @@ class PipInstaller(BaseInstaller):
             if src_dir.exists():
                 safe_rmtree(str(src_dir))
 
+        if self._wheel_installer.remove(package):
+            return
+
         try:
             self.run("uninstall", package.name, "-y")
         except CalledProcessError as e:
@@ -225,7 +249,7 @@ class PipInstaller(BaseInstaller):
 
     def install_git(self, package):
         from poetry.packages import Package
-        from poetry.vcs import Git
+        from poetry.vcs.git_cache import GitCache
 
         src_dir = self._env.path / "src" / package.name
         if src_dir.exists():
@@ -233,9 +257,7 @@ class PipInstaller(BaseInstaller):
 
         src_dir.parent.mkdir(exist_ok=True)
 
-        git = Git()
-        git.clone(package.source_url, src_dir)
-        git.checkout(package.source_reference, src_dir)
+        GitCache().export(package.source_url, package.source_reference, src_dir)
 
         # Now we just need to install from the source directory
         pkg = Package(package.name, package.version)
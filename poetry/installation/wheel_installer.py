@@ -0,0 +1,448 @@
+import csv
+import hashlib
+import os
+import posixpath
+import re
+import stat
+import threading
+import zipfile
+
+from base64 import urlsafe_b64encode
+from email.parser import Parser
+from io import open
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+from clikit.api.io import IO
+
+from poetry.packages import Package
+from poetry.packages.utils.link import Link
+from poetry.repositories.legacy_repository import LegacyRepository
+from poetry.repositories.pool import Pool
+from poetry.repositories.pypi_repository import PyPiRepository
+from poetry.utils._compat import Path
+from poetry.utils._compat import decode
+from poetry.utils.artifact_cache import ArtifactHashMismatch
+from poetry.utils.env import Env
+from poetry.utils.helpers import canonicalize_name
+from poetry.utils.patterns import wheel_file_re
+
+from .base_installer import BaseInstaller
+
+
+try:
+    from configparser import ConfigParser
+except ImportError:
+    from ConfigParser import ConfigParser
+
+
+SCRIPT_TEMPLATE = """\
+#!{python}
+# -*- coding: utf-8 -*-
+import re
+import sys
+
+from {module} import {name}
+
+if __name__ == "__main__":
+    sys.argv[0] = re.sub(r"(-script\\.pyw|\\.exe)?$", "", sys.argv[0])
+    sys.exit({callable}())
+"""
+
+
+class WheelInstallationError(Exception):
+
+    pass
+
+
+class WheelInstaller(BaseInstaller):
+    """
+    Installs pure Python wheels directly into a virtual environment,
+    without having to spawn a pip process for each package.
+    """
+
+    INSTALLER = "poetry"
+
+    # Packages are installed concurrently, and may share directories,
+    # so directories are created and pruned under this lock
+    _directories_lock = threading.Lock()
+
+    def __init__(self, env, io, pool):  # type: (Env, IO, Pool) -> None
+        self._env = env
+        self._io = io
+        self._pool = pool
+        self._supported_tags = None
+
+    def find_link(self, package):  # type: (Package) -> Optional[Link]
+        """
+        Returns the link to a locked wheel of the given package
+        which can be installed natively, if there is one.
+        """
+        if not self.is_supported_env():
+            return
+
+        if package.source_type not in {None, "", "legacy"}:
+            return
+
+        filenames = set(
+            f["file"] for f in package.files if self.is_supported_wheel(f["file"])
+        )
+        if not filenames:
+            return
+
+        repository = self._get_repository(package)
+        if repository is None:
+            return
+
+        for link in repository.find_links_for_package(package):
+            if link.filename in filenames:
+                return link
+
+    def is_supported_env(self):  # type: () -> bool
+        # Scripts on Windows require executable launchers
+        # and system environments can have various layouts
+        # so we leave them to pip.
+        return self._env.is_venv() and self._env.platform != "win32"
+
+    def is_supported_wheel(self, filename):  # type: (str) -> bool
+        m = wheel_file_re.match(filename)
+        if not m or not filename.endswith(".whl"):
+            return False
+
+        if m.group("abi") != "none" or m.group("plat") != "any":
+            return False
+
+        return bool(set(m.group("pyver").split(".")) & self.supported_tags)
+
+    @property
+    def supported_tags(self):  # type: () -> Set[str]
+        if self._supported_tags is None:
+            major, minor = self._env.version_info[:2]
+
+            tags = {"py{}".format(major)}
+            for m in range(minor, -1, -1):
+                tags.add("py{}{}".format(major, m))
+
+            if self._env.python_implementation == "CPython":
+                tags.add("cp{}{}".format(major, minor))
+
+            self._supported_tags = tags
+
+        return self._supported_tags
+
+    def install(self, package, link=None):  # type: (Package, Optional[Link]) -> None
+        if link is None:
+            link = self.find_link(package)
+
+        if link is None:
+            raise WheelInstallationError(
+                "No compatible wheel found for {} ({})".format(
+                    package.pretty_name, package.full_pretty_version
+                )
+            )
+
+        try:
+            archive = self._get_repository(package).get_artifact(
+                link.url, hash=self._get_locked_hash(package, link.filename)
+            )
+        except ArtifactHashMismatch as e:
+            raise WheelInstallationError(
+                "Invalid hash for {} ({}): {}".format(
+                    package.pretty_name, package.full_pretty_version, e
+                )
+            )
+
+        # Removing any previously installed version of the package
+        self.remove(package)
+
+        self.install_wheel(archive)
+
+    def update(self, source, target):  # type: (Package, Package) -> None
+        self.install(target)
+
+    def remove(self, package):  # type: (Package) -> bool
+        """
+        Removes the installed distribution of the given package
+        by using its RECORD file.
+
+        Returns False if there is no such distribution
+        or if it was not installed by this installer.
+        """
+        if not self.is_supported_env():
+            return False
+
+        dist_info = self._find_dist_info(package.name)
+        if dist_info is None:
+            return False
+
+        installer = dist_info / "INSTALLER"
+        if (
+            not installer.exists()
+            or installer.read_text(encoding="utf-8").strip() != self.INSTALLER
+        ):
+            # Other installers, like pip, may have installed files
+            # which are not recorded, so they know best how to remove them
+            return False
+
+        site_packages = self._env.site_packages
+        directories = {dist_info}
+        with open(str(dist_info / "RECORD"), encoding="utf-8", newline="") as f:
+            for row in csv.reader(f):
+                if not row:
+                    continue
+
+                path = Path(os.path.normpath(str(site_packages / row[0])))
+                directories.add(path.parent)
+                if path.is_file() or path.is_symlink():
+                    path.unlink()
+
+                if path.suffix == ".py":
+                    # Removing the bytecode compiled by the interpreter
+                    for pyc in path.parent.glob(
+                        "__pycache__/{}.*.pyc".format(path.stem)
+                    ):
+                        pyc.unlink()
+
+                    directories.add(path.parent / "__pycache__")
+
+                    pyc = path.with_suffix(".pyc")
+                    if pyc.exists():
+                        pyc.unlink()
+
+        # Removing directories which are now empty, deepest first
+        for directory in sorted(directories, key=lambda d: len(d.parts), reverse=True):
+            if directory == site_packages or site_packages not in directory.parents:
+                continue
+
+            with self._directories_lock:
+                for path in [directory] + list(directory.parents):
+                    if (
+                        path == site_packages
+                        or not path.exists()
+                        or any(path.iterdir())
+                    ):
+                        break
+
+                    path.rmdir()
+
+        return True
+
+    def install_wheel(self, archive):  # type: (Path) -> None
+        """
+        Unpacks the given wheel into the environment
+        and records the installed files.
+        """
+        site_packages = self._env.site_packages
+        records = []  # type: List[Tuple[Path, str, int]]
+
+        with zipfile.ZipFile(str(archive)) as zf:
+            dist_info = self._get_dist_info_name(zf)
+            data_dir = dist_info[: -len(".dist-info")] + ".data"
+            name = dist_info.split("-")[0]
+
+            wheel = Parser().parsestr(
+                decode(zf.read(posixpath.join(dist_info, "WHEEL")))
+            )
+            version = wheel.get("Wheel-Version", "1.0").split(".")[0]
+            if version != "1":
+                raise WheelInstallationError(
+                    "Unsupported wheel version {} for {}".format(
+                        wheel["Wheel-Version"], archive.name
+                    )
+                )
+
+            schemes = self._get_schemes(name)
+            record = posixpath.join(dist_info, "RECORD")
+
+            for info in zf.infolist():
+                filename = info.filename
+                if filename.endswith("/") or filename == record:
+                    continue
+
+                scheme = "purelib"
+                if filename.startswith(data_dir + "/"):
+                    scheme, filename = filename[len(data_dir) + 1 :].split("/", 1)
+                    if scheme not in schemes:
+                        raise WheelInstallationError(
+                            "Unknown scheme {} in {}".format(scheme, archive.name)
+                        )
+
+                destination = self._get_destination(schemes[scheme], filename)
+
+                with zf.open(info) as src:
+                    content = src.read()
+
+                executable = bool((info.external_attr >> 16) & 0o111)
+                if scheme == "scripts":
+                    executable = True
+                    if content.startswith(b"#!python"):
+                        content = b"#!" + self._env.python.encode() + content[8:]
+
+                records.append(self._write(destination, content, executable))
+
+            entry_points = posixpath.join(dist_info, "entry_points.txt")
+            if entry_points in zf.namelist():
+                for destination, content in self._get_scripts(
+                    decode(zf.read(entry_points)), schemes["scripts"]
+                ):
+                    records.append(self._write(destination, content, executable=True))
+
+        dist_info_path = site_packages / dist_info
+        records.append(
+            self._write(
+                dist_info_path / "INSTALLER", "{}\n".format(self.INSTALLER).encode()
+            )
+        )
+
+        with open(
+            str(dist_info_path / "RECORD"), "w", encoding="utf-8", newline=""
+        ) as f:
+            writer = csv.writer(f, lineterminator="\n")
+            for path, hash, size in records:
+                writer.writerow([self._relative_path(path, site_packages), hash, size])
+
+            # RECORD itself is recorded with no hash or size
+            writer.writerow([posixpath.join(dist_info, "RECORD"), "", ""])
+
+    def _get_repository(self, package):  # type: (Package) -> Optional[PyPiRepository]
+        if package.source_type == "legacy":
+            try:
+                repository = self._pool.repository(package.source_reference)
+            except ValueError:
+                return
+
+            if not isinstance(repository, LegacyRepository):
+                return
+
+            return repository
+
+        for repository in self._pool.repositories:
+            if isinstance(repository, PyPiRepository) and not isinstance(
+                repository, LegacyRepository
+            ):
+                return repository
+
+    def _get_locked_hash(self, package, filename):  # type: (Package, str) -> str
+        for f in package.files:
+            if f["file"] == filename and f["hash"]:
+                return f["hash"]
+
+        raise WheelInstallationError(
+            "No hash found for {} ({}) using archive {}".format(
+                package.pretty_name, package.full_pretty_version, filename
+            )
+        )
+
+    def _find_dist_info(self, name):  # type: (str) -> Optional[Path]
+        site_packages = self._env.site_packages
+        if not site_packages.exists():
+            return
+
+        name = canonicalize_name(name)
+        for path in site_packages.glob("*.dist-info"):
+            m = wheel_file_re.match(path.name)
+            if not m or canonicalize_name(m.group("name")) != name:
+                continue
+
+            if (path / "RECORD").exists():
+                return path
+
+    def _get_dist_info_name(self, zf):  # type: (zipfile.ZipFile) -> str
+        dist_infos = set(
+            filename.split("/")[0]
+            for filename in zf.namelist()
+            if filename.split("/")[0].endswith(".dist-info")
+        )
+        if len(dist_infos) != 1:
+            raise WheelInstallationError(
+                "Unable to find a single .dist-info directory in {}".format(zf.filename)
+            )
+
+        return dist_infos.pop()
+
+    def _get_schemes(self, name):  # type: (str) -> dict
+        site_packages = self._env.site_packages
+
+        return {
+            "purelib": site_packages,
+            "platlib": site_packages,
+            "scripts": self._env.path / "bin",
+            "headers": self._env.path
+            / "include"
+            / "site"
+            / "python{}.{}".format(*self._env.version_info[:2])
+            / name,
+            "data": self._env.path,
+        }
+
+    def _get_destination(self, root, filename):  # type: (Path, str) -> Path
+        destination = Path(os.path.normpath(os.path.join(str(root), filename)))
+        if destination != root and root not in destination.parents:
+            raise WheelInstallationError(
+                "The file {} would be installed outside of {}".format(filename, root)
+            )
+
+        return destination
+
+    def _get_scripts(
+        self, entry_points, scripts_dir
+    ):  # type: (str, Path) -> List[Tuple[Path, bytes]]
+        parser = ConfigParser()
+        parser.optionxform = str
+        if hasattr(parser, "read_string"):
+            parser.read_string(entry_points)
+        else:
+            from io import StringIO
+
+            parser.readfp(StringIO(entry_points))
+
+        scripts = []
+        for section in ["console_scripts", "gui_scripts"]:
+            if not parser.has_section(section):
+                continue
+
+            for script, spec in parser.items(section):
+                # Extras are ignored
+                spec = re.sub(r"\[.*\]\s*$", "", spec).strip()
+                if ":" not in spec:
+                    continue
+
+                module, attrs = [part.strip() for part in spec.split(":", 1)]
+                name = attrs.split(".")[0]
+
+                scripts.append(
+                    (
+                        scripts_dir / script,
+                        SCRIPT_TEMPLATE.format(
+                            python=self._env.python,
+                            module=module,
+                            name=name,
+                            callable=attrs,
+                        ).encode("utf-8"),
+                    )
+                )
+
+        return scripts
+
+    def _write(
+        self, path, content, executable=False
+    ):  # type: (Path, bytes, bool) -> Tuple[Path, str, int]
+        with self._directories_lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            f = path.open("wb")
+
+        with f:
+            f.write(content)
+
+        if executable:
+            mode = path.stat().st_mode
+            path.chmod(mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+
+        hash_digest = urlsafe_b64encode(hashlib.sha256(content).digest())
+
+        return path, "sha256=" + hash_digest.decode("ascii").rstrip("="), len(content)
+
+    def _relative_path(self, path, root):  # type: (Path, Path) -> str
+        return os.path.relpath(str(path), str(root)).replace(os.sep, "/")
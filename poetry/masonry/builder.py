@@ -1,21 +1,60 @@
 from .builders.complete import CompleteBuilder
 from .builders.sdist import SdistBuilder
 from .builders.wheel import WheelBuilder
+from .utils.build_manifest import BuildManifest
+from .utils.file_selector import FileSelector
 
 
 class Builder:
 
     _FORMATS = {"sdist": SdistBuilder, "wheel": WheelBuilder, "all": CompleteBuilder}
 
-    def __init__(self, poetry, env, io):
+    def __init__(self, poetry, env, io, jobs=None, force=False):
         self._poetry = poetry
         self._env = env
         self._io = io
+        self._jobs = jobs
+        self._force = force
 
     def build(self, fmt):
         if fmt not in self._FORMATS:
             raise ValueError("Invalid format: {}".format(fmt))
 
-        builder = self._FORMATS[fmt](self._poetry, self._env, self._io)
+        # The project is scanned once to fingerprint and build it
+        file_selector = FileSelector(
+            self._poetry.file.parent, self._poetry.package.exclude
+        )
+        builder = self._FORMATS[fmt](
+            self._poetry,
+            self._env,
+            self._io,
+            file_selector=file_selector,
+            jobs=self._jobs,
+        )
 
-        return builder.build()
+        if self._force:
+            # The manifest is left as is: the distributions it records
+            # are only reused afterwards if they were rebuilt identically.
+            return builder.build()
+
+        dist_dir = self._poetry.file.parent / "dist"
+        manifest = BuildManifest(dist_dir)
+        fingerprint = builder.fingerprint()
+
+        if manifest.is_up_to_date(fmt, fingerprint):
+            for name in manifest.artifacts(fmt):
+                self._io.write_line(
+                    " - Skipped <comment>{}</comment> (up to date)".format(name)
+                )
+
+            return
+
+        result = builder.build()
+
+        manifest.record(
+            fmt,
+            fingerprint,
+            [dist_dir / name for name in builder.artifact_filenames()],
+        )
+
+        return result
@@ -1,24 +1,41 @@
 # -*- coding: utf-8 -*-
+import hashlib
+import json
+import multiprocessing
+import os
 import re
 import shutil
 import tempfile
 
 from collections import defaultdict
+from collections import deque
 from contextlib import contextmanager
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
 from typing import Set
 from typing import Union
 
 from clikit.api.io.flags import VERY_VERBOSE
 
+from poetry.__version__ import __version__
 from poetry.utils._compat import Path
-from poetry.utils._compat import glob
-from poetry.utils._compat import lru_cache
 from poetry.utils._compat import to_str
-from poetry.vcs import get_vcs
 
 from ..metadata import Metadata
+from ..utils.file_selector import FileSelector
+from ..utils.helpers import normalize_file_permissions
+from ..utils.helpers import source_date_epoch
 from ..utils.module import Module
 from ..utils.package_include import PackageInclude
+from ..utils.tags import get_abbr_impl
+from ..utils.tags import get_abi_tag
+from ..utils.tags import get_impl_ver
+from ..utils.tags import get_platform
 
 
 AUTHOR_REGEX = re.compile(r"(?u)^(?P<name>[- .,\w\d'’\"()]+) <(?P<email>.+?)>$")
@@ -37,8 +54,14 @@ class Builder(object):
     format = None
 
     def __init__(
-        self, poetry, env, io, ignore_packages_formats=False
-    ):  # type: ("Poetry", "Env", "IO", bool) -> None
+        self,
+        poetry,
+        env,
+        io,
+        ignore_packages_formats=False,
+        file_selector=None,
+        jobs=None,
+    ):  # type: ("Poetry", "Env", "IO", bool, Optional[FileSelector], Optional[int]) -> None
         self._poetry = poetry
         self._env = env
         self._io = io
@@ -69,57 +92,116 @@ class Builder(object):
         )
         self._meta = Metadata.from_package(self._package)
 
+        if file_selector is None:
+            file_selector = FileSelector(self._path, self._package.exclude)
+
+        self._file_selector = file_selector
+
+        if jobs is None:
+            try:
+                jobs = multiprocessing.cpu_count()
+            except NotImplementedError:
+                jobs = 1
+
+        self._jobs = max(1, int(jobs))
+
     def build(self):
         raise NotImplementedError()
 
-    @lru_cache(maxsize=None)
-    def find_excluded_files(self):  # type: () -> Set[str]
-        # Checking VCS
-        vcs = get_vcs(self._path)
-        if not vcs:
-            vcs_ignored_files = set()
-        else:
-            vcs_ignored_files = set(vcs.get_ignored_files())
-
-        explicitely_excluded = set()
-        for excluded_glob in self._package.exclude:
-
-            for excluded in glob(
-                Path(self._path, excluded_glob).as_posix(), recursive=True
-            ):
-                explicitely_excluded.add(
-                    Path(excluded).relative_to(self._path).as_posix()
-                )
+    def artifact_filenames(self):  # type: () -> List[str]
+        """
+        Returns the names of the distributions built in the dist/ directory.
+        """
+        raise NotImplementedError()
+
+    def fingerprint(self):  # type: () -> Dict[str, Any]
+        """
+        Returns what the distributions are built from:
+        the version of Poetry, the configuration of the project,
+        the digests of the files to add and, for packages with
+        a build script, the environment the extensions are built for.
+        """
+        files = {}
+        paths = self.find_files_to_add(exclude_build=False)
+        paths += [p.relative_to(self._path) for p in self._path.glob("COPYING*")]
+        for path in paths:
+            full_path = self._path / path
+            if full_path.is_dir():
+                continue
 
-        ignored = vcs_ignored_files | explicitely_excluded
-        result = set()
-        for file in ignored:
-            result.add(file)
+            h = hashlib.sha256()
+            with full_path.open("rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 64), b""):
+                    h.update(chunk)
+
+            mode = normalize_file_permissions(os.stat(str(full_path)).st_mode)
+            files[path.as_posix()] = "{:o}:{}".format(mode & 0o777, h.hexdigest())
+
+        config = json.dumps(self._poetry.local_config, sort_keys=True, default=str)
+        fingerprint = {
+            "builder": __version__,
+            "config": hashlib.sha256(config.encode("utf-8")).hexdigest(),
+            "files": files,
+            "source_date_epoch": source_date_epoch(),
+        }
+
+        if self._package.build:
+            fingerprint["environment"] = "-".join(
+                [
+                    get_abbr_impl(self._env) + get_impl_ver(self._env),
+                    str(get_abi_tag(self._env)).lower(),
+                    get_platform(),
+                ]
+            )
 
-        # The list of excluded files might be big and we will do a lot
-        # containment check (x in excluded).
-        # Returning a set make those tests much much faster.
-        return result
+        return fingerprint
 
-    def is_excluded(self, filepath):  # type: (Union[str, Path]) -> bool
-        exclude_path = Path(filepath)
+    def map_concurrently(
+        self, func, items
+    ):  # type: (Callable[[Any], Any], Iterable[Any]) -> Iterator[Any]
+        """
+        Applies the given function to the items in worker threads,
+        yielding the results in order.
 
-        while True:
-            if exclude_path.as_posix() in self.find_excluded_files():
-                return True
+        Only a few items are processed ahead of the consumer
+        so that the results do not all have to be kept in memory.
+        """
+        if self._jobs == 1:
+            for item in items:
+                yield func(item)
+
+            return
 
-            if len(exclude_path.parts) > 1:
-                exclude_path = exclude_path.parent
-            else:
-                break
+        from concurrent.futures import ThreadPoolExecutor
 
-        return False
+        executor = ThreadPoolExecutor(max_workers=self._jobs)
+        pending = deque()
+        try:
+            for item in items:
+                pending.append(executor.submit(func, item))
+                if len(pending) > 2 * self._jobs:
+                    yield pending.popleft().result()
+
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+            executor.shutdown(wait=True)
+
+    def find_excluded_files(self):  # type: () -> Set[str]
+        return self._file_selector.find_excluded_files()
+
+    def is_excluded(self, filepath):  # type: (Union[str, Path]) -> bool
+        return self._file_selector.is_excluded(filepath)
 
     def find_files_to_add(self, exclude_build=True):  # type: (bool) -> list
         """
         Finds all files to add to the tarball
         """
         to_add = []
+        seen = set()
 
         for include in self._module.includes:
             for file in include.elements:
@@ -137,7 +219,7 @@ class Builder(object):
                 if file.suffix == ".pyc":
                     continue
 
-                if file in to_add:
+                if file in seen:
                     # Skip duplicates
                     continue
 
@@ -145,6 +227,7 @@ class Builder(object):
                     " - Adding: <comment>{}</comment>".format(str(file)), VERY_VERBOSE
                 )
                 to_add.append(file)
+                seen.add(file)
 
         # Include project files
         self._io.write_line(
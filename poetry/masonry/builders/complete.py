@@ -2,6 +2,10 @@ import os
 import tarfile
 
 from contextlib import contextmanager
+from typing import List
+
+from clikit.formatter import NullFormatter
+from clikit.io import BufferedIO
 
 from poetry.factory import Factory
 from poetry.io.null_io import NullIO
@@ -15,9 +19,72 @@ from .wheel import WheelBuilder
 
 class CompleteBuilder(Builder):
     def build(self):
+        if self._package.build:
+            # Building the extensions of the package pollutes its directory
+            # so the wheel is built from the sdist
+            return self._build_from_sdist()
+
+        dist_dir = self._path / "dist"
+        if not dist_dir.exists():
+            dist_dir.mkdir(parents=True)
+
+        # The project is scanned once for both formats
+        self._file_selector.find_excluded_files()
+
+        sdist_builder = SdistBuilder(
+            self._poetry,
+            self._env,
+            self._io,
+            file_selector=self._file_selector,
+            jobs=self._jobs,
+        )
+
+        if self._jobs == 1:
+            sdist_builder.build(dist_dir)
+            self._io.write_line("")
+            self._build_wheel(self._io, dist_dir)
+
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        # The output of the wheel builder is written once the sdist is built
+        wheel_io = BufferedIO(formatter=NullFormatter())
+        wheel_io.set_verbosity(self._io.verbosity)
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            future = executor.submit(self._build_wheel, wheel_io, dist_dir)
+            sdist_builder.build(dist_dir)
+            future.result()
+        finally:
+            executor.shutdown(wait=True)
+
+        self._io.write_line("")
+        self._io.write(wheel_io.fetch_output())
+
+    def artifact_filenames(self):  # type: () -> List[str]
+        return (
+            SdistBuilder(self._poetry, self._env, NullIO()).artifact_filenames()
+            + WheelBuilder(self._poetry, self._env, NullIO()).artifact_filenames()
+        )
+
+    def _build_wheel(self, io, dist_dir):  # type: ("IO", Path) -> None
+        WheelBuilder.make_in(
+            self._poetry,
+            self._env,
+            io,
+            dist_dir,
+            file_selector=self._file_selector,
+            jobs=self._jobs,
+        )
+
+    def _build_from_sdist(self):
         # We start by building the tarball
         # We will use it to build the wheel
-        sdist_builder = SdistBuilder(self._poetry, self._env, self._io)
+        sdist_builder = SdistBuilder(
+            self._poetry, self._env, self._io, file_selector=self._file_selector
+        )
         build_for_all_formats = False
         for p in self._package.packages:
             formats = p.get("format", [])
@@ -36,7 +103,11 @@ class CompleteBuilder(Builder):
 
         if build_for_all_formats:
             sdist_builder = SdistBuilder(
-                self._poetry, self._env, NullIO(), ignore_packages_formats=True
+                self._poetry,
+                self._env,
+                NullIO(),
+                ignore_packages_formats=True,
+                file_selector=self._file_selector,
             )
             with temporary_directory() as tmp_dir:
                 sdist_file = sdist_builder.build(Path(tmp_dir))
@@ -48,6 +119,7 @@ class CompleteBuilder(Builder):
                         self._io,
                         dist_dir,
                         original=self._poetry,
+                        jobs=self._jobs,
                     )
         else:
             with self.unpacked_tarball(sdist_file) as tmpdir:
@@ -57,6 +129,7 @@ class CompleteBuilder(Builder):
                     self._io,
                     dist_dir,
                     original=self._poetry,
+                    jobs=self._jobs,
                 )
 
     @classmethod
@@ -17,7 +17,9 @@ class EditableBuilder(Builder):
         return self._setup_build()
 
     def _setup_build(self):
-        builder = SdistBuilder(self._poetry, self._env, self._io)
+        builder = SdistBuilder(
+            self._poetry, self._env, self._io, file_selector=self._file_selector
+        )
         setup = self._path / "setup.py"
         has_setup = setup.exists()
 
@@ -10,12 +10,14 @@ from gzip import GzipFile
 from io import BytesIO
 from posixpath import join as pjoin
 from pprint import pformat
+from typing import List
 
 from poetry.utils._compat import Path
 from poetry.utils._compat import encode
 from poetry.utils._compat import to_str
 
 from ..utils.helpers import normalize_file_permissions
+from ..utils.helpers import source_date_epoch
 from ..utils.package_include import PackageInclude
 from .builder import Builder
 
@@ -55,10 +57,9 @@ class SdistBuilder(Builder):
         if not target_dir.exists():
             target_dir.mkdir(parents=True)
 
-        target = target_dir / "{}-{}.tar.gz".format(
-            self._package.pretty_name, self._meta.version
-        )
-        gz = GzipFile(target.as_posix(), mode="wb")
+        target = target_dir / self.sdist_filename
+        mtime = source_date_epoch()
+        gz = GzipFile(target.as_posix(), mode="wb", mtime=mtime)
         tar = tarfile.TarFile(
             target.as_posix(), mode="w", fileobj=gz, format=tarfile.PAX_FORMAT
         )
@@ -84,14 +85,14 @@ class SdistBuilder(Builder):
             setup = self.build_setup()
             tar_info = tarfile.TarInfo(pjoin(tar_dir, "setup.py"))
             tar_info.size = len(setup)
-            tar_info.mtime = time.time()
+            tar_info.mtime = time.time() if mtime is None else mtime
             tar.addfile(tar_info, BytesIO(setup))
 
             pkg_info = self.build_pkg_info()
 
             tar_info = tarfile.TarInfo(pjoin(tar_dir, "PKG-INFO"))
             tar_info.size = len(pkg_info)
-            tar_info.mtime = time.time()
+            tar_info.mtime = time.time() if mtime is None else mtime
             tar.addfile(tar_info, BytesIO(pkg_info))
         finally:
             tar.close()
@@ -101,6 +102,13 @@ class SdistBuilder(Builder):
 
         return target
 
+    @property
+    def sdist_filename(self):  # type: () -> str
+        return "{}-{}.tar.gz".format(self._package.pretty_name, self._meta.version)
+
+    def artifact_filenames(self):  # type: () -> List[str]
+        return [self.sdist_filename]
+
     def build_setup(self):  # type: () -> bytes
         before, extra, after = [], [], []
         package_dir = {}
@@ -246,9 +254,7 @@ class SdistBuilder(Builder):
                 pkg, from_nearest_pkg = find_nearest_pkg(from_top_level)
 
                 data_elements = [
-                    f.relative_to(self._path)
-                    for f in Path(path).glob("*")
-                    if not f.is_dir()
+                    Path(path, f).relative_to(self._path) for f in sorted(filenames)
                 ]
 
                 data = [e for e in data_elements if not self.is_excluded(e)]
@@ -334,7 +340,7 @@ class SdistBuilder(Builder):
             - Set uid & gid to 0
             - Set uname and gname to ""
             - Normalise permissions to 644 or 755
-            - Set mtime if not None
+            - Set mtime to SOURCE_DATE_EPOCH if set
         """
         ti = copy(tar_info)
         ti.uid = 0
@@ -343,4 +349,8 @@ class SdistBuilder(Builder):
         ti.gname = ""
         ti.mode = normalize_file_permissions(ti.mode)
 
+        mtime = source_date_epoch()
+        if mtime is not None:
+            ti.mtime = mtime
+
         return ti
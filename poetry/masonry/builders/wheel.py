@@ -6,20 +6,25 @@ import os
 import shutil
 import stat
 import tempfile
+import time
 import zipfile
 
 from base64 import urlsafe_b64encode
 from io import StringIO
+from typing import List
+from typing import Tuple
 
 from clikit.api.io.flags import VERY_VERBOSE
 
 from poetry.__version__ import __version__
 from poetry.semver import parse_constraint
+from poetry.utils._compat import Path
 from poetry.utils._compat import decode
 
 from ..utils.helpers import escape_name
 from ..utils.helpers import escape_version
 from ..utils.helpers import normalize_file_permissions
+from ..utils.helpers import source_date_epoch
 from ..utils.package_include import PackageInclude
 from ..utils.tags import get_abbr_impl
 from ..utils.tags import get_abi_tag
@@ -35,13 +40,27 @@ Root-Is-Purelib: {pure_lib}
 Tag: {tag}
 """
 
+# The earliest date a zip archive can hold
+ZIP_EPOCH = 315532800
+
 
 class WheelBuilder(Builder):
 
     format = "wheel"
 
-    def __init__(self, poetry, env, io, target_dir=None, original=None):
-        super(WheelBuilder, self).__init__(poetry, env, io)
+    def __init__(
+        self,
+        poetry,
+        env,
+        io,
+        target_dir=None,
+        original=None,
+        file_selector=None,
+        jobs=None,
+    ):
+        super(WheelBuilder, self).__init__(
+            poetry, env, io, file_selector=file_selector, jobs=jobs
+        )
 
         self._records = []
         self._original_path = self._path
@@ -49,9 +68,31 @@ class WheelBuilder(Builder):
         if original:
             self._original_path = original.file.parent
 
+        self._date_time = None
+        epoch = source_date_epoch()
+        if epoch is not None:
+            self._date_time = time.gmtime(max(epoch, ZIP_EPOCH))[:6]
+
     @classmethod
-    def make_in(cls, poetry, env, io, directory=None, original=None):
-        wb = WheelBuilder(poetry, env, io, target_dir=directory, original=original)
+    def make_in(
+        cls,
+        poetry,
+        env,
+        io,
+        directory=None,
+        original=None,
+        file_selector=None,
+        jobs=None,
+    ):
+        wb = WheelBuilder(
+            poetry,
+            env,
+            io,
+            target_dir=directory,
+            original=original,
+            file_selector=file_selector,
+            jobs=jobs,
+        )
         wb.build()
 
         return wb.wheel_filename
@@ -134,6 +175,7 @@ class WheelBuilder(Builder):
     def _copy_module(self, wheel):
 
         to_add = []
+        seen = set()
 
         for include in self._module.includes:
             if include.formats and "wheel" not in include.formats:
@@ -161,7 +203,7 @@ class WheelBuilder(Builder):
                 if file.suffix == ".pyc":
                     continue
 
-                if (file, rel_file) in to_add:
+                if (file, rel_file) in seen:
                     # Skip duplicates
                     continue
 
@@ -169,11 +211,15 @@ class WheelBuilder(Builder):
                     " - Adding: <comment>{}</comment>".format(str(file)), VERY_VERBOSE
                 )
                 to_add.append((file, rel_file))
+                seen.add((file, rel_file))
 
         # Walk the files and compress them,
         # sorting everything so the order is stable.
-        for full_path, rel_path in sorted(to_add, key=lambda x: x[1]):
-            self._add_file(wheel, full_path, rel_path)
+        # The files are read and hashed ahead in worker threads.
+        to_add = sorted(to_add, key=lambda x: x[1])
+        members = self.map_concurrently(self._read_file, [f for f, _ in to_add])
+        for (_, rel_path), member in zip(to_add, members):
+            self._write_file(wheel, rel_path, *member)
 
     def _write_metadata(self, wheel):
         if (
@@ -213,6 +259,9 @@ class WheelBuilder(Builder):
             self.tag,
         )
 
+    def artifact_filenames(self):  # type: () -> List[str]
+        return [self.wheel_filename]
+
     def supports_python2(self):
         return self._package.python_constraint.allows_any(
             parse_constraint(">=2.0.0 <3.0.0")
@@ -245,37 +294,47 @@ class WheelBuilder(Builder):
         return "-".join(tag)
 
     def _add_file(self, wheel, full_path, rel_path):
-        full_path, rel_path = str(full_path), str(rel_path)
+        self._write_file(wheel, rel_path, *self._read_file(full_path))
+
+    def _read_file(self, full_path):  # type: (Path) -> Tuple[int, bytes, str]
+        """
+        Returns the permission bits, content and hash digest of a file.
+        """
+        full_path = str(full_path)
+
+        st_mode = os.stat(full_path).st_mode
+        with open(full_path, "rb") as src:
+            content = src.read()
+
+        hashsum = hashlib.sha256(content)
+        hash_digest = urlsafe_b64encode(hashsum.digest()).decode("ascii").rstrip("=")
+
+        return st_mode, content, hash_digest
+
+    def _write_file(
+        self, wheel, rel_path, st_mode, content, hash_digest
+    ):  # type: (zipfile.ZipFile, Path, int, bytes, str) -> None
+        rel_path = str(rel_path)
         if os.sep != "/":
             # We always want to have /-separated paths in the zip file and in
             # RECORD
             rel_path = rel_path.replace(os.sep, "/")
 
-        zinfo = zipfile.ZipInfo(rel_path)
+        if self._date_time is None:
+            zinfo = zipfile.ZipInfo(rel_path)
+        else:
+            zinfo = zipfile.ZipInfo(rel_path, self._date_time)
 
         # Normalize permission bits to either 755 (executable) or 644
-        st_mode = os.stat(full_path).st_mode
         new_mode = normalize_file_permissions(st_mode)
         zinfo.external_attr = (new_mode & 0xFFFF) << 16  # Unix attributes
 
         if stat.S_ISDIR(st_mode):
             zinfo.external_attr |= 0x10  # MS-DOS directory flag
 
-        hashsum = hashlib.sha256()
-        with open(full_path, "rb") as src:
-            while True:
-                buf = src.read(1024 * 8)
-                if not buf:
-                    break
-                hashsum.update(buf)
-
-            src.seek(0)
-            wheel.writestr(zinfo, src.read(), compress_type=zipfile.ZIP_DEFLATED)
-
-        size = os.stat(full_path).st_size
-        hash_digest = urlsafe_b64encode(hashsum.digest()).decode("ascii").rstrip("=")
+        wheel.writestr(zinfo, content, compress_type=zipfile.ZIP_DEFLATED)
 
-        self._records.append((rel_path, hash_digest, size))
+        self._records.append((rel_path, hash_digest, len(content)))
 
     @contextlib.contextmanager
     def _write_to_zip(self, wheel, rel_path):
@@ -285,7 +344,7 @@ class WheelBuilder(Builder):
         # The default is a fixed timestamp rather than the current time, so
         # that building a wheel twice on the same computer can automatically
         # give you the exact same result.
-        date_time = (2016, 1, 1, 0, 0, 0)
+        date_time = self._date_time or (2016, 1, 1, 0, 0, 0)
         zi = zipfile.ZipInfo(rel_path, date_time)
         zi.external_attr = (0o644 & 0xFFFF) << 16  # Unix attributes
         b = sio.getvalue().encode("utf-8")
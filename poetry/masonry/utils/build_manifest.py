@@ -0,0 +1,83 @@
+import hashlib
+import json
+
+from typing import Any
+from typing import Dict
+from typing import List
+
+from poetry.utils._compat import Path
+from poetry.utils.helpers import atomic_write
+
+
+class BuildManifest(object):
+    """
+    The record, in the dist/ directory, of the distributions built
+    for each format and of the fingerprint of the inputs they were built from.
+
+    Distributions are up to date as long as the fingerprint is unchanged
+    and they have not been modified or removed since they were built.
+    """
+
+    FILENAME = ".poetry-build.json"
+
+    def __init__(self, dist_dir):  # type: (Path) -> None
+        self._path = dist_dir / self.FILENAME
+
+    @property
+    def path(self):  # type: () -> Path
+        return self._path
+
+    def is_up_to_date(self, fmt, fingerprint):  # type: (str, Dict[str, Any]) -> bool
+        entry = self._read().get(fmt)
+        if not entry or entry.get("fingerprint") != fingerprint:
+            return False
+
+        for name, digest in entry.get("artifacts", {}).items():
+            artifact = self._path.parent / name
+            if not artifact.is_file() or self._hash(artifact) != digest:
+                return False
+
+        return bool(entry.get("artifacts"))
+
+    def artifacts(self, fmt):  # type: (str) -> List[str]
+        return sorted(self._read().get(fmt, {}).get("artifacts", {}))
+
+    def record(
+        self, fmt, fingerprint, artifacts
+    ):  # type: (str, Dict[str, Any], List[Path]) -> None
+        manifest = self._read()
+        manifest[fmt] = {
+            "fingerprint": fingerprint,
+            "artifacts": {
+                artifact.name: self._hash(artifact)
+                for artifact in artifacts
+                if artifact.is_file()
+            },
+        }
+
+        atomic_write(
+            self._path, json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8")
+        )
+
+    def _read(self):  # type: () -> Dict[str, Any]
+        if not self._path.exists():
+            return {}
+
+        try:
+            with self._path.open(encoding="utf-8") as f:
+                manifest = json.load(f)
+        except ValueError:
+            return {}
+
+        if not isinstance(manifest, dict):
+            return {}
+
+        return manifest
+
+    def _hash(self, path):  # type: (Path) -> str
+        h = hashlib.sha256()
+        with path.open("rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 64), b""):
+                h.update(chunk)
+
+        return h.hexdigest()
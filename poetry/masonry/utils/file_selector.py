@@ -0,0 +1,210 @@
+import os
+import re
+
+from fnmatch import translate
+from typing import FrozenSet
+from typing import List
+from typing import Optional
+from typing import Pattern
+from typing import Set
+from typing import Tuple
+from typing import Union
+
+from poetry.utils._compat import Path
+from poetry.utils._compat import glob
+from poetry.vcs import get_vcs
+
+
+_MAGIC_RE = re.compile(r"[*?[]")
+
+_FLAGS = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+
+# A compiled exclude pattern: the regular expressions matching its components,
+# and whether they contain wildcards, None standing for a recursive "**".
+ExcludePattern = Tuple[Optional[Tuple[Pattern, bool]], ...]
+
+# The positions reached in the exclude patterns, as (pattern, component) pairs.
+States = FrozenSet[Tuple[int, int]]
+
+
+class FileSelector(object):
+    """
+    Selects the files of a project excluded from its distributions.
+
+    A file is excluded when it, or one of its parent directories,
+    is ignored by the VCS or matches one of the exclude patterns.
+    The VCS is queried once and the exclude patterns are compiled
+    and evaluated during a single walk of the project,
+    so that a selector can be shared by all the builders of a build.
+    """
+
+    def __init__(self, path, exclude=None):  # type: (Path, Optional[List[str]]) -> None
+        self._path = path
+        self._exclude = exclude or []
+        self._excluded_files = None
+        self._cache = {}
+
+    def find_excluded_files(self):  # type: () -> Set[str]
+        if self._excluded_files is None:
+            # Checking VCS
+            vcs = get_vcs(self._path)
+            if not vcs:
+                vcs_ignored_files = set()
+            else:
+                vcs_ignored_files = set(vcs.get_ignored_files())
+
+            # The list of excluded files might be big and we will do a lot
+            # containment check (x in excluded).
+            # Returning a set make those tests much much faster.
+            self._excluded_files = vcs_ignored_files | self._find_explicitly_excluded()
+
+        return self._excluded_files
+
+    def is_excluded(self, filepath):  # type: (Union[str, Path]) -> bool
+        if not isinstance(filepath, Path):
+            filepath = Path(filepath)
+
+        return self._is_excluded(filepath.as_posix())
+
+    def _is_excluded(self, path):  # type: (str) -> bool
+        excluded = self._cache.get(path)
+        if excluded is None:
+            parent = path.rpartition("/")[0]
+            excluded = path in self.find_excluded_files() or (
+                bool(parent) and self._is_excluded(parent)
+            )
+
+            self._cache[path] = excluded
+
+        return excluded
+
+    def _find_explicitly_excluded(self):  # type: () -> Set[str]
+        excluded = set()
+        patterns = []
+        for excluded_glob in self._exclude:
+            pattern = compile_pattern(excluded_glob)
+            if pattern is not None:
+                patterns.append(pattern)
+                continue
+
+            # Patterns going outside of the project are globbed as is
+            for path in glob(
+                Path(self._path, excluded_glob).as_posix(), recursive=True
+            ):
+                excluded.add(Path(path).relative_to(self._path).as_posix())
+
+        if not patterns:
+            return excluded
+
+        root = self._path.as_posix()
+        states = {root: _closure(patterns, {(i, 0) for i in range(len(patterns))})}
+        if any(position == len(patterns[i]) for i, position in states[root]):
+            excluded.add(".")
+
+        for dirpath, dirnames, filenames in os.walk(root):
+            current = states.pop(dirpath)
+            relative = os.path.relpath(dirpath, root).replace(os.sep, "/")
+            prefix = "" if relative == "." else relative + "/"
+
+            for filename in filenames:
+                if _matches_file(patterns, current, filename):
+                    excluded.add(prefix + filename)
+
+            # Only directories which can still match are walked
+            for dirname in list(dirnames):
+                dir_states = _advance(patterns, current, dirname)
+                if not dir_states:
+                    dirnames.remove(dirname)
+                    continue
+
+                if any(position == len(patterns[i]) for i, position in dir_states):
+                    excluded.add(prefix + dirname)
+
+                states[os.path.join(dirpath, dirname)] = dir_states
+
+        return excluded
+
+
+def compile_pattern(pattern):  # type: (str) -> Optional[ExcludePattern]
+    """
+    Compiles a glob pattern, relative to the project,
+    following the semantics of glob.glob(recursive=True).
+
+    Returns None for absolute patterns or patterns with relative components.
+    """
+    parts = [part for part in pattern.replace("\\", "/").split("/") if part]
+    if not parts or pattern.startswith(("/", "\\")) or ":" in parts[0]:
+        return
+
+    components = []
+    for part in parts:
+        if part in {".", ".."}:
+            return
+
+        if part == "**":
+            components.append(None)
+        elif _MAGIC_RE.search(part):
+            # Wildcards do not match hidden files unless explicitly asked to
+            regex = translate(part)
+            if not part.startswith("."):
+                regex = r"(?!\.)" + regex
+
+            components.append((re.compile(regex, _FLAGS), True))
+        else:
+            components.append((re.compile(re.escape(part) + r"\Z", _FLAGS), False))
+
+    return tuple(components)
+
+
+def _closure(patterns, states):  # type: (List[ExcludePattern], Set) -> States
+    pending = list(states)
+    states = set(states)
+    while pending:
+        i, position = pending.pop()
+        # A "**" component can match no directory at all
+        if position < len(patterns[i]) and patterns[i][position] is None:
+            if (i, position + 1) not in states:
+                states.add((i, position + 1))
+                pending.append((i, position + 1))
+
+    return frozenset(states)
+
+
+def _advance(
+    patterns, states, name
+):  # type: (List[ExcludePattern], States, str) -> States
+    advanced = set()
+    for i, position in states:
+        if position == len(patterns[i]):
+            continue
+
+        component = patterns[i][position]
+        if component is None:
+            if not name.startswith("."):
+                advanced.add((i, position))
+        elif component[0].match(name):
+            advanced.add((i, position + 1))
+
+    return _closure(patterns, advanced)
+
+
+def _matches_file(
+    patterns, states, name
+):  # type: (List[ExcludePattern], States, str) -> bool
+    for i, position in states:
+        pattern = patterns[i]
+        if position == len(pattern):
+            continue
+
+        component = pattern[position]
+        if component is None:
+            if not name.startswith(".") and all(c is None for c in pattern[position:]):
+                return True
+        elif component[0].match(name):
+            rest = pattern[position + 1 :]
+            # Like glob, a wildcard followed by "**" components
+            # only matches directories
+            if not rest or (not component[1] and all(c is None for c in rest)):
+                return True
+
+    return False
@@ -1,5 +1,8 @@
+import os
 import re
 
+from typing import Optional
+
 
 def normalize_file_permissions(st_mode):
     """
@@ -29,3 +32,16 @@ def escape_version(version):
 def escape_name(name):
     """Escaped wheel name as specified in :pep:`427#escaping-and-unicode`."""
     return re.sub(r"[^\w\d.]+", "_", name, flags=re.UNICODE)
+
+
+def source_date_epoch():  # type: () -> Optional[int]
+    """
+    The timestamp to give to the members of distributions, if any,
+    following the SOURCE_DATE_EPOCH specification of reproducible builds:
+    https://reproducible-builds.org/specs/source-date-epoch/
+    """
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if not epoch:
+        return
+
+    return int(epoch)
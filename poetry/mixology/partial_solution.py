@@ -1,6 +1,7 @@
 from collections import OrderedDict
 from typing import Dict
 from typing import List
+from typing import Optional
 
 from poetry.packages import Dependency
 from poetry.packages import Package
@@ -25,6 +26,17 @@ class PartialSolution:
         # assigned.
         self._assignments = []  # type: List[Assignment]
 
+        # The assignments that have been made so far for each package,
+        # in the order they were assigned.
+        self._assignments_by_package = {}  # type: Dict[str, List[Assignment]]
+
+        # The intersection of each package's assignments up to
+        # and including the assignment at the same index
+        # in _assignments_by_package.
+        #
+        # This is derived from self._assignments.
+        self._intersections = {}  # type: Dict[str, List[Term]]
+
         # The decisions made for each package.
         self._decisions = OrderedDict()  # type: Dict[str, Package]
 
@@ -120,11 +132,17 @@ class PartialSolution:
         packages = set()
         while self._assignments[-1].decision_level > decision_level:
             removed = self._assignments.pop(-1)
-            packages.add(removed.dependency.name)
+            name = removed.dependency.name
+            packages.add(name)
+
+            self._assignments_by_package[name].pop(-1)
+            self._intersections[name].pop(-1)
+
             if removed.is_decision():
-                del self._decisions[removed.dependency.name]
+                del self._decisions[name]
 
-        # Re-compute _positive and _negative for the packages that were removed.
+        # Re-compute _positive and _negative for the packages that were removed
+        # from the intersections of their remaining assignments.
         for package in packages:
             if package in self._positive:
                 del self._positive[package]
@@ -132,72 +150,101 @@ class PartialSolution:
             if package in self._negative:
                 del self._negative[package]
 
-        for assignment in self._assignments:
-            if assignment.dependency.name in packages:
-                self._register(assignment)
+            if not self._intersections[package]:
+                del self._assignments_by_package[package]
+                del self._intersections[package]
+
+        # Packages are restored in the order in which they were first
+        # positively assigned to keep the order of _positive stable.
+        for package in sorted(
+            (package for package in packages if package in self._intersections),
+            key=self._positive_index,
+        ):
+            self._set_term(package, self._intersections[package][-1])
+
+    def _positive_index(self, package):  # type: (str) -> int
+        """
+        Returns the index of the first assignment of package
+        from which its intersection is positive.
+        """
+        assignments = self._assignments_by_package[package]
+        for assignment, intersection in zip(assignments, self._intersections[package]):
+            if intersection.is_positive():
+                return assignment.index
+
+        return len(self._assignments)
 
     def _register(self, assignment):  # type: (Assignment) -> None
         """
         Registers an Assignment in _positive or _negative.
         """
         name = assignment.dependency.name
-        old_positive = self._positive.get(name)
-        if old_positive is not None:
-            self._positive[name] = old_positive.intersect(assignment)
+        assignments = self._assignments_by_package.get(name)
+        if assignments is None:
+            assignments = self._assignments_by_package[name] = []
+            self._intersections[name] = []
 
-            return
-
-        ref = assignment.dependency.name
-        negative_by_ref = self._negative.get(name)
-        old_negative = None if negative_by_ref is None else negative_by_ref.get(ref)
-        if old_negative is None:
+        intersections = self._intersections[name]
+        if not intersections:
             term = assignment
+        elif intersections[-1].is_positive():
+            term = intersections[-1].intersect(assignment)
         else:
-            term = assignment.intersect(old_negative)
+            term = assignment.intersect(intersections[-1])
+            if term is not None and term is not assignment and term.is_positive():
+                # The negative term only narrows the constraint of the assignment
+                # so its extras, source and prerelease flags are kept
+                term = Term(
+                    assignment.dependency.with_constraint(term.constraint), True
+                )
+
+        assignments.append(assignment)
+        intersections.append(term)
+
+        self._set_term(name, term)
 
+    def _set_term(self, name, term):  # type: (str, Term) -> None
         if term.is_positive():
             if name in self._negative:
                 del self._negative[name]
 
             self._positive[name] = term
         else:
-            if name not in self._negative:
-                self._negative[name] = {}
-
-            self._negative[name][ref] = term
+            self._negative[name] = {name: term}
 
     def satisfier(self, term):  # type: (Term) -> Assignment
         """
         Returns the first Assignment in this solution such that the sublist of
         assignments up to and including that entry collectively satisfies term.
         """
-        assigned_term = None  # type: Term
-
-        for assignment in self._assignments:
-            if assignment.dependency.name != term.dependency.name:
-                continue
+        name = term.dependency.name
+        assignments = self._assignments_by_package.get(name, [])
+        intersections = self._intersections.get(name, [])
 
-            if (
-                not assignment.dependency.is_root
-                and not assignment.dependency.name == term.dependency.name
-            ):
-                if not assignment.is_positive():
-                    continue
+        for assignment, intersection in zip(assignments, intersections):
+            # As soon as we have enough assignments to satisfy term, return them.
+            if intersection.satisfies(term):
+                return assignment
 
-                assert not term.is_positive()
+        raise RuntimeError("[BUG] {} is not satisfied.".format(term))
 
-                return assignment
+    def last_assignment(self, package):  # type: (str) -> Optional[Assignment]
+        """
+        Returns the most recent Assignment for package, if any.
+        """
+        assignments = self._assignments_by_package.get(package)
+        if not assignments:
+            return
 
-            if assigned_term is None:
-                assigned_term = assignment
-            else:
-                assigned_term = assigned_term.intersect(assignment)
+        return assignments[-1]
 
-            # As soon as we have enough assignments to satisfy term, return them.
-            if assigned_term.satisfies(term):
-                return assignment
+    def contains(self, assignment):  # type: (Assignment) -> bool
+        """
+        Returns whether assignment has not been removed by backtracking.
+        """
+        index = assignment.index
 
-        raise RuntimeError("[BUG] {} is not satisfied.".format(term))
+        return index < len(self._assignments) and self._assignments[index] is assignment
 
     def satisfies(self, term):  # type: (Term) -> bool
         return self.relation(term) == SetRelation.SUBSET
@@ -13,6 +13,7 @@ from poetry.puzzle.provider import Provider
 from poetry.semver import Version
 from poetry.semver import VersionRange
 
+from .assignment import Assignment
 from .failure import SolveFailure
 from .incompatibility import Incompatibility
 from .incompatibility_cause import ConflictCause
@@ -54,6 +55,23 @@ class VersionSolver:
         self._use_latest = use_latest
 
         self._incompatibilities = {}  # type: Dict[str, List[Incompatibility]]
+
+        # Two terms of each incompatibility with more than two terms
+        # which are not satisfied by _solution, if possible.
+        #
+        # As long as two of its terms are not satisfied,
+        # an incompatibility cannot be almost satisfied, so it only needs
+        # to be examined when the package of a watched term changes.
+        self._watched = {}  # type: Dict[Incompatibility, List[Term]]
+
+        # The assignment which made a term of each incompatibility
+        # contradicted by _solution when it was last examined.
+        #
+        # Assignments only narrow the versions allowed for a package
+        # so, as long as this assignment has not been backtracked,
+        # the term stays contradicted and there is nothing to deduce
+        # from the incompatibility.
+        self._blockers = {}  # type: Dict[Incompatibility, Assignment]
         self._solution = PartialSolution()
 
     @property
@@ -83,6 +101,7 @@ class VersionSolver:
         except Exception:
             raise
         finally:
+            self._provider.cancel_prefetches()
             self._log(
                 "Version solving took {:.3f} seconds.\n"
                 "Tried {} solutions.".format(
@@ -106,6 +125,12 @@ class VersionSolver:
             # we can derive stronger assignments sooner and more eagerly find
             # conflicts.
             for incompatibility in reversed(self._incompatibilities[package]):
+                watched = self._watched.get(incompatibility)
+                if watched is not None and all(
+                    term.dependency.name != package for term in watched
+                ):
+                    continue
+
                 result = self._propagate_incompatibility(incompatibility)
 
                 if result is _conflict:
@@ -140,6 +165,28 @@ class VersionSolver:
 
         Otherwise, returns None.
         """
+        blocker = self._blockers.get(incompatibility)
+        if blocker is not None and self._solution.contains(blocker):
+            return
+
+        watched = self._watched.get(incompatibility)
+        if watched is not None:
+            relations = [self._solution.relation(term) for term in watched]
+            if SetRelation.DISJOINT in relations:
+                self._block(
+                    incompatibility, watched[relations.index(SetRelation.DISJOINT)]
+                )
+
+                return
+
+            if SetRelation.SUBSET not in relations:
+                return
+
+            # One of the watched terms is now satisfied, so we look for
+            # another one that isn't.
+            if self._watch(incompatibility) > 1:
+                return
+
         # The first entry in incompatibility.terms that's not yet satisfied by
         # _solution, if one exists. If we find more than one, _solution is
         # inconclusive for incompatibility and we can't deduce anything.
@@ -152,6 +199,8 @@ class VersionSolver:
                 # If term is already contradicted by _solution, then
                 # incompatibility is contradicted as well and there's nothing new we
                 # can deduce from it.
+                self._block(incompatibility, term)
+
                 return
             elif relation == SetRelation.OVERLAPPING:
                 # If more than one term is inconclusive, we can't deduce anything about
@@ -394,6 +443,12 @@ class VersionSolver:
                 ]
             )
 
+            # Start retrieving the metadata of the dependencies
+            # while the solver is busy propagating this decision.
+            for term in incompatibility.terms:
+                if term.dependency.name != dependency.name:
+                    self._prefetch(term.dependency)
+
         if not conflict:
             self._solution.decide(version)
             self._log(
@@ -420,15 +475,56 @@ class VersionSolver:
     def _add_incompatibility(self, incompatibility):  # type: (Incompatibility) -> None
         self._log("fact: {}".format(incompatibility))
 
+        # Incompatibilities never have more than one term for a given package.
         for term in incompatibility.terms:
             if term.dependency.name not in self._incompatibilities:
                 self._incompatibilities[term.dependency.name] = []
 
-            if incompatibility in self._incompatibilities[term.dependency.name]:
-                continue
-
             self._incompatibilities[term.dependency.name].append(incompatibility)
 
+        if len(incompatibility.terms) > 2:
+            self._watch(incompatibility)
+
+    def _block(self, incompatibility, term):  # type: (Incompatibility, Term) -> None
+        self._blockers[incompatibility] = self._solution.last_assignment(
+            term.dependency.name
+        )
+
+    def _watch(self, incompatibility):  # type: (Incompatibility) -> int
+        """
+        Chooses the two terms of incompatibility to watch
+        and returns the number of its terms not satisfied by _solution.
+        """
+        satisfied = []
+        unsatisfied = []
+        for term in incompatibility.terms:
+            if self._solution.relation(term) == SetRelation.SUBSET:
+                satisfied.append(term)
+            else:
+                unsatisfied.append(term)
+
+        watched = unsatisfied[:2]
+        if len(watched) < 2:
+            # Watching the terms that were satisfied last
+            # since backtracking makes them unsatisfied first.
+            satisfied.sort(
+                key=lambda term: self._solution.satisfier(term).index, reverse=True
+            )
+            watched += satisfied[: 2 - len(watched)]
+
+        self._watched[incompatibility] = watched
+
+        return len(unsatisfied)
+
+    def _prefetch(self, dependency):  # type: (Dependency) -> None
+        locked = None
+        if dependency.name not in self._use_latest:
+            locked = self._locked.get(dependency.name)
+            if locked is not None and not dependency.constraint.allows(locked.version):
+                locked = None
+
+        self._provider.prefetch(dependency, locked=locked)
+
     def _get_locked(self, dependency):  # type: (Dependency) -> Union[Package, None]
         if dependency.name in self._use_latest:
             return
@@ -314,6 +314,7 @@ class Dependency(object):
             optional=self.is_optional(),
             category=self.category,
             allows_prereleases=self.allows_prereleases(),
+            source_name=self.source_name,
         )
 
         new.is_root = self.is_root
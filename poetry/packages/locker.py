@@ -7,6 +7,7 @@ from typing import List
 from tomlkit import document
 from tomlkit import inline_table
 from tomlkit import item
+from tomlkit import parse
 from tomlkit import table
 from tomlkit.exceptions import TOMLKitError
 
@@ -15,6 +16,8 @@ import poetry.repositories
 
 from poetry.utils._compat import Path
 from poetry.utils.toml_file import TomlFile
+from poetry.utils.toml_reader import TOMLReaderError
+from poetry.utils.toml_reader import loads
 from poetry.version.markers import parse_marker
 
 
@@ -52,11 +55,10 @@ class Locker(object):
         """
         Checks whether the lock file is still up to date with the current hash.
         """
-        lock = self._lock.read()
-        metadata = lock.get("metadata", {})
+        metadata = self.lock_data.get("metadata", {})
 
         if "content-hash" in metadata:
-            return self._content_hash == lock["metadata"]["content-hash"]
+            return self._content_hash == metadata["content-hash"]
 
         return False
 
@@ -196,7 +198,7 @@ class Locker(object):
         self.lock.write(data)
 
         # Checking lock file data consistency
-        if data != self.lock.read():
+        if data != self._read_lock_data():
             raise RuntimeError("Inconsistent lock file data.")
 
         self._lock_data = None
@@ -221,8 +223,27 @@ class Locker(object):
         if not self._lock.exists():
             raise RuntimeError("No lockfile found. Unable to read locked packages")
 
+        return self._read_lock_data()
+
+    def _read_lock_data(self):  # type: () -> dict
+        """
+        Reads the lock file into plain values.
+
+        The lock file only being read here, it is not loaded
+        as a tomlkit document, which keeps track of its style
+        and is slow to build. tomlkit is only used for the files
+        using TOML features the fast reader does not support.
+        """
+        with self._lock.open(encoding="utf-8") as f:
+            content = f.read()
+
+        try:
+            return loads(content)
+        except TOMLReaderError:
+            pass
+
         try:
-            return self._lock.read()
+            return parse(content)
         except TOMLKitError as e:
             raise RuntimeError("Unable to read the lock file ({}).".format(e))
 
@@ -0,0 +1,65 @@
+import copy
+import threading
+
+from concurrent.futures import Future
+from typing import Any
+from typing import Callable
+from typing import List
+
+from poetry.packages import Package
+
+
+class MetadataCache(object):
+    """
+    A thread-safe cache of the metadata retrieved from the repositories,
+    shared by the providers of resolutions running concurrently.
+
+    Concurrent requests for the same key wait for the first one to complete
+    instead of retrieving the metadata again. Failures are not cached.
+
+    Cached values must be treated as read-only: the packages handed out
+    are copies the caller is free to modify.
+    """
+
+    def __init__(self):  # type: () -> None
+        self._lock = threading.Lock()
+        self._futures = {}
+
+    def find_packages(
+        self, key, factory
+    ):  # type: (tuple, Callable[[], List[Package]]) -> List[Package]
+        return [
+            self._copy(package)
+            for package in self._get(("find_packages",) + key, factory)
+        ]
+
+    def package(self, key, factory):  # type: (tuple, Callable[[], Package]) -> Package
+        return self._copy(self._get(("package",) + key, factory))
+
+    def _copy(self, package):  # type: (Package) -> Package
+        package = copy.copy(package)
+        package.requires = [copy.copy(dep) for dep in package.requires]
+
+        return package
+
+    def _get(self, key, factory):  # type: (tuple, Callable[[], Any]) -> Any
+        with self._lock:
+            future = self._futures.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._futures[key] = future
+
+        if owner:
+            try:
+                future.set_result(factory())
+            except Exception as e:
+                with self._lock:
+                    del self._futures[key]
+
+                future.set_exception(e)
+
+        return future.result()
+
+    def __len__(self):  # type: () -> int
+        return len(self._futures)
@@ -4,8 +4,11 @@ from typing import Union
 
 
 class Operation(object):
-    def __init__(self, reason=None):  # type: (Union[str, None]) -> None
+    def __init__(
+        self, reason=None, priority=0
+    ):  # type: (Union[str, None], float) -> None
         self._reason = reason
+        self._priority = priority
 
         self._skipped = False
         self._skip_reason = None
@@ -18,6 +21,14 @@ class Operation(object):
     def reason(self):  # type: () -> str
         return self._reason
 
+    @property
+    def priority(self):  # type: () -> float
+        """
+        Operations with a higher priority must be executed first.
+        Operations with the same priority can be executed in any order.
+        """
+        return self._priority
+
     @property
     def skipped(self):  # type: () -> bool
         return self._skipped
@@ -0,0 +1,95 @@
+import hashlib
+import json
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+
+from poetry.locations import CACHE_DIR
+from poetry.utils._compat import Path
+from poetry.utils.helpers import atomic_write
+from poetry.utils.helpers import interpreter_tag
+
+
+class PathMetadataCache(object):
+    """
+    A persistent cache of the metadata of directory and file dependencies.
+
+    Metadata is stored under a digest of the files it is derived from:
+    the setup.py, setup.cfg and pyproject.toml files of a directory,
+    along with the interpreter running them, or the bytes of an archive,
+    so that it is only retrieved again once those change.
+    """
+
+    # The files of a directory the metadata of a project is derived from
+    PROJECT_FILES = ("setup.py", "setup.cfg", "pyproject.toml")
+
+    def __init__(self, cache_dir=None):  # type: (Optional[Path]) -> None
+        if cache_dir is None:
+            cache_dir = Path(CACHE_DIR) / "cache" / "paths"
+
+        self._cache_dir = Path(cache_dir)
+
+    @property
+    def cache_dir(self):  # type: () -> Path
+        return self._cache_dir
+
+    def directory_metadata(
+        self, directory, factory
+    ):  # type: (Path, Callable[[], Dict[str, Any]]) -> Dict[str, Any]
+        """
+        Return the metadata of the project in the given directory,
+        retrieving it with the given factory if it is not cached.
+        """
+        h = hashlib.sha256()
+        # The metadata is retrieved by running setup.py
+        # so it depends on the interpreter
+        h.update(interpreter_tag().encode("utf-8") + b"\0")
+        h.update(directory.resolve().as_posix().encode("utf-8"))
+        for name in self.PROJECT_FILES:
+            path = directory / name
+            h.update(b"\0" + name.encode("utf-8") + b"\0")
+            if path.is_file():
+                h.update(path.read_bytes())
+            else:
+                h.update(b"\0")
+
+        return self._get("directories", h.hexdigest(), factory)
+
+    def file_metadata(
+        self, path, factory
+    ):  # type: (Path, Callable[[], Dict[str, Any]]) -> Dict[str, Any]
+        """
+        Return the metadata of the given archive,
+        retrieving it with the given factory if it is not cached.
+        """
+        h = hashlib.sha256()
+        with path.open("rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 64), b""):
+                h.update(chunk)
+
+        return self._get("files", h.hexdigest(), factory)
+
+    def _get(
+        self, kind, digest, factory
+    ):  # type: (str, str, Callable[[], Dict[str, Any]]) -> Dict[str, Any]
+        path = self._cache_dir / kind / digest[:2] / (digest + ".json")
+        if path.exists():
+            try:
+                with path.open(encoding="utf-8") as f:
+                    return json.load(f)
+            except ValueError:
+                # Corrupted entries are retrieved again
+                pass
+
+        metadata = factory()
+        self._store(path, metadata)
+
+        return metadata
+
+    def _store(self, path, metadata):  # type: (Path, Dict[str, Any]) -> None
+        if not path.parent.exists():
+            path.parent.mkdir(parents=True)
+
+        atomic_write(path, json.dumps(metadata, sort_keys=True).encode("utf-8"))
@@ -2,13 +2,17 @@ import glob
 import logging
 import os
 import re
+import threading
 import time
 
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from tempfile import mkdtemp
 from typing import Any
+from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 import pkginfo
 
@@ -42,10 +46,12 @@ from poetry.utils.helpers import temporary_directory
 from poetry.utils.inspector import Inspector
 from poetry.utils.setup_reader import SetupReader
 from poetry.utils.toml_file import TomlFile
-from poetry.vcs.git import Git
+from poetry.vcs.git_cache import GitCache
 from poetry.version.markers import MarkerUnion
 
 from .exceptions import CompatibilityError
+from .metadata_cache import MetadataCache
+from .path_metadata_cache import PathMetadataCache
 
 
 logger = logging.getLogger(__name__)
@@ -62,20 +68,39 @@ class Provider:
 
     UNSAFE_PACKAGES = {"setuptools", "distribute", "pip"}
 
-    def __init__(self, package, pool, io):  # type: (Package, Pool, Any) -> None
+    # The maximum number of metadata requests running in the background
+    PREFETCH_MAX_WORKERS = 8
+
+    # Inspecting VCS, file, directory and URL dependencies builds
+    # or runs code in subprocesses sharing the state of the process,
+    # so these inspections never run concurrently, even across resolutions
+    _inspections_lock = threading.Lock()
+
+    def __init__(
+        self, package, pool, io, metadata_cache=None
+    ):  # type: (Package, Pool, Any, Optional[MetadataCache]) -> None
         self._package = package
         self._pool = pool
         self._io = io
+        self._metadata_cache = metadata_cache
         self._inspector = Inspector()
         self._python_constraint = package.python_constraint
         self._search_for = {}
         self._is_debugging = self._io.is_debug() or self._io.is_very_verbose()
         self._in_progress = False
+        self._prefetch_executor = None  # type: Optional[ThreadPoolExecutor]
+        self._prefetches = {}  # type: Dict[str, Tuple[Dependency, Any]]
+        self._prefetched = set()
+        self._prefetched_packages = {}  # type: Dict[str, Tuple[tuple, Package]]
 
     @property
     def pool(self):  # type: () -> Pool
         return self._pool
 
+    @property
+    def metadata_cache(self):  # type: () -> Optional[MetadataCache]
+        return self._metadata_cache
+
     @property
     def name_for_explicit_dependency_source(self):  # type: () -> str
         return "pyproject.toml"
@@ -126,35 +151,179 @@ class Provider:
                 return PackageCollection(dependency, packages)
 
         if dependency.is_vcs():
-            packages = self.search_for_vcs(dependency)
+            with self._inspections_lock:
+                packages = self.search_for_vcs(dependency)
         elif dependency.is_file():
-            packages = self.search_for_file(dependency)
+            with self._inspections_lock:
+                packages = self.search_for_file(dependency)
         elif dependency.is_directory():
-            packages = self.search_for_directory(dependency)
+            with self._inspections_lock:
+                packages = self.search_for_directory(dependency)
         elif dependency.is_url():
-            packages = self.search_for_url(dependency)
+            with self._inspections_lock:
+                packages = self.search_for_url(dependency)
         else:
-            constraint = dependency.constraint
+            packages = self._wait_for_prefetch(dependency)
+            if packages is None:
+                packages = self._find_packages(dependency)
+
+        self._search_for[dependency] = packages
+
+        return PackageCollection(dependency, packages)
 
-            packages = self._pool.find_packages(
+    def _find_packages(self, dependency):  # type: (Dependency) -> List[Package]
+        def find_packages():
+            return self._pool.find_packages(
                 dependency.name,
-                constraint,
+                dependency.constraint,
                 extras=dependency.extras,
                 allow_prereleases=dependency.allows_prereleases(),
                 repository=dependency.source_name,
             )
 
-            packages.sort(
-                key=lambda p: (
-                    not p.is_prerelease() and not dependency.allows_prereleases(),
-                    p.version,
+        if self._metadata_cache is None:
+            packages = find_packages()
+        else:
+            packages = self._metadata_cache.find_packages(
+                (
+                    dependency.name,
+                    str(dependency.constraint),
+                    tuple(dependency.extras),
+                    dependency.allows_prereleases(),
+                    dependency.source_name,
                 ),
-                reverse=True,
+                find_packages,
             )
 
-        self._search_for[dependency] = packages
+        packages.sort(
+            key=lambda p: (
+                not p.is_prerelease() and not dependency.allows_prereleases(),
+                p.version,
+            ),
+            reverse=True,
+        )
 
-        return PackageCollection(dependency, packages)
+        return packages
+
+    def prefetch(
+        self, dependency, locked=None
+    ):  # type: (Dependency, Optional[Package]) -> None
+        """
+        Starts retrieving, in the background, the packages matching
+        the given dependency along with the metadata of the version
+        most likely to be selected (the locked one if any).
+
+        Only the first dependency seen for a given name is prefetched.
+        Errors are swallowed here: they will be raised again when the
+        solver actually requests the information.
+        """
+        if (
+            dependency.is_root
+            or dependency.is_vcs()
+            or dependency.is_file()
+            or dependency.is_directory()
+            or dependency.is_url()
+            or dependency.name in self._prefetched
+        ):
+            return
+
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(
+                max_workers=self.PREFETCH_MAX_WORKERS
+            )
+
+        self._prefetched.add(dependency.name)
+        self._prefetches[dependency.name] = (
+            dependency,
+            self._prefetch_executor.submit(self._prefetch, dependency, locked),
+        )
+
+    def cancel_prefetches(self):  # type: () -> None
+        """
+        Cancels the prefetches that have not started yet
+        and discards the ones that have not been used.
+        """
+        for _, future in self._prefetches.values():
+            future.cancel()
+
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=False)
+            self._prefetch_executor = None
+
+        self._prefetches = {}
+        self._prefetched = set()
+        self._prefetched_packages = {}
+
+    def _prefetch(
+        self, dependency, locked=None
+    ):  # type: (Dependency, Optional[Package]) -> Tuple[List[Package], Optional[Package]]
+        packages = self._find_packages(dependency)
+
+        if locked is not None:
+            version = locked.version
+        elif packages:
+            version = packages[0].version
+        else:
+            return packages, None
+
+        try:
+            package = self._get_package(
+                dependency.name,
+                version.text,
+                extras=dependency.extras,
+                repository=dependency.source_name,
+            )
+        except Exception:
+            package = None
+
+        return packages, package
+
+    def _get_package(
+        self, name, version, extras=None, repository=None
+    ):  # type: (str, str, Optional[List[str]], Optional[str]) -> Package
+        def package():
+            return self._pool.package(
+                name, version, extras=extras, repository=repository
+            )
+
+        if self._metadata_cache is None:
+            return package()
+
+        return self._metadata_cache.package(
+            (name, version, tuple(extras or []), repository), package
+        )
+
+    def _wait_for_prefetch(
+        self, dependency
+    ):  # type: (Dependency) -> Optional[List[Package]]
+        """
+        Waits for the prefetch of the given dependency name, if any.
+
+        Returns the packages found if the prefetched dependency
+        is the one requested, None otherwise.
+        """
+        prefetched = self._prefetches.pop(dependency.name, None)
+        if prefetched is None:
+            return
+
+        prefetched_dependency, future = prefetched
+        try:
+            packages, package = future.result()
+        except Exception:
+            return
+
+        if package is not None:
+            key = (
+                package.version.text,
+                tuple(prefetched_dependency.extras),
+                prefetched_dependency.source_name,
+            )
+            self._prefetched_packages[package.name] = (key, package)
+
+        if prefetched_dependency != dependency:
+            return
+
+        return packages
 
     def search_for_vcs(self, dependency):  # type: (VCSDependency) -> List[Package]
         """
@@ -186,29 +355,37 @@ class Provider:
         if vcs != "git":
             raise ValueError("Unsupported VCS dependency {}".format(vcs))
 
-        tmp_dir = Path(
-            mkdtemp(prefix="pypoetry-git-{}".format(url.split("/")[-1].rstrip(".git")))
-        )
+        cache = GitCache()
+        revision = cache.revision(url, reference)
 
-        try:
-            git = Git()
-            git.clone(url, tmp_dir)
-            if reference is not None:
-                git.checkout(reference, tmp_dir)
-            else:
-                reference = "HEAD"
+        package = None
+        metadata = cache.metadata(url, revision)
+        if metadata is None:
+            tmp_dir = Path(
+                mkdtemp(
+                    prefix="pypoetry-git-{}".format(url.split("/")[-1].rstrip(".git"))
+                )
+            )
 
-            revision = git.rev_parse(reference, tmp_dir).strip()
+            try:
+                cache.export(url, reference, tmp_dir)
 
-            package = cls.get_package_from_directory(tmp_dir, name=name)
+                if cls.is_poetry_project(tmp_dir):
+                    package = cls.get_package_from_directory(tmp_dir, name=name)
+                else:
+                    # Retrieving the metadata of non-Poetry projects is costly
+                    # so it is cached for the next resolutions
+                    metadata = cls.get_setup_metadata(tmp_dir)
+                    cache.store_metadata(url, revision, metadata)
+            finally:
+                safe_rmtree(str(tmp_dir))
 
-            package.source_type = "git"
-            package.source_url = url
-            package.source_reference = revision
-        except Exception:
-            raise
-        finally:
-            safe_rmtree(str(tmp_dir))
+        if package is None:
+            package = cls.get_package_from_setup_metadata(metadata, name=name)
+
+        package.source_type = "git"
+        package.source_url = url
+        package.source_reference = revision
 
         return package
 
@@ -239,7 +416,9 @@ class Provider:
 
     @classmethod
     def get_package_from_file(cls, file_path):  # type: (Path) -> Package
-        info = Inspector().inspect(file_path)
+        info = PathMetadataCache().file_metadata(
+            file_path, lambda: Inspector().inspect(file_path)
+        )
         if not info["name"]:
             raise RuntimeError(
                 "Unable to determine the package name of {}".format(file_path)
@@ -288,20 +467,21 @@ class Provider:
 
         return [package]
 
+    @classmethod
+    def is_poetry_project(cls, directory):  # type: (Path) -> bool
+        pyproject = directory.joinpath("pyproject.toml")
+        if not pyproject.exists():
+            return False
+
+        pyproject_content = TomlFile(pyproject).read()
+
+        return "tool" in pyproject_content and "poetry" in pyproject_content["tool"]
+
     @classmethod
     def get_package_from_directory(
         cls, directory, name=None
     ):  # type: (Path, Optional[str]) -> Package
-        supports_poetry = False
-        pyproject = directory.joinpath("pyproject.toml")
-        if pyproject.exists():
-            pyproject = TomlFile(pyproject)
-            pyproject_content = pyproject.read()
-            supports_poetry = (
-                "tool" in pyproject_content and "poetry" in pyproject_content["tool"]
-            )
-
-        if supports_poetry:
+        if cls.is_poetry_project(directory):
             poetry = Factory().create_poetry(directory)
 
             pkg = poetry.package
@@ -319,108 +499,138 @@ class Provider:
                     package.extras[extra].append(dep)
 
             package.python_versions = pkg.python_versions
-        else:
-            # Execute egg_info
-            current_dir = os.getcwd()
-            os.chdir(str(directory))
 
-            try:
-                with temporary_directory() as tmp_dir:
-                    EnvManager.build_venv(tmp_dir)
-                    venv = VirtualEnv(Path(tmp_dir), Path(tmp_dir))
-                    venv.run("python", "setup.py", "egg_info")
-            except EnvCommandError:
-                result = SetupReader.read_from_directory(directory)
-                if not result["name"]:
-                    # The name could not be determined
-                    # We use the dependency name
-                    result["name"] = name
-
-                if not result["version"]:
-                    # The version could not be determined
-                    # so we raise an error since it is mandatory
-                    raise RuntimeError(
-                        "Unable to retrieve the package version for {}".format(
-                            directory
-                        )
+            if name and name != package.name:
+                # For now, the dependency's name must match the actual package's name
+                raise RuntimeError(
+                    "The dependency name for {} does not match the actual package's name: {}".format(
+                        name, package.name
                     )
+                )
+        else:
+            metadata = PathMetadataCache().directory_metadata(
+                directory, lambda: cls.get_setup_metadata(directory)
+            )
+            package = cls.get_package_from_setup_metadata(metadata, name=name)
 
-                package_name = result["name"]
-                package_version = result["version"]
-                python_requires = result["python_requires"]
-                if python_requires is None:
-                    python_requires = "*"
+        package.source_type = "directory"
+        package.source_url = directory.as_posix()
 
-                package_summary = ""
+        return package
 
-                requires = ""
-                for dep in result["install_requires"]:
-                    requires += dep + "\n"
+    @classmethod
+    def get_setup_metadata(cls, directory):  # type: (Path) -> Dict[str, Any]
+        """
+        Retrieves the metadata of a project using setuptools.
 
-                if result["extras_require"]:
-                    requires += "\n"
+        The returned metadata is JSON serializable and the name
+        of the project is None if it could not be determined.
+        """
+        # Execute egg_info, in the directory of the project
+        # without changing the working directory of the whole process
+        try:
+            with temporary_directory() as tmp_dir:
+                EnvManager.build_venv(tmp_dir)
+                venv = VirtualEnv(Path(tmp_dir), Path(tmp_dir))
+                venv.run("python", "setup.py", "egg_info", cwd=str(directory))
+        except EnvCommandError:
+            result = SetupReader.read_from_directory(directory)
+            if not result["version"]:
+                # The version could not be determined
+                # so we raise an error since it is mandatory
+                raise RuntimeError(
+                    "Unable to retrieve the package version for {}".format(directory)
+                )
 
-                for extra_name, deps in result["extras_require"].items():
-                    requires += "[{}]\n".format(extra_name)
+            package_name = result["name"]
+            package_version = result["version"]
+            python_requires = result["python_requires"]
+            if python_requires is None:
+                python_requires = "*"
 
-                    for dep in deps:
-                        requires += dep + "\n"
+            package_summary = ""
 
-                    requires += "\n"
+            requires = ""
+            for dep in result["install_requires"]:
+                requires += dep + "\n"
 
-                reqs = parse_requires(requires)
-            else:
-                os.chdir(current_dir)
-                # Sometimes pathlib will fail on recursive
-                # symbolic links, so we need to workaround it
-                # and use the glob module instead.
-                # Note that this does not happen with pathlib2
-                # so it's safe to use it for Python < 3.4.
-                if PY35:
-                    egg_info = next(
-                        Path(p)
-                        for p in glob.glob(
-                            os.path.join(str(directory), "**", "*.egg-info"),
-                            recursive=True,
-                        )
+            if result["extras_require"]:
+                requires += "\n"
+
+            for extra_name, deps in result["extras_require"].items():
+                requires += "[{}]\n".format(extra_name)
+
+                for dep in deps:
+                    requires += dep + "\n"
+
+                requires += "\n"
+
+            reqs = parse_requires(requires)
+        else:
+            # Sometimes pathlib will fail on recursive
+            # symbolic links, so we need to workaround it
+            # and use the glob module instead.
+            # Note that this does not happen with pathlib2
+            # so it's safe to use it for Python < 3.4.
+            if PY35:
+                egg_info = next(
+                    Path(p)
+                    for p in glob.glob(
+                        os.path.join(str(directory), "**", "*.egg-info"),
+                        recursive=True,
                     )
-                else:
-                    egg_info = next(directory.glob("**/*.egg-info"))
+                )
+            else:
+                egg_info = next(directory.glob("**/*.egg-info"))
 
-                meta = pkginfo.UnpackedSDist(str(egg_info))
-                package_name = meta.name
-                package_version = meta.version
-                package_summary = meta.summary
-                python_requires = meta.requires_python
+            meta = pkginfo.UnpackedSDist(str(egg_info))
+            package_name = meta.name
+            package_version = meta.version
+            package_summary = meta.summary
+            python_requires = meta.requires_python
 
-                if meta.requires_dist:
-                    reqs = list(meta.requires_dist)
-                else:
-                    reqs = []
-                    requires = egg_info / "requires.txt"
-                    if requires.exists():
-                        with requires.open(encoding="utf-8") as f:
-                            reqs = parse_requires(f.read())
-            finally:
-                os.chdir(current_dir)
+            if meta.requires_dist:
+                reqs = list(meta.requires_dist)
+            else:
+                reqs = []
+                requires = egg_info / "requires.txt"
+                if requires.exists():
+                    with requires.open(encoding="utf-8") as f:
+                        reqs = parse_requires(f.read())
+
+        return {
+            "name": package_name,
+            "version": package_version,
+            "summary": package_summary,
+            "python_requires": python_requires,
+            "requires": reqs,
+        }
 
-            package = Package(package_name, package_version)
-            package.description = package_summary
+    @classmethod
+    def get_package_from_setup_metadata(
+        cls, metadata, name=None
+    ):  # type: (Dict[str, Any], Optional[str]) -> Package
+        # If the name could not be determined
+        # we use the dependency name
+        package_name = metadata["name"] or name
 
-            for req in reqs:
-                dep = dependency_from_pep_508(req)
-                if dep.in_extras:
-                    for extra in dep.in_extras:
-                        if extra not in package.extras:
-                            package.extras[extra] = []
+        package = Package(package_name, metadata["version"])
+        package.description = metadata["summary"]
 
-                        package.extras[extra].append(dep)
+        for req in metadata["requires"]:
+            dep = dependency_from_pep_508(req)
+            if dep.in_extras:
+                for extra in dep.in_extras:
+                    if extra not in package.extras:
+                        package.extras[extra] = []
 
-                if not dep.is_optional():
-                    package.requires.append(dep)
+                    package.extras[extra].append(dep)
+
+            if not dep.is_optional():
+                package.requires.append(dep)
 
-            if python_requires:
-                package.python_versions = python_requires
+        if metadata["python_requires"]:
+            package.python_versions = metadata["python_requires"]
 
         if name and name != package.name:
             # For now, the dependency's name must match the actual package's name
@@ -430,9 +640,6 @@ class Provider:
                 )
             )
 
-        package.source_type = "directory"
-        package.source_url = directory.as_posix()
-
         return package
 
     def search_for_url(self, dependency):  # type: (URLDependency) -> List[Package]
@@ -539,15 +746,25 @@ class Provider:
             "url",
             "git",
         }:
-            package = DependencyPackage(
-                package.dependency,
-                self._pool.package(
+            self._wait_for_prefetch(package.dependency)
+
+            key = (
+                package.version.text,
+                tuple(package.requires_extras),
+                package.dependency.source_name,
+            )
+            prefetched_key, prefetched = self._prefetched_packages.pop(
+                package.name, (None, None)
+            )
+            if prefetched_key != key:
+                prefetched = self._get_package(
                     package.name,
                     package.version.text,
                     extras=package.requires_extras,
                     repository=package.dependency.source_name,
-                ),
-            )
+                )
+
+            package = DependencyPackage(package.dependency, prefetched)
             requires = package.requires
         else:
             requires = package.requires
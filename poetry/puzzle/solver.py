@@ -1,18 +1,26 @@
+import copy
 import time
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
 
 from poetry.mixology import resolve_version
 from poetry.mixology.failure import SolveFailure
+from poetry.packages import Dependency
 from poetry.packages import DependencyPackage
 from poetry.packages import Package
 from poetry.semver import parse_constraint
 from poetry.version.markers import AnyMarker
+from poetry.version.markers import BaseMarker
 
 from .exceptions import CompatibilityError
 from .exceptions import SolverProblemError
+from .metadata_cache import MetadataCache
 from .operations import Install
 from .operations import Uninstall
 from .operations import Update
@@ -21,35 +29,48 @@ from .provider import Provider
 
 
 class Solver:
-    def __init__(self, package, pool, installed, locked, io):
+
+    # The maximum number of compatibility branches solved concurrently
+    BRANCHES_MAX_WORKERS = 4
+
+    def __init__(self, package, pool, installed, locked, io, metadata_cache=None):
         self._package = package
         self._pool = pool
         self._installed = installed
         self._locked = locked
         self._io = io
-        self._provider = Provider(self._package, self._pool, self._io)
+        self._provider = Provider(
+            self._package, self._pool, self._io, metadata_cache=metadata_cache
+        )
         self._branches = []
 
     def solve(self, use_latest=None):  # type: (...) -> List[Operation]
-        with self._provider.progress():
-            start = time.time()
-            packages, depths = self._solve(use_latest=use_latest)
-            end = time.time()
-
-            if len(self._branches) > 1:
-                self._provider.debug(
-                    "Complete version solving took {:.3f} seconds for {} branches".format(
-                        end - start, len(self._branches[1:])
+        try:
+            with self._provider.progress():
+                start = time.time()
+                packages, depths = self._solve(use_latest=use_latest)
+                end = time.time()
+
+                if len(self._branches) > 1:
+                    self._provider.debug(
+                        "Complete version solving took {:.3f} seconds for {} branches".format(
+                            end - start, len(self._branches[1:])
+                        )
                     )
-                )
-                self._provider.debug(
-                    "Resolved for branches: {}".format(
-                        ", ".join("({})".format(b) for b in self._branches[1:])
+                    self._provider.debug(
+                        "Resolved for branches: {}".format(
+                            ", ".join("({})".format(b) for b in self._branches[1:])
+                        )
                     )
-                )
+
+                if self._io.is_debug():
+                    self._debug_repositories()
+        finally:
+            # The threads querying the repositories are not needed anymore
+            self._pool.close()
 
         operations = []
-        for package in packages:
+        for package, depth in zip(packages, depths):
             installed = False
             for pkg in self._installed.packages:
                 if package.name == pkg.name:
@@ -84,23 +105,27 @@ class Solver:
                                 package.source_reference
                             )
                         ):
-                            operations.append(Update(pkg, package))
+                            operations.append(Update(pkg, package, priority=depth))
                         else:
                             operations.append(
-                                Install(package).skip("Already installed")
+                                Install(package, priority=depth).skip(
+                                    "Already installed"
+                                )
                             )
                     elif package.version != pkg.version:
                         # Checking version
-                        operations.append(Update(pkg, package))
+                        operations.append(Update(pkg, package, priority=depth))
                     elif package.source_type != pkg.source_type:
-                        operations.append(Update(pkg, package))
+                        operations.append(Update(pkg, package, priority=depth))
                     else:
-                        operations.append(Install(package).skip("Already installed"))
+                        operations.append(
+                            Install(package, priority=depth).skip("Already installed")
+                        )
 
                     break
 
             if not installed:
-                operations.append(Install(package))
+                operations.append(Install(package, priority=depth))
 
         # Checking for removals
         for pkg in self._locked.packages:
@@ -123,25 +148,29 @@ class Solver:
 
                 operations.append(op)
 
+        # The priority of an operation is the depth of its package
+        # so that dependencies are always handled before their dependents.
+        # Removals have the lowest priority and are always executed last.
         return sorted(
-            operations,
-            key=lambda o: (
-                o.job_type == "uninstall",
-                # Packages to be uninstalled have no depth so we default to 0
-                # since it actually doesn't matter since removals are always on top.
-                -depths[packages.index(o.package)] if o.job_type != "uninstall" else 0,
-                o.package.name,
-                o.package.version,
-            ),
+            operations, key=lambda o: (-o.priority, o.package.name, o.package.version),
         )
 
-    def solve_in_compatibility_mode(self, constraints, use_latest=None):
-        locked = {}
-        for package in self._locked.packages:
-            locked[package.name] = DependencyPackage(package.to_dependency(), package)
+    def _debug_repositories(self):  # type: () -> None
+        for name, stats in sorted(
+            self._pool.stats.items(), key=lambda item: str(item[0])
+        ):
+            message = (
+                "Repository {}: {} requests in {:.3f} seconds (max {:.3f} seconds)"
+            ).format(name, stats["requests"], stats["time"], stats["max"])
+            if stats["failures"]:
+                message += ", {} failed".format(stats["failures"])
+            if stats["timeouts"]:
+                message += ", {} timed out".format(stats["timeouts"])
 
-        packages = []
-        depths = []
+            self._provider.debug(message)
+
+    def solve_in_compatibility_mode(self, constraints, use_latest=None):
+        python_versions = []
         for constraint in constraints:
             constraint = parse_constraint(constraint)
             intersection = constraint.intersect(self._package.python_constraint)
@@ -150,25 +179,93 @@ class Solver:
                 "<comment>Retrying dependency resolution "
                 "for Python ({}).</comment>".format(intersection)
             )
-            with self._package.with_python_versions(str(intersection)):
-                _packages, _depths = self._solve(use_latest=use_latest)
-                for index, package in enumerate(_packages):
-                    if package not in packages:
-                        packages.append(package)
-                        depths.append(_depths[index])
-                        continue
-                    else:
-                        idx = packages.index(package)
-                        pkg = packages[idx]
-                        depths[idx] = max(depths[idx], _depths[index])
-                        pkg.marker = pkg.marker.union(package.marker)
+            python_versions.append(str(intersection))
+
+        # The branches are independent resolutions that only share
+        # the metadata retrieved from the repositories.
+        # They are solved one after the other when debugging
+        # so that their output does not get mixed up,
+        # and when the project has dependencies which are inspected locally,
+        # by building or unpacking them, since this is not thread-safe.
+        metadata_cache = self._provider.metadata_cache or MetadataCache()
+        if len(python_versions) == 1 or self._provider.is_debugging():
+            results = [
+                self._solve_branch(versions, metadata_cache, use_latest=use_latest)
+                for versions in python_versions
+            ]
+        else:
+            executor = ThreadPoolExecutor(
+                max_workers=min(len(python_versions), self.BRANCHES_MAX_WORKERS)
+            )
+            futures = []
+            try:
+                for versions in python_versions:
+                    futures.append(
+                        executor.submit(
+                            self._solve_branch,
+                            versions,
+                            metadata_cache,
+                            use_latest=use_latest,
+                        )
+                    )
+
+                results = [future.result() for future in futures]
+            except BaseException:
+                for future in futures:
+                    future.cancel()
 
-                        for dep in package.requires:
-                            if dep not in pkg.requires:
-                                pkg.requires.append(dep)
+                raise
+            finally:
+                executor.shutdown(wait=True)
+
+        packages = []
+        depths = []
+        indices = {}  # type: Dict[Package, int]
+        for branches, _packages, _depths in results:
+            self._branches += branches
+
+            for package, depth in zip(_packages, _depths):
+                idx = indices.get(package)
+                if idx is None:
+                    indices[package] = len(packages)
+                    packages.append(package)
+                    depths.append(depth)
+                    continue
+
+                pkg = packages[idx]
+                depths[idx] = max(depths[idx], depth)
+                pkg.marker = pkg.marker.union(package.marker)
+
+                for dep in package.requires:
+                    if dep not in pkg.requires:
+                        pkg.requires.append(dep)
 
         return packages, depths
 
+    def _solve_branch(
+        self, python_versions, metadata_cache, use_latest=None
+    ):  # type: (str, MetadataCache, Optional[List[str]]) -> Tuple[List[str], List[Package], List[int]]
+        """
+        Solves the dependencies of the root package
+        restricted to the given Python versions.
+        """
+        package = self._package.clone()
+        package.python_versions = python_versions
+        package.requires = [copy.copy(dep) for dep in package.requires]
+        package.dev_requires = [copy.copy(dep) for dep in package.dev_requires]
+
+        solver = self.__class__(
+            package,
+            self._pool,
+            self._installed,
+            self._locked,
+            self._io,
+            metadata_cache=metadata_cache,
+        )
+        packages, depths = solver._solve(use_latest=use_latest)
+
+        return solver._branches, packages, depths
+
     def _solve(self, use_latest=None):
         self._branches.append(self._package.python_versions)
 
@@ -190,12 +287,13 @@ class Solver:
             raise SolverProblemError(e)
 
         graph = self._build_graph(self._package, packages)
+        tags = self._get_tags_for_packages(graph)
 
         depths = []
         final_packages = []
         for package in packages:
-            category, optional, marker, depth = self._get_tags_for_package(
-                package, graph
+            category, optional, marker, depth = tags.get(
+                package.name, ("dev", True, None, 0)
             )
 
             if marker is None:
@@ -213,7 +311,50 @@ class Solver:
         return final_packages, depths
 
     def _build_graph(
-        self, package, packages, previous=None, previous_dep=None, dep=None
+        self, package, packages
+    ):  # type: (Package, List[Package]) -> Dict[str, Any]
+        """
+        Builds the tree of the paths leading from the root package
+        to the resolved packages.
+
+        The subtrees of packages reached several times in the same context,
+        which is common for packages many others depend on,
+        are only built once and shared.
+        """
+        packages_by_name = {}  # type: Dict[str, List[Package]]
+        for pkg in packages:
+            packages_by_name.setdefault(pkg.name, []).append(pkg)
+
+        # The names of the packages each package leads to,
+        # which tell whether the subtree of a package can depend
+        # on the name of its parent or of the root dependency it comes from.
+        reachable = {}  # type: Dict[str, Set[str]]
+        for name in packages_by_name:
+            seen = set()
+            stack = [name]
+            while stack:
+                for pkg in packages_by_name.get(stack.pop(), []):
+                    for dependency in pkg.all_requires:
+                        if (
+                            dependency.name in packages_by_name
+                            and dependency.name not in seen
+                        ):
+                            seen.add(dependency.name)
+                            stack.append(dependency.name)
+
+            reachable[name] = seen
+
+        return self._build_node(package, packages_by_name, reachable, {})
+
+    def _build_node(
+        self,
+        package,  # type: Package
+        packages_by_name,  # type: Dict[str, List[Package]]
+        reachable,  # type: Dict[str, Set[str]]
+        cache,  # type: Dict[tuple, List[Dict[str, Any]]]
+        previous=None,  # type: Optional[Dict[str, Any]]
+        previous_dep=None,  # type: Optional[Dependency]
+        dep=None,  # type: Optional[Dependency]
     ):  # type: (...) -> Dict[str, Any]
         if not previous:
             category = "dev"
@@ -243,6 +384,26 @@ class Solver:
         if previous_dep and previous_dep is not dep and previous_dep.name == dep.name:
             return graph
 
+        # The children only depend on the following,
+        # so they can be shared by all the nodes with the same context.
+        key = None
+        if previous:
+            names = reachable.get(package.name, set())
+            key = (
+                id(package),
+                previous["name"] if previous["name"] in names else None,
+                str(marker),
+                tuple(previous_dep.extras),
+                dep.name if dep.name in names else None,
+                dep.category,
+                optional,
+            )
+
+            if key in cache:
+                graph["children"] = cache[key]
+
+                return graph
+
         for dependency in package.all_requires:
             is_activated = True
             if dependency.is_optional():
@@ -272,10 +433,8 @@ class Solver:
                 # simply skip it because we already have it
                 continue
 
-            for pkg in packages:
-                if pkg.name == dependency.name and dependency.constraint.allows(
-                    pkg.version
-                ):
+            for pkg in packages_by_name.get(dependency.name, []):
+                if dependency.constraint.allows(pkg.version):
                     # If there is already a child with this name
                     # we merge the requirements
                     existing = None
@@ -287,8 +446,14 @@ class Solver:
                             existing = child
                             continue
 
-                    child_graph = self._build_graph(
-                        pkg, packages, graph, dependency, dep or dependency
+                    child_graph = self._build_node(
+                        pkg,
+                        packages_by_name,
+                        reachable,
+                        cache,
+                        graph,
+                        dependency,
+                        dep or dependency,
                     )
 
                     if not is_activated:
@@ -302,47 +467,67 @@ class Solver:
 
                     childrens.append(child_graph)
 
-        return graph
+        if key is not None:
+            cache[key] = childrens
 
-    def _get_tags_for_package(self, package, graph, depth=0):
-        categories = ["dev"]
-        optionals = [True]
-        markers = []
-        _depths = [0]
+        return graph
 
-        children = graph["children"]
+    def _get_tags_for_packages(
+        self, graph
+    ):  # type: (Dict[str, Any]) -> Dict[str, Tuple[str, bool, BaseMarker, int]]
+        """
+        Returns the category, optional flag, marker and depth of each package
+        appearing in the given graph.
+        """
+        return self._get_tags_for_children(graph["children"], {})
+
+    def _get_tags_for_children(
+        self, children, cache
+    ):  # type: (List[Dict[str, Any]], Dict[int, Dict[str, tuple]]) -> Dict[str, tuple]
+        # Shared subtrees are only visited once.
+        key = id(children)
+        if key in cache:
+            return cache[key]
+
+        tags = {}
         for child in children:
-            if child["name"] == package.name:
-                category = child["category"]
-                optional = child["optional"]
-                marker = child["marker"]
-                _depths.append(depth)
-            else:
-                (category, optional, marker, _depth) = self._get_tags_for_package(
-                    package, child, depth=depth + 1
+            # A package is tagged by its closest occurrences on each path,
+            # its own subtree is not taken into account.
+            child_tags = [
+                (
+                    child["name"],
+                    (child["category"], child["optional"], child["marker"], 0),
                 )
+            ]
+            for (
+                name,
+                (category, optional, marker, depth),
+            ) in self._get_tags_for_children(child["children"], cache).items():
+                if name != child["name"]:
+                    child_tags.append((name, (category, optional, marker, depth + 1)))
+
+            for name, (category, optional, marker, depth) in child_tags:
+                if name not in tags:
+                    tags[name] = ("dev", True, None, 0)
+
+                _category, _optional, _marker, _depth = tags[name]
+
+                if category == "main":
+                    _category = "main"
+
+                if marker is not None:
+                    if _marker is None:
+                        _marker = marker
+                    else:
+                        _marker = _marker.union(marker)
 
-                _depths.append(_depth)
-
-            categories.append(category)
-            optionals.append(optional)
-            if marker is not None:
-                markers.append(marker)
-
-        if "main" in categories:
-            category = "main"
-        else:
-            category = "dev"
-
-        optional = all(optionals)
-
-        depth = max(*(_depths + [0]))
+                tags[name] = (
+                    _category,
+                    _optional and optional,
+                    _marker,
+                    max(_depth, depth),
+                )
 
-        if not markers:
-            marker = None
-        else:
-            marker = markers[0]
-            for m in markers[1:]:
-                marker = marker.union(m)
+        cache[key] = tags
 
-        return category, optional, marker, depth
+        return tags
@@ -3,6 +3,11 @@ class RepositoryError(Exception):
     pass
 
 
+class RepositoryTimeout(RepositoryError):
+
+    pass
+
+
 class PackageNotFound(Exception):
 
     pass
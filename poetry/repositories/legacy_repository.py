@@ -1,10 +1,13 @@
 import cgi
+import json
 import re
-import warnings
 
 from collections import defaultdict
+from typing import Dict
 from typing import Generator
+from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
 import requests
@@ -23,7 +26,10 @@ from poetry.semver import Version
 from poetry.semver import VersionConstraint
 from poetry.semver import VersionRange
 from poetry.semver import parse_constraint
+from poetry.utils._compat import OrderedDict
 from poetry.utils._compat import Path
+from poetry.utils._compat import unicode
+from poetry.utils.artifact_cache import ArtifactCache
 from poetry.utils.helpers import canonicalize_name
 from poetry.utils.inspector import Inspector
 from poetry.utils.patterns import wheel_file_re
@@ -56,12 +62,14 @@ except ImportError:
     from urllib import quote
 
 
-with warnings.catch_warnings():
-    warnings.simplefilter("ignore")
-    import html5lib
-
-
 class Page:
+    """
+    A page of a simple repository index (PEP 503),
+    or its JSON counterpart (PEP 691).
+
+    The page is parsed once, when it is created, into an index
+    of its distribution links by version.
+    """
 
     VERSION_REGEX = re.compile(r"(?i)([a-z0-9_\-.]+?)-(?=\d)([a-z0-9_.!+-]+)")
     SUPPORTED_FORMATS = [
@@ -74,11 +82,20 @@ class Page:
         ".tar",
     ]
 
+    JSON_CONTENT_TYPE = "application/vnd.pypi.simple.v1+json"
+
+    _comment_re = re.compile(r"<!--.*?-->", re.S)
+    _anchor_re = re.compile(r"""<a\b((?:[^>"']|"[^"]*"|'[^']*')*)>""", re.I)
+    _attribute_re = re.compile(
+        r"""([^\s"'>/=]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+)))?"""
+    )
+
     def __init__(self, url, content, headers):
         if not url.endswith("/"):
             url += "/"
 
         self._url = url
+        content_type = None
         encoding = None
         if headers and "Content-Type" in headers:
             content_type, params = cgi.parse_header(headers["Content-Type"])
@@ -86,51 +103,93 @@ class Page:
             if "charset" in params:
                 encoding = params["charset"]
 
+        if not isinstance(content, unicode):
+            content = content.decode(encoding or "utf-8", "replace")
+
         self._content = content
 
-        if encoding is None:
-            self._parsed = html5lib.parse(content, namespaceHTMLElements=False)
+        if content_type == self.JSON_CONTENT_TYPE:
+            anchors = self._parse_json(content)
         else:
-            self._parsed = html5lib.parse(
-                content, transport_encoding=encoding, namespaceHTMLElements=False
-            )
-
-    @property
-    def versions(self):  # type: () -> Generator[Version]
-        seen = set()
-        for link in self.links:
-            version = self.link_version(link)
-
-            if not version:
+            anchors = self._parse_html(content)
+
+        self._links = []  # type: List[Link]
+        self._links_by_version = OrderedDict()  # type: Dict[Version, List[Link]]
+        for href, requires_python in anchors:
+            # Joining is only needed for relative or non-normalized urls,
+            # absolute ones being the vast majority.
+            if not href.startswith(("https://", "http://")) or "/." in href:
+                href = urlparse.urljoin(self._url, href)
+
+            url = self.clean_link(href)
+            link = Link(url, self, requires_python=requires_python)
+            if link.ext not in self.SUPPORTED_FORMATS:
                 continue
 
-            if version in seen:
-                continue
+            self._links.append(link)
 
-            seen.add(version)
+            version = self.link_version(link)
+            if version:
+                self._links_by_version.setdefault(version, []).append(link)
 
+    @property
+    def versions(self):  # type: () -> Generator[Version]
+        for version in self._links_by_version:
             yield version
 
     @property
     def links(self):  # type: () -> Generator[Link]
-        for anchor in self._parsed.findall(".//a"):
-            if anchor.get("href"):
-                href = anchor.get("href")
-                url = self.clean_link(urlparse.urljoin(self._url, href))
-                pyrequire = anchor.get("data-requires-python")
-                pyrequire = unescape(pyrequire) if pyrequire else None
+        for link in self._links:
+            yield link
+
+    def links_for_version(self, version):  # type: (Version) -> Generator[Link]
+        for link in self._links_by_version.get(version, []):
+            yield link
 
-                link = Link(url, self, requires_python=pyrequire)
+    def _parse_html(
+        self, content
+    ):  # type: (str) -> Generator[Tuple[str, Optional[str]]]
+        """
+        Extracts the href and data-requires-python attributes of the anchors.
 
-                if link.ext not in self.SUPPORTED_FORMATS:
-                    continue
+        Simple index pages being nothing more than a list of anchors,
+        only the anchor tags are scanned instead of building the whole document.
+        """
+        content = self._comment_re.sub("", content)
+        for anchor in self._anchor_re.finditer(content):
+            attributes = {}
+            for attribute in self._attribute_re.finditer(anchor.group(1)):
+                name, value = attribute.group(1).lower(), attribute.group(2)
+                if value is None:
+                    value = attribute.group(3)
+                if value is None:
+                    value = attribute.group(4) or ""
+
+                attributes.setdefault(name, unescape(value))
+
+            href = attributes.get("href")
+            if not href:
+                continue
 
-                yield link
+            yield href, attributes.get("data-requires-python") or None
 
-    def links_for_version(self, version):  # type: (Version) -> Generator[Link]
-        for link in self.links:
-            if self.link_version(link) == version:
-                yield link
+    def _parse_json(
+        self, content
+    ):  # type: (str) -> Generator[Tuple[str, Optional[str]]]
+        for file in json.loads(content).get("files", []):
+            href = file.get("url")
+            if not href:
+                continue
+
+            # Hashes are carried by the url fragment, like in HTML pages
+            hashes = file.get("hashes") or {}
+            if "#" not in href:
+                for name in ("sha256", "sha512", "sha384", "sha224", "sha1", "md5"):
+                    if name in hashes:
+                        href += "#{}={}".format(name, hashes[name])
+                        break
+
+            yield href, file.get("requires-python") or None
 
     def link_version(self, link):  # type: (Link) -> Union[Version, None]
         m = wheel_file_re.match(link.filename)
@@ -161,6 +220,16 @@ class Page:
 
 
 class LegacyRepository(PyPiRepository):
+
+    # The JSON simple API (PEP 691) is preferred when the server supports it
+    ACCEPT = ", ".join(
+        [
+            Page.JSON_CONTENT_TYPE,
+            "application/vnd.pypi.simple.v1+html;q=0.2",
+            "text/html;q=0.01",
+        ]
+    )
+
     def __init__(
         self, name, url, auth=None, disable_cache=False, cert=None, client_cert=None
     ):  # type: (str, str, Optional[Auth], bool, Optional[Path], Optional[Path]) -> None
@@ -201,6 +270,7 @@ class LegacyRepository(PyPiRepository):
         if self._client_cert:
             self._session.cert = str(self._client_cert)
 
+        self._artifact_cache = ArtifactCache()
         self._disable_cache = disable_cache
 
     @property
@@ -363,6 +433,15 @@ class LegacyRepository(PyPiRepository):
 
             return package
 
+    def find_links_for_package(self, package):  # type: (Package) -> List[Link]
+        page = self._get(
+            "/{}/".format(canonicalize_name(package.name).replace(".", "-"))
+        )
+        if page is None:
+            return []
+
+        return list(page.links_for_version(package.version))
+
     def _get_release_info(self, name, version):  # type: (str, str) -> dict
         page = self._get("/{}/".format(canonicalize_name(name).replace(".", "-")))
         if page is None:
@@ -411,7 +490,9 @@ class LegacyRepository(PyPiRepository):
         return data
 
     def _download(self, url, dest):  # type: (str, str) -> None
-        r = self._session.get(url, stream=True)
+        r = self._session.get(url, stream=True, timeout=self._timeout)
+        r.raise_for_status()
+
         with open(dest, "wb") as f:
             for chunk in r.iter_content(chunk_size=1024):
                 if chunk:
@@ -419,7 +500,9 @@ class LegacyRepository(PyPiRepository):
 
     def _get(self, endpoint):  # type: (str) -> Union[Page, None]
         url = self._url + endpoint
-        response = self._session.get(url)
+        response = self._session.get(
+            url, headers={"Accept": self.ACCEPT}, timeout=self._timeout
+        )
         if response.status_code == 404:
             return
 
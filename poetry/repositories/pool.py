@@ -1,16 +1,36 @@
+import logging
+import threading
+import time
+
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError
+
+from requests.exceptions import Timeout
+from typing import Any
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 from .base_repository import BaseRepository
 from .exceptions import PackageNotFound
+from .exceptions import RepositoryTimeout
 from .repository import Repository
 
 
+logger = logging.getLogger(__name__)
+
+
 class Pool(BaseRepository):
+
+    # The number of lookups which can run concurrently in each repository
+    CONCURRENT_LOOKUPS = 8
+
     def __init__(
-        self, repositories=None, ignore_repository_names=False
-    ):  # type: (Optional[List[Repository]], bool) -> None
+        self, repositories=None, ignore_repository_names=False, timeout=None
+    ):  # type: (Optional[List[Repository]], bool, Optional[float]) -> None
         if repositories is None:
             repositories = []
 
@@ -18,6 +38,11 @@ class Pool(BaseRepository):
         self._repositories = []  # type: List[Repository]
         self._default = False
         self._secondary_start_idx = None
+        self._timeout = timeout
+        self._stats = {}  # type: Dict[str, Dict[str, Any]]
+        self._stats_lock = threading.Lock()
+        self._executor = None  # type: Optional[ThreadPoolExecutor]
+        self._executor_lock = threading.Lock()
 
         for repository in repositories:
             self.add_repository(repository)
@@ -30,6 +55,26 @@ class Pool(BaseRepository):
     def repositories(self):  # type: () -> List[Repository]
         return self._repositories
 
+    @property
+    def timeout(self):  # type: () -> Optional[float]
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, timeout):  # type: (Optional[float]) -> None
+        self._timeout = timeout
+
+        for repository in self._repositories:
+            repository.timeout = timeout
+
+    @property
+    def stats(self):  # type: () -> Dict[str, Dict[str, Any]]
+        """
+        The number of requests, failures and timeouts of each repository
+        along with the total and maximum time spent in its requests.
+        """
+        with self._stats_lock:
+            return {name: dict(stats) for name, stats in self._stats.items()}
+
     def has_default(self):  # type: () -> bool
         return self._default
 
@@ -45,6 +90,8 @@ class Pool(BaseRepository):
         """
         Adds a repository to the pool.
         """
+        repository.timeout = self._timeout
+
         if default:
             if self.has_default():
                 raise ValueError("Only one repository can be the default")
@@ -104,22 +151,32 @@ class Pool(BaseRepository):
 
         if repository is not None and not self._ignore_repository_names:
             try:
-                return self._repositories[self._lookup[repository]].package(
-                    name, version, extras=extras
+                return self._call(
+                    self._repositories[self._lookup[repository]],
+                    "package",
+                    name,
+                    version,
+                    extras=extras,
                 )
             except PackageNotFound:
                 pass
         else:
-            for idx, repo in enumerate(self._repositories):
+            # Repositories of lower priority are only queried
+            # when the ones of higher priority do not provide the package.
+            for repo in self._repositories:
                 try:
-                    package = repo.package(name, version, extras=extras)
+                    package = self._call_in_time(
+                        repo, "package", name, version, extras=extras
+                    )
                 except PackageNotFound:
                     continue
 
-                if package:
-                    self._packages.append(package)
+                if not package:
+                    continue
+
+                self._packages.append(package)
 
-                    return package
+                return package
 
         raise PackageNotFound("Package {} ({}) not found.".format(name, version))
 
@@ -139,18 +196,189 @@ class Pool(BaseRepository):
             raise ValueError('Repository "{}" does not exist.'.format(repository))
 
         if repository is not None and not self._ignore_repository_names:
-            return self._repositories[self._lookup[repository]].find_packages(
-                name, constraint, extras=extras, allow_prereleases=allow_prereleases
+            return self._call(
+                self._repositories[self._lookup[repository]],
+                "find_packages",
+                name,
+                constraint,
+                extras=extras,
+                allow_prereleases=allow_prereleases,
             )
 
         packages = []
-        for idx, repo in enumerate(self._repositories):
-            packages += repo.find_packages(
-                name, constraint, extras=extras, allow_prereleases=allow_prereleases
-            )
+        for repo, _packages in self._fan_out(
+            "find_packages",
+            name,
+            constraint,
+            extras=extras,
+            allow_prereleases=allow_prereleases,
+        ):
+            if isinstance(_packages, PackageNotFound):
+                raise _packages
+
+            packages += _packages
 
         return packages
 
+    def _fan_out(
+        self, method, *args, **kwargs
+    ):  # type: (str, *Any, **Any) -> Iterator[Tuple[Repository, Any]]
+        """
+        Calls the given method of every repository concurrently
+        and yields the results in the order of the repositories,
+        as soon as they are available.
+
+        PackageNotFound errors are yielded rather than raised.
+        A RepositoryTimeout error is raised if a repository
+        does not answer within the timeout.
+        """
+        repositories = self._repositories
+        if len(repositories) < 2:
+            for repo in repositories:
+                try:
+                    yield repo, self._call(repo, method, *args, **kwargs)
+                except PackageNotFound as e:
+                    yield repo, e
+
+            return
+
+        requests = []
+        try:
+            for repo in repositories:
+                requests.append((repo, self._submit(repo, method, *args, **kwargs)))
+
+            for repo, (future, started) in requests:
+                try:
+                    result = self._result(repo, future, started)
+                except PackageNotFound as e:
+                    result = e
+
+                yield repo, result
+        finally:
+            for _, (future, _) in requests:
+                future.cancel()
+
+    def _call_in_time(
+        self, repo, method, *args, **kwargs
+    ):  # type: (Repository, str, *Any, **Any) -> Any
+        """
+        Calls the given method of a repository, raising a RepositoryTimeout
+        error if it does not answer within the timeout.
+        """
+        if self._timeout is None:
+            return self._call(repo, method, *args, **kwargs)
+
+        future, started = self._submit(repo, method, *args, **kwargs)
+        try:
+            return self._result(repo, future, started)
+        finally:
+            future.cancel()
+
+    def close(self):  # type: () -> None
+        """
+        Stops the threads querying the repositories.
+
+        They are started again on the next concurrent lookup.
+        """
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown()
+
+    def _submit(
+        self, repo, method, *args, **kwargs
+    ):  # type: (Repository, str, *Any, **Any) -> Tuple[Future, List[float]]
+        """
+        Schedules a call to the given method of a repository.
+
+        Along with the future of the call, returns a list
+        which receives the time at which the call starts running.
+        """
+        started = []  # type: List[float]
+
+        def call():  # type: () -> Any
+            started.append(time.time())
+
+            return self._call(repo, method, *args, **kwargs)
+
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.CONCURRENT_LOOKUPS
+                    * max(1, len(self._repositories))
+                )
+
+            return self._executor.submit(call), started
+
+    def _result(
+        self, repo, future, started
+    ):  # type: (Repository, Future, List[float]) -> Any
+        if self._timeout is None:
+            return future.result()
+
+        # The time spent waiting for a thread does not count
+        # towards the timeout of the call.
+        while not started and not future.done():
+            time.sleep(0.01)
+
+        timeout = None
+        if started:
+            timeout = max(0, started[0] + self._timeout - time.time())
+
+        try:
+            return future.result(timeout=timeout)
+        except TimeoutError:
+            raise self._timed_out(repo)
+
+    def _call(
+        self, repo, method, *args, **kwargs
+    ):  # type: (Repository, str, *Any, **Any) -> Any
+        start = time.time()
+        failed = False
+        try:
+            return getattr(repo, method)(*args, **kwargs)
+        except PackageNotFound:
+            raise
+        except Timeout:
+            failed = True
+
+            raise self._timed_out(repo)
+        except Exception:
+            failed = True
+
+            raise
+        finally:
+            self._record(repo, time.time() - start, failed=failed)
+
+    def _timed_out(self, repo):  # type: (Repository) -> RepositoryTimeout
+        self._record(repo, timed_out=True)
+
+        message = "Repository {} did not answer within {} seconds.".format(
+            repo.name, self._timeout
+        )
+        logger.warning(message)
+
+        return RepositoryTimeout(message)
+
+    def _record(
+        self, repo, elapsed=None, failed=False, timed_out=False
+    ):  # type: (Repository, Optional[float], bool, bool) -> None
+        with self._stats_lock:
+            stats = self._stats.setdefault(
+                repo.name,
+                {"requests": 0, "failures": 0, "timeouts": 0, "time": 0.0, "max": 0.0},
+            )
+            if timed_out:
+                stats["timeouts"] += 1
+
+                return
+
+            stats["requests"] += 1
+            stats["failures"] += int(failed)
+            stats["time"] += elapsed
+            stats["max"] = max(stats["max"], elapsed)
+
     def search(self, query):
         from .legacy_repository import LegacyRepository
 
@@ -1,9 +1,15 @@
 import logging
 import os
+import re
+import time
 
 from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any
 from typing import Dict
+from typing import Iterator
 from typing import List
+from typing import Optional
 from typing import Union
 
 from cachecontrol import CacheControl
@@ -12,6 +18,8 @@ from cachecontrol.controller import logger as cache_control_logger
 from cachy import CacheManager
 from html5lib.html5parser import parse
 from requests import get
+from requests import Response
+from requests import Session
 from requests import session
 from requests.exceptions import TooManyRedirects
 
@@ -19,15 +27,19 @@ from poetry.locations import CACHE_DIR
 from poetry.packages import Package
 from poetry.packages import dependency_from_pep_508
 from poetry.packages.utils.link import Link
+from poetry.semver import Version
 from poetry.semver import VersionConstraint
 from poetry.semver import VersionRange
 from poetry.semver import parse_constraint
 from poetry.semver.exceptions import ParseVersionError
 from poetry.utils._compat import Path
 from poetry.utils._compat import to_str
+from poetry.utils.artifact_cache import ArtifactCache
 from poetry.utils.helpers import temporary_directory
 from poetry.utils.inspector import Inspector
 from poetry.utils.patterns import wheel_file_re
+from poetry.utils.remote_file import LazyRemoteFile
+from poetry.utils.remote_file import RangeRequestsUnsupported
 from poetry.version.markers import InvalidMarker
 from poetry.version.markers import parse_marker
 
@@ -63,12 +75,20 @@ class PyPiRepository(Repository):
                 "stores": {
                     "releases": {"driver": "file", "path": str(release_cache_dir)},
                     "packages": {"driver": "dict"},
+                    "index": {
+                        "driver": "file",
+                        "path": str(release_cache_dir / "_index"),
+                    },
                 },
             }
         )
 
         self._cache_control_cache = FileCache(str(release_cache_dir / "_http"))
         self._session = CacheControl(session(), cache=self._cache_control_cache)
+        # The release index is revalidated by hand so we need
+        # a session which does not cache the full responses.
+        self._index_session = session()
+        self._artifact_cache = ArtifactCache()
         self._inspector = Inspector()
 
         super(PyPiRepository, self).__init__()
@@ -109,7 +129,7 @@ class PyPiRepository(Repository):
                 allow_prereleases = True
 
         try:
-            info = self.get_package_info(name)
+            releases = self.get_releases(name)
         except PackageNotFound:
             self._log(
                 "No packages found for {} {}".format(name, str(constraint)),
@@ -119,8 +139,8 @@ class PyPiRepository(Repository):
 
         packages = []
 
-        for version, release in info["releases"].items():
-            if not release:
+        for version, release in releases.items():
+            if release is None:
                 # Bad release
                 self._log(
                     "No release information found for {}-{}, skipping".format(
@@ -130,6 +150,15 @@ class PyPiRepository(Repository):
                 )
                 continue
 
+            if release["yanked"] and not isinstance(constraint, Version):
+                # Yanked releases are only selected if explicitly pinned
+                # (see PEP 592)
+                self._log(
+                    "{}-{} has been yanked, skipping".format(name, version),
+                    level="debug",
+                )
+                continue
+
             try:
                 package = Package(name, version)
             except ParseVersionError:
@@ -272,6 +301,93 @@ class PyPiRepository(Repository):
 
         return data
 
+    def get_releases(self, name):  # type: (str) -> Dict[str, Dict[str, Any]]
+        """
+        Return the releases of a package, as a mapping of versions
+        to their yanked status. Releases without any file are mapped to None.
+
+        The releases are retrieved from a compact index persisted
+        in the cache which is revalidated with the remote server
+        once it becomes stale.
+        """
+        if self._disable_cache:
+            return self._get_releases_from_info(self._get_package_info(name))
+
+        return self._cache.store("packages").remember_forever(
+            "releases:{}".format(name), lambda: self._get_release_index(name)
+        )
+
+    def _get_release_index(self, name):  # type: (str) -> Dict[str, Dict[str, Any]]
+        try:
+            index = self._cache.store("index").get(name)
+        except ValueError:
+            # Corrupted entries are retrieved again
+            index = None
+
+        if not isinstance(index, dict) or any(
+            key not in index for key in ("releases", "etag", "last_modified", "expires")
+        ):
+            index = None
+        elif index.get("_cache_version") != str(self.CACHE_VERSION):
+            index = None
+
+        if index is not None and index["expires"] > time.time():
+            return index["releases"]
+
+        headers = {}
+        if index is not None:
+            if index["etag"]:
+                headers["If-None-Match"] = index["etag"]
+
+            if index["last_modified"]:
+                headers["If-Modified-Since"] = index["last_modified"]
+
+        response = self._request(
+            self._index_session, "pypi/{}/json".format(name), headers=headers
+        )
+        if response.status_code == 404:
+            raise PackageNotFound("Package [{}] not found.".format(name))
+
+        if response.status_code == 304 and index is not None:
+            self._log("The release index of {} is up to date".format(name), "debug")
+        else:
+            response.raise_for_status()
+
+            index = {
+                "releases": self._get_releases_from_info(response.json()),
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "_cache_version": str(self.CACHE_VERSION),
+            }
+
+        index["expires"] = time.time() + self._get_max_age(response)
+        self._cache.store("index").forever(name, index)
+
+        return index["releases"]
+
+    def _get_releases_from_info(
+        self, info
+    ):  # type: (dict) -> Dict[str, Dict[str, Any]]
+        releases = {}
+        for version, files in info["releases"].items():
+            if not files:
+                releases[version] = None
+
+                continue
+
+            releases[version] = {
+                "yanked": all(file_info.get("yanked", False) for file_info in files)
+            }
+
+        return releases
+
+    def _get_max_age(self, response):  # type: (...) -> int
+        m = re.search(r"max-age=(\d+)", response.headers.get("Cache-Control", ""))
+        if m is None:
+            return 0
+
+        return int(m.group(1))
+
     def get_release_info(self, name, version):  # type: (str, str) -> dict
         """
         Return the release information given a package name and a version.
@@ -299,6 +415,28 @@ class PyPiRepository(Repository):
 
         return cached
 
+    def find_links_for_package(self, package):  # type: (Package) -> List[Link]
+        """
+        Return the links to the distributions of the given package.
+        """
+        json_data = self._get("pypi/{}/{}/json".format(package.name, package.version))
+        if json_data is None:
+            return []
+
+        links = []
+        for url in json_data["urls"]:
+            h = "sha256={}".format(url["digests"]["sha256"])
+            links.append(Link(url["url"] + "#" + h))
+
+        return links
+
+    def get_artifact(self, url, hash=None):  # type: (str, Optional[str]) -> Path
+        """
+        Return the path to the distribution at the given url,
+        downloading it only if it is not already in the artifact cache.
+        """
+        return self._artifact_cache.get(url, hash=hash, download=self._download)
+
     def _get_release_info(self, name, version):  # type: (str, str) -> dict
         self._log("Getting info for {} ({}) from PyPI".format(name, version), "debug")
 
@@ -360,13 +498,7 @@ class PyPiRepository(Repository):
         return data
 
     def _get(self, endpoint):  # type: (str) -> Union[dict, None]
-        try:
-            json_response = self._session.get(self._url + endpoint)
-        except TooManyRedirects:
-            # Cache control redirect loop.
-            # We try to remove the cache and try again
-            self._cache_control_cache.delete(self._url + endpoint)
-            json_response = self._session.get(self._url + endpoint)
+        json_response = self._request(self._session, endpoint)
 
         if json_response.status_code == 404:
             return None
@@ -375,6 +507,21 @@ class PyPiRepository(Repository):
 
         return json_data
 
+    def _request(
+        self, session, endpoint, headers=None
+    ):  # type: (Session, str, Optional[Dict[str, str]]) -> Response
+        try:
+            return session.get(
+                self._url + endpoint, headers=headers, timeout=self._timeout
+            )
+        except TooManyRedirects:
+            # Cache control redirect loop.
+            # We try to remove the cache and try again,
+            # without revalidating what we know of the resource
+            self._cache_control_cache.delete(self._url + endpoint)
+
+            return session.get(self._url + endpoint, timeout=self._timeout)
+
     def _get_info_from_urls(
         self, urls
     ):  # type: (Dict[str, List[str]]) -> Dict[str, Union[str, List, None]]
@@ -472,17 +619,22 @@ class PyPiRepository(Repository):
     def _get_info_from_wheel(
         self, url
     ):  # type: (str) -> Dict[str, Union[str, List, None]]
-        self._log(
-            "Downloading wheel: {}".format(urlparse.urlparse(url).path.rsplit("/")[-1]),
-            level="debug",
-        )
-
         filename = os.path.basename(urlparse.urlparse(url).path.rsplit("/")[-1])
 
-        with temporary_directory() as temp_dir:
-            filepath = Path(temp_dir) / filename
-            self._download(url, str(filepath))
+        self._log("Inspecting wheel: {}".format(filename), level="debug")
 
+        try:
+            with self._open_remote_file(url) as f:
+                return self._inspector.inspect_wheel_archive(f)
+        except RangeRequestsUnsupported:
+            self._log(
+                "Range requests are not supported, downloading wheel: {}".format(
+                    filename
+                ),
+                level="debug",
+            )
+
+        with self._downloaded(url) as filepath:
             return self._inspector.inspect_wheel(filepath)
 
     def _get_info_from_sdist(
@@ -493,16 +645,37 @@ class PyPiRepository(Repository):
             level="debug",
         )
 
+        with self._downloaded(url) as filepath:
+            return self._inspector.inspect_sdist(filepath)
+
+    @contextmanager
+    def _downloaded(self, url):  # type: (str) -> Iterator[Path]
+        """
+        Downloads the distribution at the given url
+        in the artifact cache, or in a temporary directory
+        if the cache is disabled.
+        """
+        if not self._disable_cache:
+            yield self.get_artifact(url)
+
+            return
+
         filename = os.path.basename(urlparse.urlparse(url).path)
 
         with temporary_directory() as temp_dir:
             filepath = Path(temp_dir) / filename
             self._download(url, str(filepath))
 
-            return self._inspector.inspect_sdist(filepath)
+            yield filepath
+
+    def _open_remote_file(self, url):  # type: (str) -> LazyRemoteFile
+        """
+        Opens a remote file, only retrieving the parts which are read.
+        """
+        return LazyRemoteFile(url, session=self._session, timeout=self._timeout)
 
     def _download(self, url, dest):  # type: (str, str) -> None
-        r = get(url, stream=True)
+        r = get(url, stream=True, timeout=self._timeout)
         r.raise_for_status()
 
         with open(dest, "wb") as f:
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from poetry.semver import VersionConstraint
 from poetry.semver import VersionRange
 from poetry.semver import parse_constraint
@@ -6,6 +8,10 @@ from .base_repository import BaseRepository
 
 
 class Repository(BaseRepository):
+
+    # The maximum time, in seconds, to wait for the server of the repository
+    _timeout = None
+
     def __init__(self, packages=None):
         super(Repository, self).__init__()
 
@@ -21,6 +27,14 @@ class Repository(BaseRepository):
     def name(self):
         return self._name
 
+    @property
+    def timeout(self):  # type: () -> Optional[float]
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, timeout):  # type: (Optional[float]) -> None
+        self._timeout = timeout
+
     def package(self, name, version, extras=None):
         name = name.lower()
 
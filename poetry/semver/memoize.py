@@ -0,0 +1,90 @@
+import functools
+import threading
+
+from collections import OrderedDict
+from typing import Any
+from typing import Callable
+from typing import Hashable
+
+
+class LRUCache(object):
+    """
+    A thread-safe mapping of bounded size
+    which discards its least recently used items first.
+    """
+
+    def __init__(self, maxsize=1024):  # type: (int) -> None
+        self._maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def maxsize(self):  # type: () -> int
+        return self._maxsize
+
+    def get(self, key, default=None):  # type: (Hashable, Any) -> Any
+        with self._lock:
+            try:
+                value = self._data.pop(key)
+            except KeyError:
+                return default
+
+            self._data[key] = value
+
+            return value
+
+    def set(self, key, value):  # type: (Hashable, Any) -> None
+        if self._maxsize <= 0:
+            return
+
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = value
+
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):  # type: () -> None
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):  # type: () -> int
+        return len(self._data)
+
+
+_caches = []
+
+
+def memoize_operation(maxsize=4096):  # type: (int) -> Callable
+    """
+    Memoizes a binary operation between two constraints.
+
+    Results are keyed on the identity of the operands,
+    which are kept alive by the cache while their result is cached
+    so that their identities cannot be reused.
+    """
+
+    def decorator(operation):
+        cache = LRUCache(maxsize)
+        _caches.append(cache)
+
+        @functools.wraps(operation)
+        def wrapper(self, other):
+            key = (id(self), id(other))
+            entry = cache.get(key)
+            if entry is not None:
+                return entry[2]
+
+            result = operation(self, other)
+            cache.set(key, (self, other, result))
+
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def clear_caches():  # type: () -> None
+    for cache in _caches:
+        cache.clear()
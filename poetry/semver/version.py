@@ -2,6 +2,7 @@ import re
 
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
 from .empty_constraint import EmptyConstraint
@@ -94,6 +95,19 @@ class Version(VersionRange):
 
             self._build = self._split_parts(build)
 
+        # Comparisons are by far the most frequent operations on versions
+        # so we precompute a key which can be compared directly.
+        self._key = (
+            self._major,
+            self._minor,
+            self._patch,
+            self._rest,
+            # Pre-releases always come before no pre-release string.
+            (0, self._key_parts(self._prerelease)) if self._prerelease else (1,),
+            # Builds always come after no build string.
+            (1, self._key_parts(self._build)) if self._build else (0,),
+        )
+
     @property
     def major(self):  # type: () -> int
         return self._major
@@ -341,16 +355,37 @@ class Version(VersionRange):
 
         return parts
 
+    def _key_parts(
+        self, parts
+    ):  # type: (List[Union[str, int]]) -> Tuple[Tuple[int, Union[str, int]], ...]
+        # Numeric parts come before alphanumeric ones
+        # and missing parts come before present ones.
+        return tuple(
+            (0, part) if isinstance(part, int) else (1, part) for part in parts
+        )
+
     def __lt__(self, other):
+        if isinstance(other, Version):
+            return self._key < other._key
+
         return self._cmp(other) < 0
 
     def __le__(self, other):
+        if isinstance(other, Version):
+            return self._key <= other._key
+
         return self._cmp(other) <= 0
 
     def __gt__(self, other):
+        if isinstance(other, Version):
+            return self._key > other._key
+
         return self._cmp(other) > 0
 
     def __ge__(self, other):
+        if isinstance(other, Version):
+            return self._key >= other._key
+
         return self._cmp(other) >= 0
 
     def _cmp(self, other):
@@ -360,91 +395,18 @@ class Version(VersionRange):
         if not isinstance(other, Version):
             return -other._cmp(self)
 
-        if self.major != other.major:
-            return self._cmp_parts(self.major, other.major)
-
-        if self.minor != other.minor:
-            return self._cmp_parts(self.minor, other.minor)
-
-        if self.patch != other.patch:
-            return self._cmp_parts(self.patch, other.patch)
-
-        if self.rest != other.rest:
-            return self._cmp_parts(self.rest, other.rest)
-
-        # Pre-releases always come before no pre-release string.
-        if not self.is_prerelease() and other.is_prerelease():
-            return 1
-
-        if not other.is_prerelease() and self.is_prerelease():
-            return -1
-
-        comparison = self._cmp_lists(self.prerelease, other.prerelease)
-        if comparison != 0:
-            return comparison
-
-        # Builds always come after no build string.
-        if not self.build and other.build:
-            return -1
-
-        if not other.build and self.build:
-            return 1
-
-        return self._cmp_lists(self.build, other.build)
-
-    def _cmp_parts(self, a, b):
-        if a < b:
+        if self._key < other._key:
             return -1
-        elif a > b:
+        elif self._key > other._key:
             return 1
 
         return 0
 
-    def _cmp_lists(self, a, b):  # type: (List, List) -> int
-        for i in range(max(len(a), len(b))):
-            a_part = None
-            if i < len(a):
-                a_part = a[i]
-
-            b_part = None
-            if i < len(b):
-                b_part = b[i]
-
-            if a_part == b_part:
-                continue
-
-            # Missing parts come after present ones.
-            if a_part is None:
-                return -1
-
-            if b_part is None:
-                return 1
-
-            if isinstance(a_part, int):
-                if isinstance(b_part, int):
-                    return self._cmp_parts(a_part, b_part)
-
-                return -1
-            else:
-                if isinstance(b_part, int):
-                    return 1
-
-                return self._cmp_parts(a_part, b_part)
-
-        return 0
-
     def __eq__(self, other):  # type: (Version) -> bool
         if not isinstance(other, Version):
             return NotImplemented
 
-        return (
-            self._major == other.major
-            and self._minor == other.minor
-            and self._patch == other.patch
-            and self._rest == other.rest
-            and self._prerelease == other.prerelease
-            and self._build == other.build
-        )
+        return self._key == other._key
 
     def __ne__(self, other):
         return not self == other
@@ -456,12 +418,4 @@ class Version(VersionRange):
         return "<Version {}>".format(str(self))
 
     def __hash__(self):
-        return hash(
-            (
-                self.major,
-                self.minor,
-                self.patch,
-                ".".join(str(p) for p in self.prerelease),
-                ".".join(str(p) for p in self.build),
-            )
-        )
+        return hash(self._key)
@@ -1,6 +1,7 @@
 from typing import List
 
 from .empty_constraint import EmptyConstraint
+from .memoize import memoize_operation
 from .version_constraint import VersionConstraint
 from .version_union import VersionUnion
 
@@ -77,6 +78,7 @@ class VersionRange(VersionConstraint):
 
         return True
 
+    @memoize_operation()
     def allows_all(self, other):  # type: (VersionConstraint) -> bool
         from .version import Version
 
@@ -94,6 +96,7 @@ class VersionRange(VersionConstraint):
 
         raise ValueError("Unknown VersionConstraint type {}.".format(other))
 
+    @memoize_operation()
     def allows_any(self, other):  # type: (VersionConstraint) -> bool
         from .version import Version
 
@@ -113,6 +116,7 @@ class VersionRange(VersionConstraint):
 
         raise ValueError("Unknown VersionConstraint type {}.".format(other))
 
+    @memoize_operation()
     def intersect(self, other):  # type: (VersionConstraint) -> VersionConstraint
         from .version import Version
 
@@ -168,6 +172,7 @@ class VersionRange(VersionConstraint):
             intersect_min, intersect_max, intersect_include_min, intersect_include_max
         )
 
+    @memoize_operation()
     def union(self, other):  # type: (VersionConstraint) -> VersionConstraint
         from .version import Version
 
@@ -220,6 +225,7 @@ class VersionRange(VersionConstraint):
 
         return VersionUnion.of(self, other)
 
+    @memoize_operation()
     def difference(self, other):  # type: (VersionConstraint) -> VersionConstraint
         from .version import Version
 
@@ -1,6 +1,7 @@
 from typing import List
 
 from .empty_constraint import EmptyConstraint
+from .memoize import memoize_operation
 from .version_constraint import VersionConstraint
 
 
@@ -15,6 +16,7 @@ class VersionUnion(VersionConstraint):
 
     def __init__(self, *ranges):
         self._ranges = list(ranges)
+        self._string = None
 
     @property
     def ranges(self):
@@ -77,6 +79,7 @@ class VersionUnion(VersionConstraint):
     def allows(self, version):  # type: ("Version") -> bool
         return any([constraint.allows(version) for constraint in self._ranges])
 
+    @memoize_operation()
     def allows_all(self, other):  # type: (VersionConstraint) -> bool
         our_ranges = iter(self._ranges)
         their_ranges = iter(self._ranges_for(other))
@@ -92,6 +95,7 @@ class VersionUnion(VersionConstraint):
 
         return their_current_range is None
 
+    @memoize_operation()
     def allows_any(self, other):  # type: (VersionConstraint) -> bool
         our_ranges = iter(self._ranges)
         their_ranges = iter(self._ranges_for(other))
@@ -110,6 +114,7 @@ class VersionUnion(VersionConstraint):
 
         return False
 
+    @memoize_operation()
     def intersect(self, other):  # type: (VersionConstraint) -> VersionConstraint
         our_ranges = iter(self._ranges)
         their_ranges = iter(self._ranges_for(other))
@@ -131,9 +136,11 @@ class VersionUnion(VersionConstraint):
 
         return VersionUnion.of(*new_ranges)
 
+    @memoize_operation()
     def union(self, other):  # type: (VersionConstraint) -> VersionConstraint
         return VersionUnion.of(self, other)
 
+    @memoize_operation()
     def difference(self, other):  # type: (VersionConstraint) -> VersionConstraint
         our_ranges = iter(self._ranges)
         their_ranges = iter(self._ranges_for(other))
@@ -243,12 +250,17 @@ class VersionUnion(VersionConstraint):
         return self._ranges == other.ranges
 
     def __str__(self):
+        from .version import Version
         from .version_range import VersionRange
 
-        if self.excludes_single_version():
-            return "!={}".format(VersionRange().difference(self))
+        if self._string is None:
+            excluded = VersionRange().difference(self)
+            if isinstance(excluded, Version):
+                self._string = "!={}".format(excluded)
+            else:
+                self._string = " || ".join([str(r) for r in self._ranges])
 
-        return " || ".join([str(r) for r in self._ranges])
+        return self._string
 
     def __repr__(self):
         return "<VersionUnion {}>".format(str(self))
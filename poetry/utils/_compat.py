@@ -26,10 +26,12 @@ except ImportError:
 try:  # Python 2
     long = long
     unicode = unicode
+    unichr = unichr
     basestring = basestring
 except NameError:  # Python 3
     long = int
     unicode = str
+    unichr = chr
     basestring = str
 
 
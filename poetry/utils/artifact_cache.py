@@ -0,0 +1,250 @@
+import hashlib
+import os
+import tempfile
+import threading
+
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from requests import get
+
+from poetry.locations import CACHE_DIR
+from poetry.packages.utils.link import Link
+
+from ._compat import Path
+from .helpers import atomic_write
+from .helpers import safe_rmtree
+
+
+class ArtifactHashMismatch(Exception):
+
+    pass
+
+
+def download_file(url, dest):  # type: (str, str) -> None
+    r = get(url, stream=True)
+    r.raise_for_status()
+
+    with open(dest, "wb") as f:
+        for chunk in r.iter_content(chunk_size=1024):
+            if chunk:
+                f.write(chunk)
+
+
+class ArtifactCache(object):
+    """
+    A content-addressed cache of downloaded distributions.
+
+    Artifacts are stored under their sha256 digest and indexed by their url
+    so that they can be retrieved by either one of them.
+    The least recently used artifacts are evicted
+    once the cache exceeds its maximum size.
+    """
+
+    DEFAULT_MAX_SIZE = 2 * 1024 ** 3
+
+    # The artifacts handed out by this process, which may be in use
+    # by concurrent installations and are therefore never evicted
+    _used = set()
+    _used_lock = threading.Lock()
+
+    def __init__(
+        self, cache_dir=None, max_size=DEFAULT_MAX_SIZE
+    ):  # type: (Optional[Path], int) -> None
+        if cache_dir is None:
+            cache_dir = Path(CACHE_DIR) / "artifacts"
+
+        self._cache_dir = Path(cache_dir)
+        self._max_size = max_size
+
+    @property
+    def cache_dir(self):  # type: () -> Path
+        return self._cache_dir
+
+    def get(
+        self, url, hash=None, download=None
+    ):  # type: (str, Optional[str], Optional[Callable[[str, str], None]]) -> Path
+        """
+        Return the path to the artifact for the given url,
+        downloading it first if it is not already cached.
+
+        The hash, in the <hash name>:<hash value> format,
+        defaults to the one in the url fragment, if any.
+        """
+        link = Link(url)
+        if hash is None and link.hash:
+            hash = "{}:{}".format(link.hash_name, link.hash)
+
+        path = self.find(link.url_without_fragment, hash=hash)
+        if path is not None:
+            return path
+
+        return self._store(link, hash, download or download_file)
+
+    def find(self, url, hash=None):  # type: (str, Optional[str]) -> Optional[Path]
+        """
+        Return the path to the cached artifact for the given url, if any.
+        """
+        hash_name, hash_value = self._split_hash(hash)
+        if hash_name == "sha256":
+            digest = hash_value
+        else:
+            index = self._index_path(url)
+            if not index.exists():
+                return
+
+            digest = index.read_text().strip()
+
+        path = self._artifact_path(digest)
+        if path is None:
+            return
+
+        if hash_name not in {None, "sha256"}:
+            if self._hash(path, hash_name) != hash_value:
+                return
+
+        # Keeping track of the last use of the artifact for eviction
+        os.utime(str(path.parent), None)
+        self._use(path)
+
+        return path
+
+    def _store(
+        self, link, hash, download
+    ):  # type: (Link, Optional[str], Callable[[str, str], None]) -> Path
+        hash_name, hash_value = self._split_hash(hash)
+
+        tmp_root = self._cache_dir / "tmp"
+        tmp_root.mkdir(parents=True, exist_ok=True)
+
+        tmp_dir = Path(tempfile.mkdtemp(dir=str(tmp_root)))
+        try:
+            tmp_path = tmp_dir / link.filename
+            download(link.url, str(tmp_path))
+
+            digest = self._hash(tmp_path, "sha256")
+            if hash_name is not None:
+                actual = digest
+                if hash_name != "sha256":
+                    actual = self._hash(tmp_path, hash_name)
+
+                if actual != hash_value:
+                    raise ArtifactHashMismatch(
+                        "Hash mismatch for {}: expected {}, got {}:{}".format(
+                            link.filename, hash, hash_name, actual
+                        )
+                    )
+
+            path = self._artifact_path(digest)
+            if path is None:
+                directory = self._digest_dir(digest)
+                directory.mkdir(parents=True, exist_ok=True)
+
+                path = directory / link.filename
+                try:
+                    os.rename(str(tmp_path), str(path))
+                except OSError:
+                    # Another process already stored this artifact
+                    if not path.exists():
+                        raise
+
+            self._write_index(link.url_without_fragment, digest)
+        finally:
+            safe_rmtree(str(tmp_dir))
+
+        self._use(path)
+        self.evict(keep=path.parent)
+
+        return path
+
+    def evict(self, keep=None):  # type: (Optional[Path]) -> None
+        """
+        Remove the least recently used artifacts
+        until the cache is within its maximum size.
+
+        The artifacts handed out by this process are kept.
+        """
+        entries = self._entries()
+        size = sum(entry_size for _, _, entry_size in entries)
+        if size <= self._max_size:
+            return
+
+        for _, directory, entry_size in sorted(entries):
+            if size <= self._max_size:
+                break
+
+            if directory == keep or self._is_used(directory):
+                continue
+
+            safe_rmtree(str(directory))
+            size -= entry_size
+
+    def _entries(self):  # type: () -> List[Tuple[float, Path, int]]
+        entries = []
+        root = self._cache_dir / "sha256"
+        if not root.exists():
+            return entries
+
+        for directory in root.glob("*/*/*"):
+            try:
+                last_used = directory.stat().st_mtime
+                size = sum(f.stat().st_size for f in directory.iterdir())
+            except OSError:
+                continue
+
+            entries.append((last_used, directory, size))
+
+        return entries
+
+    def _write_index(self, url, digest):  # type: (str, str) -> None
+        index = self._index_path(url)
+        index.parent.mkdir(parents=True, exist_ok=True)
+
+        atomic_write(index, digest.encode("utf-8"))
+
+    def _use(self, path):  # type: (Path) -> None
+        with self._used_lock:
+            self._used.add(path.parent)
+
+    def _is_used(self, directory):  # type: (Path) -> bool
+        with self._used_lock:
+            return directory in self._used
+
+    def _artifact_path(self, digest):  # type: (str) -> Optional[Path]
+        directory = self._digest_dir(digest)
+        if not directory.exists():
+            return
+
+        for path in directory.iterdir():
+            return path
+
+    def _digest_dir(self, digest):  # type: (str) -> Path
+        return self._cache_dir / "sha256" / digest[:2] / digest[2:4] / digest
+
+    def _index_path(self, url):  # type: (str) -> Path
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+        return self._cache_dir / "urls" / key[:2] / key
+
+    def _split_hash(
+        self, hash
+    ):  # type: (Optional[str]) -> Tuple[Optional[str], Optional[str]]
+        if not hash:
+            return None, None
+
+        if ":" not in hash:
+            return "sha256", hash
+
+        hash_name, hash_value = hash.split(":", 1)
+
+        return hash_name, hash_value
+
+    def _hash(self, path, hash_name):  # type: (Path, str) -> str
+        h = hashlib.new(hash_name)
+        with path.open("rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 64), b""):
+                h.update(chunk)
+
+        return h.hexdigest()
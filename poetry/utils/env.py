@@ -1,5 +1,3 @@
-import base64
-import hashlib
 import json
 import os
 import platform
@@ -30,15 +28,19 @@ from poetry.utils._compat import decode
 from poetry.utils._compat import encode
 from poetry.utils._compat import list_to_shell_command
 from poetry.utils._compat import subprocess
+from poetry.utils.helpers import atomic_write
+from poetry.utils.helpers import generate_env_name
 from poetry.utils.toml_file import TomlFile
 from poetry.version.markers import BaseMarker
+from poetry.version.markers import validate_markers
 
 
-GET_ENVIRONMENT_INFO = """\
+GET_INTERPRETER_INFO = """\
 import json
 import os
 import platform
 import sys
+import sysconfig
 
 if hasattr(sys, "implementation"):
     info = sys.implementation.version
@@ -67,38 +69,37 @@ env = {
     "version_info": tuple(sys.version_info),
 }
 
-print(json.dumps(env))
-"""
-
-
-GET_BASE_PREFIX = """\
-import sys
-
 if hasattr(sys, "real_prefix"):
-    print(sys.real_prefix)
+    base_prefix = sys.real_prefix
 elif hasattr(sys, "base_prefix"):
-    print(sys.base_prefix)
+    base_prefix = sys.base_prefix
 else:
-    print(sys.prefix)
-"""
-
-GET_CONFIG_VAR = """\
-import sysconfig
-
-print(sysconfig.get_config_var("{config_var}")),
-"""
-
-GET_PYTHON_VERSION = """\
-import sys
+    base_prefix = sys.prefix
 
-print('.'.join([str(s) for s in sys.version_info[:3]]))
-"""
-
-GET_SYS_PATH = """\
-import json
-import sys
+config_vars = {}
+for name, value in sysconfig.get_config_vars().items():
+    if value is not None:
+        config_vars[name] = str(value)
 
-print(json.dumps(sys.path))
+try:
+    import pip
+
+    pip_version = pip.__version__
+except Exception:
+    pip_version = None
+
+print(
+    json.dumps(
+        {
+            "marker_env": env,
+            "base_prefix": base_prefix,
+            "sys_path": sys.path,
+            "config_vars": config_vars,
+            "pip_version": pip_version,
+            "purelib": sysconfig.get_paths()["purelib"],
+        }
+    )
+)
 """
 
 CREATE_VENV_COMMAND = """\
@@ -681,12 +682,7 @@ class EnvManager(object):
 
     @classmethod
     def generate_env_name(cls, name, cwd):  # type: (str, str) -> str
-        name = name.lower()
-        sanitized_name = re.sub(r'[ $`!*@"\\\r\n\t]', "_", name)[:42]
-        h = hashlib.sha256(encode(cwd)).digest()
-        h = base64.urlsafe_b64encode(h).decode()[:8]
-
-        return "{}-{}".format(sanitized_name, h)
+        return generate_env_name(name, cwd)
 
 
 class Env(object):
@@ -810,6 +806,9 @@ class Env(object):
     def is_valid_for_marker(self, marker):  # type: (BaseMarker) -> bool
         return marker.validate(self.marker_env)
 
+    def are_valid_for_markers(self, markers):  # type: (List[BaseMarker]) -> List[bool]
+        return validate_markers(markers, self.marker_env)
+
     def is_sane(self):  # type: () -> bool
         """
         Checks whether the current environment is sane or not.
@@ -977,26 +976,40 @@ class VirtualEnv(Env):
     A virtual Python environment.
     """
 
+    # The file, at the root of the environment, in which the information
+    # retrieved from its interpreter is persisted.
+    INFO_FILE = ".poetry-interpreter.json"
+
     def __init__(self, path, base=None):  # type: (Path, Optional[Path]) -> None
         super(VirtualEnv, self).__init__(path, base)
 
+        self._info = None
+
         # If base is None, it probably means this is
         # a virtualenv created from VIRTUAL_ENV.
         # In this case we need to get sys.base_prefix
         # from inside the virtualenv.
         if base is None:
-            self._base = Path(self.run("python", "-", input_=GET_BASE_PREFIX).strip())
+            self._base = Path(self.info["base_prefix"])
 
     @property
-    def sys_path(self):  # type: () -> List[str]
-        output = self.run("python", "-", input_=GET_SYS_PATH)
+    def info(self):  # type: () -> Dict[str, Any]
+        """
+        Information about the interpreter of the environment,
+        retrieved by a single run of the interpreter
+        and persisted until the interpreter or its site-packages change.
+        """
+        if self._info is None or not self._is_info_fresh(self._info):
+            self._info = self._load_info()
 
-        return json.loads(output)
+        return self._info
 
-    def get_version_info(self):  # type: () -> Tuple[int]
-        output = self.run("python", "-", input_=GET_PYTHON_VERSION)
+    @property
+    def sys_path(self):  # type: () -> List[str]
+        return self.info["sys_path"]
 
-        return tuple([int(s) for s in output.strip().split(".")])
+    def get_version_info(self):  # type: () -> Tuple[int]
+        return tuple(self.info["marker_env"]["version_info"][:3])
 
     def get_python_implementation(self):  # type: () -> str
         return self.marker_env["platform_python_implementation"]
@@ -1007,22 +1020,16 @@ class VirtualEnv(Env):
         return [self._bin("pip")]
 
     def get_marker_env(self):  # type: () -> Dict[str, Any]
-        output = self.run("python", "-", input_=GET_ENVIRONMENT_INFO)
-
-        return json.loads(output)
+        return dict(self.info["marker_env"])
 
     def config_var(self, var):  # type: (str) -> Any
-        try:
-            value = self.run(
-                "python", "-", input_=GET_CONFIG_VAR.format(config_var=var)
-            ).strip()
-        except EnvCommandError as e:
-            warnings.warn("{0}".format(e), RuntimeWarning)
-            return None
+        value = self.info["config_vars"].get(var)
+        if isinstance(value, int):
+            # Information persisted by earlier versions kept integers as is
+            value = str(value)
 
-        if value == "None":
-            value = None
-        elif value == "1":
+        # Config variables are retrieved as strings, except for flags
+        if value == "1":
             value = 1
         elif value == "0":
             value = 0
@@ -1030,6 +1037,9 @@ class VirtualEnv(Env):
         return value
 
     def get_pip_version(self):  # type: () -> Version
+        if self.info["pip_version"] is not None:
+            return Version.parse(self.info["pip_version"])
+
         output = self.run_pip("--version").strip()
         m = re.match("pip (.+?)(?: from .+)?$", output)
         if not m:
@@ -1044,6 +1054,59 @@ class VirtualEnv(Env):
         # A virtualenv is considered sane if both "python" and "pip" exist.
         return os.path.exists(self._bin("python")) and os.path.exists(self._bin("pip"))
 
+    def _load_info(self):  # type: () -> Dict[str, Any]
+        info_file = self._path / self.INFO_FILE
+        if info_file.exists():
+            try:
+                info = json.loads(info_file.read_text(encoding="utf-8"))
+            except ValueError:
+                info = None
+
+            if info is not None and "key" in info and self._is_info_fresh(info):
+                return info
+
+        info = json.loads(self.run("python", "-", input_=GET_INTERPRETER_INFO))
+
+        key = self._get_info_key(info.get("purelib"))
+        if key is not None:
+            info["key"] = key
+
+            try:
+                atomic_write(info_file, encode(json.dumps(info)))
+            except (IOError, OSError):
+                # The environment might not be writable,
+                # in which case the information will be retrieved again next time.
+                pass
+
+        return info
+
+    def _is_info_fresh(self, info):  # type: (Dict[str, Any]) -> bool
+        if "key" not in info:
+            # The information has not been persisted
+            # so it is only valid for the lifetime of this object.
+            return True
+
+        return info["key"] == self._get_info_key(info.get("purelib"))
+
+    def _get_info_key(self, purelib):  # type: (Optional[str]) -> Optional[List]
+        """
+        Returns what identifies the interpreter of the environment:
+        the path, modification time and inode of its binary,
+        along with the modification time of its site-packages
+        since installing packages changes its sys.path and pip version.
+        """
+        python = self.python
+        try:
+            stat = os.stat(python)
+        except OSError:
+            return
+
+        purelib_mtime = None
+        if purelib and os.path.isdir(purelib):
+            purelib_mtime = os.stat(purelib).st_mtime
+
+        return [python, stat.st_mtime, stat.st_ino, purelib_mtime]
+
     def _run(self, cmd, **kwargs):
         with self.temp_environ():
             os.environ["PATH"] = self._updated_path()
@@ -1,7 +1,11 @@
+import base64
+import hashlib
 import os
+import platform
 import re
 import shutil
 import stat
+import sys
 import tempfile
 
 from contextlib import contextmanager
@@ -10,6 +14,7 @@ from typing import Optional
 
 from poetry.config.config import Config
 from poetry.utils._compat import Path
+from poetry.utils._compat import encode
 from poetry.version import Version
 
 
@@ -30,6 +35,26 @@ def module_name(name):  # type: (str) -> str
     return canonicalize_name(name).replace(".", "_").replace("-", "_")
 
 
+def generate_env_name(name, cwd):  # type: (str, str) -> str
+    name = name.lower()
+    sanitized_name = re.sub(r'[ $`!*@"\\\r\n\t]', "_", name)[:42]
+    h = hashlib.sha256(encode(cwd)).digest()
+    h = base64.urlsafe_b64encode(h).decode()[:8]
+
+    return "{}-{}".format(sanitized_name, h)
+
+
+def interpreter_tag():  # type: () -> str
+    """
+    Returns the implementation and version of the running interpreter,
+    for instance cpython-3.8.1.
+    """
+    return "{}-{}".format(
+        platform.python_implementation().lower(),
+        ".".join(str(v) for v in sys.version_info[:3]),
+    )
+
+
 def normalize_version(version):  # type: (str) -> str
     return str(Version(version))
 
@@ -114,6 +139,28 @@ def _on_rm_error(func, path, exc_info):
     func(path)
 
 
+def atomic_write(path, content):  # type: (Path, bytes) -> None
+    """
+    Writes the given content to a temporary file which then replaces the file,
+    so that the file is never seen partially written.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+
+        try:
+            getattr(os, "replace", os.rename)(tmp_path, str(path))
+        except OSError:
+            # On Python 2, Windows does not allow overwriting files while renaming
+            # in which case the existing file is kept
+            if not path.exists():
+                raise
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
 def safe_rmtree(path):
     if Path(path).is_symlink():
         return os.unlink(str(path))
@@ -1,19 +1,21 @@
 import logging
 import os
+import shutil
 import tarfile
 import zipfile
 
 from bz2 import BZ2File
 from gzip import GzipFile
+from typing import IO
 from typing import Dict
 from typing import List
+from typing import Optional
 from typing import Union
 
 import pkginfo
 
-from requests import get
-
 from ._compat import Path
+from .artifact_cache import ArtifactCache
 from .helpers import parse_requires
 from .setup_reader import SetupReader
 from .toml_file import TomlFile
@@ -29,13 +31,7 @@ class Inspector:
 
     @classmethod
     def download(cls, url, dest):  # type: (str, Path) -> None
-        r = get(url, stream=True)
-        r.raise_for_status()
-
-        with open(str(dest), "wb") as f:
-            for chunk in r.iter_content(chunk_size=1024):
-                if chunk:
-                    f.write(chunk)
+        shutil.copyfile(str(ArtifactCache().get(url)), str(dest))
 
     def inspect(self, file_path):  # type: (Path) -> Dict[str, Union[str, List[str]]]
         if file_path.suffix == ".whl":
@@ -46,6 +42,47 @@ class Inspector:
     def inspect_wheel(
         self, file_path
     ):  # type: (Path) -> Dict[str, Union[str, List[str]]]
+        try:
+            meta = pkginfo.Wheel(str(file_path))
+        except ValueError:
+            # Unable to determine dependencies
+            # Assume none
+            meta = None
+
+        return self._get_wheel_info(meta)
+
+    def inspect_wheel_archive(
+        self, fp
+    ):  # type: (IO[bytes]) -> Dict[str, Union[str, List[str]]]
+        """
+        Inspects a wheel from a seekable file object,
+        only reading the archive members holding the metadata.
+        """
+        meta = None
+
+        try:
+            with zipfile.ZipFile(fp) as archive:
+                for name in archive.namelist():
+                    parts = name.split("/")
+                    if (
+                        len(parts) == 2
+                        and parts[0].endswith(".dist-info")
+                        and parts[1] == "METADATA"
+                    ):
+                        meta = pkginfo.Distribution()
+                        meta.parse(archive.read(name))
+
+                        break
+        except zipfile.BadZipfile:
+            # Unable to determine dependencies
+            # Assume none
+            pass
+
+        return self._get_wheel_info(meta)
+
+    def _get_wheel_info(
+        self, meta
+    ):  # type: (Optional[pkginfo.Distribution]) -> Dict[str, Union[str, List[str]]]
         info = {
             "name": "",
             "version": "",
@@ -54,11 +91,7 @@ class Inspector:
             "requires_dist": [],
         }
 
-        try:
-            meta = pkginfo.Wheel(str(file_path))
-        except ValueError:
-            # Unable to determine dependencies
-            # Assume none
+        if meta is None:
             return info
 
         if meta.name:
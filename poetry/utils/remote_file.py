@@ -0,0 +1,210 @@
+import re
+import tempfile
+
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import requests
+
+
+class RangeRequestsUnsupported(Exception):
+
+    pass
+
+
+class LazyRemoteFile(object):
+    """
+    A read-only, seekable file-like object for a remote file
+    which only retrieves the parts that are actually read
+    by using HTTP range requests.
+
+    The retrieved parts are stored in a sparse temporary file.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(
+        self, url, session=None, chunk_size=CHUNK_SIZE, timeout=None
+    ):  # type: (str, Optional[requests.Session], int, Optional[float]) -> None
+        self._url = url
+        self._session = session or requests.session()
+        self._chunk_size = chunk_size
+        self._timeout = timeout
+        self._file = tempfile.TemporaryFile()
+        self._intervals = []  # type: List[Tuple[int, int]]
+        self._position = 0
+
+        try:
+            # The end of the file holds the central directory of zip archives
+            # so we retrieve it right away, which also tells us
+            # the size of the file and whether range requests are supported.
+            self._length = self._fetch_tail()
+        except Exception:
+            self._file.close()
+
+            raise
+
+    @property
+    def url(self):  # type: () -> str
+        return self._url
+
+    def __len__(self):  # type: () -> int
+        return self._length
+
+    def __enter__(self):  # type: () -> LazyRemoteFile
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def closed(self):  # type: () -> bool
+        return self._file.closed
+
+    def close(self):  # type: () -> None
+        self._file.close()
+
+    def readable(self):  # type: () -> bool
+        return True
+
+    def seekable(self):  # type: () -> bool
+        return True
+
+    def writable(self):  # type: () -> bool
+        return False
+
+    def tell(self):  # type: () -> int
+        return self._position
+
+    def seek(self, offset, whence=0):  # type: (int, int) -> int
+        if whence == 0:
+            position = offset
+        elif whence == 1:
+            position = self._position + offset
+        elif whence == 2:
+            position = self._length + offset
+        else:
+            raise ValueError("Invalid whence ({})".format(whence))
+
+        if position < 0:
+            raise ValueError("Negative seek position {}".format(position))
+
+        self._position = position
+
+        return self._position
+
+    def read(self, size=-1):  # type: (int) -> bytes
+        start = self._position
+        if size is None or size < 0:
+            end = self._length
+        else:
+            end = min(start + size, self._length)
+
+        if start >= end:
+            return b""
+
+        for gap_start, gap_end in self._gaps(start, end):
+            # Retrieving at least a chunk to avoid
+            # a request for each small read.
+            self._fetch(
+                gap_start, min(max(gap_end, gap_start + self._chunk_size), self._length)
+            )
+
+        self._file.seek(start)
+        data = self._file.read(end - start)
+        self._position = end
+
+        return data
+
+    def _fetch_tail(self):  # type: () -> int
+        response = self._request("bytes=-{}".format(self._chunk_size))
+
+        try:
+            m = re.match(
+                r"^bytes (\d+)-(\d+)/(\d+)$",
+                response.headers.get("Content-Range", "").strip(),
+            )
+            if m is None:
+                raise RangeRequestsUnsupported(
+                    "Invalid Content-Range header for {}".format(self._url)
+                )
+
+            self._write(int(m.group(1)), response)
+        finally:
+            response.close()
+
+        return int(m.group(3))
+
+    def _fetch(self, start, end):  # type: (int, int) -> None
+        response = self._request("bytes={}-{}".format(start, end - 1))
+
+        try:
+            self._write(start, response)
+        finally:
+            response.close()
+
+    def _request(self, byte_range):  # type: (str) -> requests.Response
+        response = self._session.get(
+            self._url,
+            headers={"Range": byte_range, "Accept-Encoding": "identity"},
+            stream=True,
+            timeout=self._timeout,
+        )
+
+        if response.status_code != 206:
+            # The server either ignored the range and is sending the whole file,
+            # or refused it (416, 403, 501...), in which case
+            # the whole file is still expected to be downloadable.
+            response.close()
+
+            raise RangeRequestsUnsupported(
+                "Unexpected status code {} for a range request on {}".format(
+                    response.status_code, self._url
+                )
+            )
+
+        return response
+
+    def _write(self, start, response):  # type: (int, requests.Response) -> None
+        self._file.seek(start)
+
+        end = start
+        for chunk in response.iter_content(chunk_size=self._chunk_size):
+            if chunk:
+                self._file.write(chunk)
+                end += len(chunk)
+
+        self._add_interval(start, end)
+
+    def _add_interval(self, start, end):  # type: (int, int) -> None
+        intervals = []
+        for interval_start, interval_end in sorted(self._intervals + [(start, end)]):
+            if intervals and interval_start <= intervals[-1][1]:
+                intervals[-1] = (intervals[-1][0], max(intervals[-1][1], interval_end))
+            else:
+                intervals.append((interval_start, interval_end))
+
+        self._intervals = intervals
+
+    def _gaps(self, start, end):  # type: (int, int) -> List[Tuple[int, int]]
+        """
+        Returns the parts of the given range that have not been retrieved yet.
+        """
+        gaps = []
+        for interval_start, interval_end in self._intervals:
+            if interval_end <= start:
+                continue
+
+            if interval_start >= end:
+                break
+
+            if interval_start > start:
+                gaps.append((start, interval_start))
+
+            start = max(start, interval_end)
+
+        if start < end:
+            gaps.append((start, end))
+
+        return gaps
@@ -0,0 +1,248 @@
+"""
+A fast, read-only reader for the subset of TOML used by the files
+written by Poetry, like the lock file.
+
+Contrary to tomlkit, it does not keep track of the style of the document
+and returns plain values. Anything outside of the supported subset
+(multiline strings, floats, dates, dotted keys) raises a TOMLReaderError
+so that the caller can fall back on tomlkit.
+"""
+import re
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from ._compat import unichr
+
+
+class TOMLReaderError(ValueError):
+    def __init__(self, string, pos, message):  # type: (str, int, str) -> None
+        line = string.count("\n", 0, pos) + 1
+        column = pos - string.rfind("\n", 0, pos)
+
+        super(TOMLReaderError, self).__init__(
+            "{} at line {} col {}".format(message, line, column)
+        )
+
+
+_BLANK_RE = re.compile(r"(?:[ \t\r\n]|#[^\n]*)*")
+_WHITESPACE_RE = re.compile(r"[ \t]*")
+_LINE_END_RE = re.compile(r"[ \t]*(?:#[^\n]*)?(?:\r?\n|$)")
+_BARE_KEY_RE = re.compile(r"[A-Za-z0-9_-]+")
+_BASIC_STRING_RE = re.compile(
+    r'"((?:[^"\\\n\r]|\\[btnfr"\\]|\\u[0-9A-Fa-f]{4}|\\U[0-9A-Fa-f]{8})*)"'
+)
+_LITERAL_STRING_RE = re.compile(r"'([^'\n\r]*)'")
+_ESCAPE_RE = re.compile(r"\\(?:([btnfr\"\\])|u([0-9A-Fa-f]{4})|U([0-9A-Fa-f]{8}))")
+_BOOLEAN_RE = re.compile(r"(true|false)(?![A-Za-z0-9_.:-])")
+_INTEGER_RE = re.compile(r"[+-]?(?:0|[1-9](?:_?[0-9])*)(?![A-Za-z0-9_.:-])")
+
+_ESCAPES = {
+    "b": "\b",
+    "t": "\t",
+    "n": "\n",
+    "f": "\f",
+    "r": "\r",
+    '"': '"',
+    "\\": "\\",
+}
+
+
+def loads(string):  # type: (str) -> Dict[str, Any]
+    data = {}
+    current = data
+    # Tables explicitly defined by a header and arrays of tables,
+    # identified by their id, to tell them apart from implicit
+    # tables and static arrays.
+    tables = set()
+    arrays = set()
+
+    pos = 0
+    end = len(string)
+    while True:
+        pos = _BLANK_RE.match(string, pos).end()
+        if pos >= end:
+            break
+
+        if string.startswith("[[", pos):
+            keys, pos = _parse_header(string, pos + 2, "]]")
+            parent = _get_table(string, pos, data, keys[:-1], arrays)
+            array = parent.get(keys[-1])
+            if array is None:
+                array = parent[keys[-1]] = []
+                arrays.add(id(array))
+            elif id(array) not in arrays:
+                raise TOMLReaderError(string, pos, "Invalid array of tables")
+
+            current = {}
+            array.append(current)
+            tables.add(id(current))
+        elif string.startswith("[", pos):
+            keys, pos = _parse_header(string, pos + 1, "]")
+            current = _get_table(string, pos, data, keys, arrays)
+            if id(current) in tables:
+                raise TOMLReaderError(string, pos, "Table already defined")
+
+            tables.add(id(current))
+        else:
+            _, pos = _parse_key_value(string, pos, current)
+
+        m = _LINE_END_RE.match(string, pos)
+        if m is None:
+            raise TOMLReaderError(string, pos, "Expected a new line")
+
+        pos = m.end()
+
+    return data
+
+
+def _get_table(
+    string, pos, data, keys, arrays
+):  # type: (str, int, Dict[str, Any], List[str], set) -> Dict[str, Any]
+    table = data
+    for key in keys:
+        value = table.get(key)
+        if value is None:
+            value = table[key] = {}
+        elif id(value) in arrays:
+            value = value[-1]
+        elif not isinstance(value, dict):
+            raise TOMLReaderError(string, pos, "Key {} is not a table".format(key))
+
+        table = value
+
+    return table
+
+
+def _parse_header(string, pos, closing):  # type: (str, int, str) -> Tuple[list, int]
+    keys = []
+    while True:
+        pos = _WHITESPACE_RE.match(string, pos).end()
+        key, pos = _parse_key(string, pos)
+        keys.append(key)
+
+        pos = _WHITESPACE_RE.match(string, pos).end()
+        if string.startswith(closing, pos):
+            return keys, pos + len(closing)
+
+        if not string.startswith(".", pos):
+            raise TOMLReaderError(string, pos, "Invalid table header")
+
+        pos += 1
+
+
+def _parse_key(string, pos):  # type: (str, int) -> Tuple[str, int]
+    m = _BARE_KEY_RE.match(string, pos)
+    if m:
+        return m.group(), m.end()
+
+    if string.startswith('"', pos) or string.startswith("'", pos):
+        return _parse_string(string, pos)
+
+    raise TOMLReaderError(string, pos, "Invalid key")
+
+
+def _parse_key_value(
+    string, pos, table
+):  # type: (str, int, Dict[str, Any]) -> Tuple[str, int]
+    key, pos = _parse_key(string, pos)
+    pos = _WHITESPACE_RE.match(string, pos).end()
+    if not string.startswith("=", pos):
+        raise TOMLReaderError(string, pos, "Expected '='")
+
+    pos = _WHITESPACE_RE.match(string, pos + 1).end()
+    if key in table:
+        raise TOMLReaderError(string, pos, "Key {} already defined".format(key))
+
+    table[key], pos = _parse_value(string, pos)
+
+    return key, pos
+
+
+def _parse_value(string, pos):  # type: (str, int) -> Tuple[Any, int]
+    c = string[pos : pos + 1]
+    if c == '"' or c == "'":
+        return _parse_string(string, pos)
+
+    if c == "[":
+        return _parse_array(string, pos + 1)
+
+    if c == "{":
+        return _parse_inline_table(string, pos + 1)
+
+    m = _BOOLEAN_RE.match(string, pos)
+    if m:
+        return m.group() == "true", m.end()
+
+    m = _INTEGER_RE.match(string, pos)
+    if m:
+        return int(m.group().replace("_", "")), m.end()
+
+    raise TOMLReaderError(string, pos, "Unsupported value")
+
+
+def _parse_string(string, pos):  # type: (str, int) -> Tuple[str, int]
+    if string.startswith('"""', pos) or string.startswith("'''", pos):
+        raise TOMLReaderError(string, pos, "Unsupported multiline string")
+
+    if string.startswith("'", pos):
+        m = _LITERAL_STRING_RE.match(string, pos)
+        if m is None:
+            raise TOMLReaderError(string, pos, "Invalid string")
+
+        return m.group(1), m.end()
+
+    m = _BASIC_STRING_RE.match(string, pos)
+    if m is None:
+        raise TOMLReaderError(string, pos, "Invalid string")
+
+    value = m.group(1)
+    if "\\" in value:
+        value = _ESCAPE_RE.sub(_unescape, value)
+
+    return value, m.end()
+
+
+def _unescape(m):  # type: (re.Match) -> str
+    if m.group(1):
+        return _ESCAPES[m.group(1)]
+
+    return unichr(int(m.group(2) or m.group(3), 16))
+
+
+def _parse_array(string, pos):  # type: (str, int) -> Tuple[list, int]
+    array = []
+    while True:
+        pos = _BLANK_RE.match(string, pos).end()
+        if string.startswith("]", pos):
+            return array, pos + 1
+
+        value, pos = _parse_value(string, pos)
+        array.append(value)
+
+        pos = _BLANK_RE.match(string, pos).end()
+        if string.startswith(",", pos):
+            pos += 1
+        elif not string.startswith("]", pos):
+            raise TOMLReaderError(string, pos, "Expected ',' or ']'")
+
+
+def _parse_inline_table(string, pos):  # type: (str, int) -> Tuple[dict, int]
+    table = {}
+    pos = _WHITESPACE_RE.match(string, pos).end()
+    if string.startswith("}", pos):
+        return table, pos + 1
+
+    while True:
+        _, pos = _parse_key_value(string, pos, table)
+
+        pos = _WHITESPACE_RE.match(string, pos).end()
+        if string.startswith("}", pos):
+            return table, pos + 1
+
+        if not string.startswith(",", pos):
+            raise TOMLReaderError(string, pos, "Expected ',' or '}'")
+
+        pos = _WHITESPACE_RE.match(string, pos + 1).end()
@@ -0,0 +1,173 @@
+import hashlib
+import json
+import os
+import re
+import tempfile
+
+from typing import Any
+from typing import Dict
+from typing import Optional
+
+from poetry.locations import CACHE_DIR
+from poetry.utils._compat import CalledProcessError
+from poetry.utils._compat import Path
+from poetry.utils.helpers import atomic_write
+from poetry.utils.helpers import interpreter_tag
+from poetry.utils.helpers import safe_rmtree
+
+from .git import Git
+
+
+COMMIT_HASH_REGEX = re.compile(r"^[0-9a-f]{7,40}$")
+
+
+class GitCache(object):
+    """
+    A persistent cache of the git repositories of VCS dependencies.
+
+    Each repository is mirrored once as a bare repository
+    which is only fetched again when a reference has to be resolved:
+    a commit hash already known to the mirror needs no network access.
+    Working copies of revisions are cloned from the mirror,
+    and the metadata of the packages they contain
+    can be cached by commit hash and interpreter.
+    """
+
+    def __init__(self, cache_dir=None):  # type: (Optional[Path]) -> None
+        if cache_dir is None:
+            cache_dir = Path(CACHE_DIR) / "git"
+
+        self._cache_dir = Path(cache_dir)
+        self._git = None
+        self._fetched = set()
+
+    @property
+    def cache_dir(self):  # type: () -> Path
+        return self._cache_dir
+
+    @property
+    def git(self):  # type: () -> Git
+        if self._git is None:
+            self._git = Git()
+
+        return self._git
+
+    def revision(self, url, reference=None):  # type: (str, Optional[str]) -> str
+        """
+        Return the commit hash the given reference points to,
+        fetching the repository only if the mirror cannot tell.
+        """
+        mirror = self._mirror(url)
+
+        if reference is not None and COMMIT_HASH_REGEX.match(reference):
+            try:
+                self._run(mirror, "cat-file", "-e", reference + "^{commit}")
+            except CalledProcessError:
+                pass
+            else:
+                if len(reference) == 40:
+                    return reference
+
+                return self._run(mirror, "rev-parse", reference)
+
+        self._fetch(mirror)
+
+        return self._run(mirror, "rev-parse", reference or "HEAD")
+
+    def export(self, url, reference, dest):  # type: (str, Optional[str], Path) -> str
+        """
+        Clone the repository in the given directory, from the mirror,
+        and check out the given reference.
+
+        Return the commit hash of the reference.
+        """
+        revision = self.revision(url, reference)
+        mirror = self._mirror(url)
+
+        args = ["clone", "--quiet"]
+        if reference is not None:
+            args.append("--no-checkout")
+
+        self.git.run(*(args + [mirror.as_posix(), dest.as_posix()]))
+        self.git.run("remote", "set-url", "origin", url, folder=dest)
+
+        if reference is not None:
+            self.git.run("checkout", "--quiet", reference, folder=dest)
+
+        return revision
+
+    def metadata(self, url, revision):  # type: (str, str) -> Optional[Dict[str, Any]]
+        """
+        Return the metadata stored for the given revision, if any.
+        """
+        path = self._metadata_path(url, revision)
+        if not path.exists():
+            return
+
+        with path.open(encoding="utf-8") as f:
+            return json.load(f)
+
+    def store_metadata(
+        self, url, revision, metadata
+    ):  # type: (str, str, Dict[str, Any]) -> None
+        path = self._metadata_path(url, revision)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        atomic_write(path, json.dumps(metadata, sort_keys=True).encode("utf-8"))
+
+    def _mirror(self, url):  # type: (str) -> Path
+        path = self._cache_dir / "mirrors" / self._key(url)
+        if path.exists():
+            return path
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_dir = Path(tempfile.mkdtemp(dir=str(path.parent), suffix=".tmp"))
+        try:
+            self.git.run("clone", "--quiet", "--bare", url, tmp_dir.as_posix())
+            self._run(
+                tmp_dir, "config", "remote.origin.fetch", "+refs/heads/*:refs/heads/*"
+            )
+
+            try:
+                os.rename(str(tmp_dir), str(path))
+            except OSError:
+                # Another process already mirrored this repository
+                if not path.exists():
+                    raise
+        finally:
+            if tmp_dir.exists():
+                safe_rmtree(str(tmp_dir))
+
+        self._fetched.add(path)
+
+        return path
+
+    def _fetch(self, mirror):  # type: (Path) -> None
+        if mirror in self._fetched:
+            return
+
+        self._run(mirror, "fetch", "--quiet", "--prune", "--tags", "origin")
+        self._fetched.add(mirror)
+
+    def _run(self, mirror, *args):  # type: (Path, *str) -> str
+        return self.git.run("--git-dir", mirror.as_posix(), *args)
+
+    def _metadata_path(self, url, revision):  # type: (str, str) -> Path
+        # The metadata of non-Poetry projects is retrieved by running setup.py
+        # so it depends on the interpreter
+        return (
+            self._cache_dir
+            / "metadata"
+            / self._key(url)
+            / interpreter_tag()
+            / (revision + ".json")
+        )
+
+    def _key(self, url):  # type: (str) -> str
+        name = re.sub(r"\.git$", "", url.rstrip("/").split("/")[-1])
+        name = re.sub(r"[^\w.-]", "_", name)
+
+        return "{}-{}".format(
+            name, hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+        )
@@ -1,18 +1,14 @@
 import re
 
 from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import Iterable
 from typing import Iterator
 from typing import List
+from typing import Tuple
 
-from pyparsing import Forward
-from pyparsing import Group
-from pyparsing import Literal as L  # noqa
-from pyparsing import ParseResults
-from pyparsing import QuotedString
-from pyparsing import ZeroOrMore
-from pyparsing import stringEnd
-from pyparsing import stringStart
+from poetry.utils._compat import lru_cache
 
 
 class InvalidMarker(ValueError):
@@ -63,26 +59,26 @@ class Op(Node):
         return str(self)
 
 
-VARIABLE = (
-    L("implementation_version")
-    | L("platform_python_implementation")
-    | L("implementation_name")
-    | L("python_full_version")
-    | L("platform_release")
-    | L("platform_version")
-    | L("platform_machine")
-    | L("platform_system")
-    | L("python_version")
-    | L("sys_platform")
-    | L("os_name")
-    | L("os.name")
-    | L("sys.platform")  # PEP-345
-    | L("platform.version")  # PEP-345
-    | L("platform.machine")  # PEP-345
-    | L("platform.python_implementation")  # PEP-345
-    | L("python_implementation")  # PEP-345
-    | L("extra")  # undocumented setuptools legacy
-)
+VARIABLES = [
+    "implementation_version",
+    "platform_python_implementation",
+    "implementation_name",
+    "python_full_version",
+    "platform_release",
+    "platform_version",
+    "platform_machine",
+    "platform_system",
+    "python_version",
+    "sys_platform",
+    "os_name",
+    "os.name",
+    "sys.platform",  # PEP-345
+    "platform.version",  # PEP-345
+    "platform.machine",  # PEP-345
+    "platform.python_implementation",  # PEP-345
+    "python_implementation",  # PEP-345
+    "extra",  # undocumented setuptools legacy
+]
 ALIASES = {
     "os.name": "os_name",
     "sys.platform": "sys_platform",
@@ -91,43 +87,89 @@ ALIASES = {
     "platform.python_implementation": "platform_python_implementation",
     "python_implementation": "platform_python_implementation",
 }
-VARIABLE.setParseAction(lambda s, l, t: Variable(ALIASES.get(t[0], t[0])))
 
-VERSION_CMP = (
-    L("===") | L("==") | L(">=") | L("<=") | L("!=") | L("~=") | L(">") | L("<")
-)
+# The first matching alternative wins, so longer operators come first.
+_VARIABLE_RE = re.compile("|".join(re.escape(v) for v in VARIABLES))
+_VALUE_RE = re.compile(r"'([^'\n\r]*)'|\"([^\"\n\r]*)\"")
+_OP_RE = re.compile(r"===|==|>=|<=|!=|~=|>|<|not in|in")
+_BOOLOP_RE = re.compile(r"and|or")
+_WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+_WHITESPACE_ESCAPES = [("\\t", "\t"), ("\\n", "\n"), ("\\f", "\f"), ("\\r", "\r")]
 
-MARKER_OP = VERSION_CMP | L("not in") | L("in")
-MARKER_OP.setParseAction(lambda s, l, t: Op(t[0]))
 
-MARKER_VALUE = QuotedString("'") | QuotedString('"')
-MARKER_VALUE.setParseAction(lambda s, l, t: Value(t[0]))
+def _skip_whitespace(string, pos):  # type: (str, int) -> int
+    return _WHITESPACE_RE.match(string, pos).end()
 
-BOOLOP = L("and") | L("or")
 
-MARKER_VAR = VARIABLE | MARKER_VALUE
+def _parse_marker_expression(string, pos):  # type: (str, int) -> Tuple[list, int]
+    """
+    Parses the marker expression starting at the given position.
+
+    The expression is returned as a flat list of marker items,
+    which are tuples of nodes, and boolean operators,
+    parenthesized expressions being nested lists.
+    """
+    markers = []
+    while True:
+        pos = _skip_whitespace(string, pos)
+        if string.startswith("(", pos):
+            group, pos = _parse_marker_expression(string, pos + 1)
+            pos = _skip_whitespace(string, pos)
+            if not string.startswith(")", pos):
+                raise _invalid_marker(string, pos)
+
+            markers.append(group)
+            pos += 1
+        else:
+            lhs, pos = _parse_marker_variable(string, pos)
+            pos = _skip_whitespace(string, pos)
+            match = _OP_RE.match(string, pos)
+            if match is None:
+                raise _invalid_marker(string, pos)
 
-MARKER_ITEM = Group(MARKER_VAR + MARKER_OP + MARKER_VAR)
-MARKER_ITEM.setParseAction(lambda s, l, t: tuple(t[0]))
+            op = Op(match.group())
+            rhs, pos = _parse_marker_variable(string, match.end())
+            markers.append((lhs, op, rhs))
 
-LPAREN = L("(").suppress()
-RPAREN = L(")").suppress()
+        match = _BOOLOP_RE.match(string, _skip_whitespace(string, pos))
+        if match is None:
+            return markers, pos
 
-MARKER_EXPR = Forward()
-MARKER_ATOM = MARKER_ITEM | Group(LPAREN + MARKER_EXPR + RPAREN)
-MARKER_EXPR << MARKER_ATOM + ZeroOrMore(BOOLOP + MARKER_EXPR)
+        markers.append(match.group())
+        pos = match.end()
 
-MARKER = stringStart + MARKER_EXPR + stringEnd
 
+def _parse_marker_variable(string, pos):  # type: (str, int) -> Tuple[Node, int]
+    pos = _skip_whitespace(string, pos)
 
-_undefined = object()
+    match = _VARIABLE_RE.match(string, pos)
+    if match is not None:
+        name = match.group()
 
+        return Variable(ALIASES.get(name, name)), match.end()
 
-def _coerce_parse_result(results):
-    if isinstance(results, ParseResults):
-        return [_coerce_parse_result(i) for i in results]
-    else:
-        return results
+    match = _VALUE_RE.match(string, pos)
+    if match is None:
+        raise _invalid_marker(string, pos)
+
+    value = match.group(1)
+    if value is None:
+        value = match.group(2)
+
+    if "\\" in value:
+        for escape, char in _WHITESPACE_ESCAPES:
+            value = value.replace(escape, char)
+
+    return Value(value), match.end()
+
+
+def _invalid_marker(string, pos):  # type: (str, int) -> InvalidMarker
+    return InvalidMarker(
+        'Invalid marker "{}", parse error at "{}"'.format(string, string[pos : pos + 8])
+    )
+
+
+_undefined = object()
 
 
 def _format_marker(marker, first=True):
@@ -157,6 +199,9 @@ def _format_marker(marker, first=True):
 
 
 class BaseMarker(object):
+
+    _evaluator = None
+
     def intersect(self, other):  # type: (BaseMarker) -> BaseMarker
         raise NotImplementedError()
 
@@ -170,6 +215,22 @@ class BaseMarker(object):
         return False
 
     def validate(self, environment):  # type: (Dict[str, Any]) -> bool
+        return self.evaluator(environment or {})
+
+    @property
+    def evaluator(self):  # type: () -> Callable[[Dict[str, Any]], bool]
+        """
+        The marker compiled into a function evaluating it
+        against an environment.
+
+        Markers being immutable, it is compiled once and reused.
+        """
+        if self._evaluator is None:
+            self._evaluator = self._compile()
+
+        return self._evaluator
+
+    def _compile(self):  # type: () -> Callable[[Dict[str, Any]], bool]
         raise NotImplementedError()
 
     def without_extras(self):  # type: () -> BaseMarker
@@ -192,8 +253,8 @@ class AnyMarker(BaseMarker):
     def is_empty(self):  # type: () -> bool
         return False
 
-    def validate(self, environment):
-        return True
+    def _compile(self):
+        return _always
 
     def without_extras(self):
         return self
@@ -227,8 +288,8 @@ class EmptyMarker(BaseMarker):
     def is_empty(self):  # type: () -> bool
         return True
 
-    def validate(self, environment):
-        return False
+    def _compile(self):
+        return _never
 
     def without_extras(self):
         return self
@@ -255,47 +316,14 @@ class SingleMarker(BaseMarker):
     _VERSION_LIKE_MARKER_NAME = {"python_version", "platform_release"}
 
     def __init__(self, name, constraint):
-        from poetry.packages.constraints import (
-            parse_constraint as parse_generic_constraint,
-        )
-        from poetry.semver import parse_constraint
-
         self._name = name
         self._constraint_string = str(constraint)
-
-        # Extract operator and value
-        m = self._CONSTRAINT_RE.match(self._constraint_string)
-        self._operator = m.group(1)
-        if self._operator is None:
-            self._operator = "=="
-
-        self._value = m.group(2)
-        self._parser = parse_generic_constraint
-
-        if name in self._VERSION_LIKE_MARKER_NAME:
-            self._parser = parse_constraint
-
-            if self._operator in {"in", "not in"}:
-                versions = []
-                for v in re.split("[ ,]+", self._value):
-                    split = v.split(".")
-                    if len(split) in [1, 2]:
-                        split.append("*")
-                        op = "" if self._operator == "in" else "!="
-                    else:
-                        op = "==" if self._operator == "in" else "!="
-
-                    versions.append(op + ".".join(split))
-
-                glue = ", "
-                if self._operator == "in":
-                    glue = " || "
-
-                self._constraint = self._parser(glue.join(versions))
-            else:
-                self._constraint = self._parser(self._constraint_string)
-        else:
-            self._constraint = self._parser(self._constraint_string)
+        (
+            self._operator,
+            self._value,
+            self._parser,
+            self._constraint,
+        ) = _parse_single_marker_constraint(name, self._constraint_string)
 
     @property
     def name(self):
@@ -351,14 +379,18 @@ class SingleMarker(BaseMarker):
 
         return other.union(self)
 
-    def validate(self, environment):
-        if environment is None:
-            return True
+    def _compile(self):
+        name = self._name
+        allows = self._constraint.allows
+        version_like = name in self._VERSION_LIKE_MARKER_NAME
 
-        if self._name not in environment:
-            return True
+        def evaluate(environment):
+            if name not in environment:
+                return True
+
+            return allows(_parse_environment_value(version_like, environment[name]))
 
-        return self._constraint.allows(self._parser(environment[self._name]))
+        return evaluate
 
     def without_extras(self):
         if self.name == "extra":
@@ -381,6 +413,79 @@ class SingleMarker(BaseMarker):
         )
 
 
+def _always(environment):  # type: (Dict[str, Any]) -> bool
+    return True
+
+
+def _never(environment):  # type: (Dict[str, Any]) -> bool
+    return False
+
+
+@lru_cache(maxsize=4096)
+def _parse_single_marker_constraint(
+    name, constraint
+):  # type: (str, str) -> Tuple[str, str, Callable, Any]
+    """
+    Parses the constraint of a single marker into its operator, value,
+    parser and constraint.
+
+    The results are cached and shared: they must not be modified.
+    """
+    from poetry.packages.constraints import parse_constraint as parse_generic_constraint
+    from poetry.semver import parse_constraint
+
+    # Extract operator and value
+    m = SingleMarker._CONSTRAINT_RE.match(constraint)
+    operator = m.group(1)
+    if operator is None:
+        operator = "=="
+
+    value = m.group(2)
+    parser = parse_generic_constraint
+
+    if name in SingleMarker._VERSION_LIKE_MARKER_NAME:
+        parser = parse_constraint
+
+        if operator in {"in", "not in"}:
+            versions = []
+            for v in re.split("[ ,]+", value):
+                split = v.split(".")
+                if len(split) in [1, 2]:
+                    split.append("*")
+                    op = "" if operator == "in" else "!="
+                else:
+                    op = "==" if operator == "in" else "!="
+
+                versions.append(op + ".".join(split))
+
+            glue = ", "
+            if operator == "in":
+                glue = " || "
+
+            return operator, value, parser, parser(glue.join(versions))
+
+    return operator, value, parser, parser(constraint)
+
+
+@lru_cache(maxsize=256)
+def _parse_environment_value(version_like, value):  # type: (bool, str) -> Any
+    """
+    Parses the value of an environment variable to check it against
+    the constraint of a marker.
+
+    An environment only having a handful of values, they are
+    parsed once instead of once per marker evaluated.
+    """
+    if version_like:
+        from poetry.semver import parse_constraint
+
+        return parse_constraint(value)
+
+    from poetry.packages.constraints import parse_constraint
+
+    return parse_constraint(value)
+
+
 def _flatten_markers(
     markers, flatten_class
 ):  # type: (Iterator[BaseMarker], Any) -> List[BaseMarker]
@@ -465,12 +570,17 @@ class MultiMarker(BaseMarker):
 
         return other.union(self)
 
-    def validate(self, environment):
-        for m in self._markers:
-            if not m.validate(environment):
-                return False
+    def _compile(self):
+        evaluators = [m.evaluator for m in self._markers]
 
-        return True
+        def evaluate(environment):
+            for evaluator in evaluators:
+                if not evaluator(environment):
+                    return False
+
+            return True
+
+        return evaluate
 
     def without_extras(self):
         new_markers = []
@@ -560,6 +670,7 @@ class MarkerUnion(BaseMarker):
             return
 
         self._markers.append(marker)
+        self._evaluator = None
 
     def intersect(self, other):
         if other.is_any():
@@ -596,12 +707,17 @@ class MarkerUnion(BaseMarker):
 
         return MarkerUnion.of(*new_markers)
 
-    def validate(self, environment):
-        for m in self._markers:
-            if m.validate(environment):
-                return True
+    def _compile(self):
+        evaluators = [m.evaluator for m in self._markers]
 
-        return False
+        def evaluate(environment):
+            for evaluator in evaluators:
+                if evaluator(environment):
+                    return True
+
+            return False
+
+        return evaluate
 
     def without_extras(self):
         new_markers = []
@@ -646,7 +762,46 @@ def parse_marker(marker):
     if not marker or marker == "*":
         return AnyMarker()
 
-    markers = _coerce_parse_result(MARKER.parseString(marker))
+    return _parse_marker(marker)
+
+
+def validate_markers(
+    markers, environment
+):  # type: (Iterable[BaseMarker], Dict[str, Any]) -> List[bool]
+    """
+    Evaluates several markers against the same environment.
+
+    Markers parsed from the same string being shared,
+    like the ones of the packages of a lock file,
+    they are only evaluated once.
+    """
+    environment = environment or {}
+    results = {}
+    validity = []
+
+    for marker in markers:
+        valid = results.get(id(marker))
+        if valid is None:
+            valid = results[id(marker)] = marker.evaluator(environment)
+
+        validity.append(valid)
+
+    return validity
+
+
+@lru_cache(maxsize=4096)
+def _parse_marker(marker):  # type: (str) -> BaseMarker
+    """
+    Parses a marker string.
+
+    The same markers being found over and over in the dependencies
+    of packages, the results are cached and shared:
+    they must not be modified.
+    """
+    markers, pos = _parse_marker_expression(marker, 0)
+    pos = _skip_whitespace(marker, pos)
+    if pos != len(marker):
+        raise _invalid_marker(marker, pos)
 
     return _compact_markers(markers)
 
@@ -6,22 +6,17 @@ from __future__ import division
 from __future__ import print_function
 
 import re
-import string
-
-from pyparsing import Combine
-from pyparsing import Literal as L  # noqa
-from pyparsing import Optional
-from pyparsing import ParseException
-from pyparsing import Regex
-from pyparsing import Word
-from pyparsing import ZeroOrMore
-from pyparsing import originalTextFor
-from pyparsing import stringEnd
-from pyparsing import stringStart
 
+from typing import Optional
+from typing import Pattern
+from typing import Tuple
+
+from poetry.semver import VersionConstraint
 from poetry.semver import parse_constraint
+from poetry.utils._compat import lru_cache
 
-from .markers import MARKER_EXPR
+from .markers import BaseMarker
+from .markers import InvalidMarker
 from .markers import parse_marker
 
 
@@ -144,55 +139,174 @@ class InvalidRequirement(ValueError):
     """
 
 
-ALPHANUM = Word(string.ascii_letters + string.digits)
+VERSION_PEP440 = re.compile(REGEX, re.VERBOSE | re.IGNORECASE)
+VERSION_LEGACY = re.compile(LEGACY_REGEX, re.VERBOSE | re.IGNORECASE)
+
+_IDENTIFIER_RE = re.compile(r"[a-zA-Z0-9]+(?:[-_.]+[a-zA-Z0-9]+)*")
+_WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+_URL_RE = re.compile(r"[^ ]+")
+
+
+class _Scanner(object):
+    """
+    Matches the tokens of a requirement string one after the other,
+    skipping the whitespace between them.
+    """
+
+    def __init__(self, string):  # type: (str) -> None
+        self.string = string
+        self.pos = 0
+
+    def skip_whitespace(self):  # type: () -> None
+        self.pos = _WHITESPACE_RE.match(self.string, self.pos).end()
+
+    def peek(self, literal):  # type: (str) -> bool
+        self.skip_whitespace()
 
-LBRACKET = L("[").suppress()
-RBRACKET = L("]").suppress()
-LPAREN = L("(").suppress()
-RPAREN = L(")").suppress()
-COMMA = L(",").suppress()
-SEMICOLON = L(";").suppress()
-AT = L("@").suppress()
+        return self.string.startswith(literal, self.pos)
 
-PUNCTUATION = Word("-_.")
-IDENTIFIER_END = ALPHANUM | (ZeroOrMore(PUNCTUATION) + ALPHANUM)
-IDENTIFIER = Combine(ALPHANUM + ZeroOrMore(IDENTIFIER_END))
+    def accept(self, literal):  # type: (str) -> bool
+        if not self.peek(literal):
+            return False
 
-NAME = IDENTIFIER("name")
-EXTRA = IDENTIFIER
+        self.pos += len(literal)
 
-URI = Regex(r"[^ ]+")("url")
-URL = AT + URI
+        return True
 
-EXTRAS_LIST = EXTRA + ZeroOrMore(COMMA + EXTRA)
-EXTRAS = (LBRACKET + Optional(EXTRAS_LIST) + RBRACKET)("extras")
+    def expect(self, literal):  # type: (str) -> None
+        if not self.accept(literal):
+            raise self.error()
 
-VERSION_PEP440 = Regex(REGEX, re.VERBOSE | re.IGNORECASE)
-VERSION_LEGACY = Regex(LEGACY_REGEX, re.VERBOSE | re.IGNORECASE)
+    def match(self, *regexes):  # type: (*Pattern) -> Optional[str]
+        """
+        Matches the longest token of the given regular expressions.
+        """
+        self.skip_whitespace()
 
-VERSION_ONE = VERSION_PEP440 ^ VERSION_LEGACY
-VERSION_MANY = Combine(
-    VERSION_ONE + ZeroOrMore(COMMA + VERSION_ONE), joinString=",", adjacent=False
-)("_raw_spec")
-_VERSION_SPEC = Optional(((LPAREN + VERSION_MANY + RPAREN) | VERSION_MANY))
-_VERSION_SPEC.setParseAction(lambda s, l, t: t._raw_spec or "")
+        best = None
+        for regex in regexes:
+            match = regex.match(self.string, self.pos)
+            if match is not None and (best is None or match.end() > best.end()):
+                best = match
 
-VERSION_SPEC = originalTextFor(_VERSION_SPEC)("specifier")
-VERSION_SPEC.setParseAction(lambda s, l, t: t[1])
+        if best is None:
+            return
+
+        self.pos = best.end()
+
+        return best.group()
+
+    def error(self):  # type: () -> InvalidRequirement
+        return InvalidRequirement(
+            'Invalid requirement, parse error at "{0!r}"'.format(
+                self.string[self.pos : self.pos + 8]
+            )
+        )
+
+
+def _parse_version_specifier(scanner):  # type: (_Scanner) -> str
+    """
+    Parses a comma-separated list of version constraints,
+    optionally enclosed in parentheses.
+    """
+    start = scanner.pos
+    parenthesized = scanner.accept("(")
 
-MARKER_EXPR = originalTextFor(MARKER_EXPR())("marker")
-MARKER_EXPR.setParseAction(
-    lambda s, l, t: parse_marker(s[t._original_start : t._original_end])
-)
-MARKER_SEPARATOR = SEMICOLON
-MARKER = MARKER_SEPARATOR + MARKER_EXPR
+    specifier = scanner.match(VERSION_PEP440, VERSION_LEGACY)
+    if specifier is None:
+        # The specifier is optional
+        scanner.pos = start
 
-VERSION_AND_MARKER = VERSION_SPEC + Optional(MARKER)
-URL_AND_MARKER = URL + Optional(MARKER)
+        return ""
 
-NAMED_REQUIREMENT = NAME + Optional(EXTRAS) + (URL_AND_MARKER | VERSION_AND_MARKER)
+    specifiers = [specifier]
+    while True:
+        pos = scanner.pos
+        if not scanner.accept(","):
+            break
 
-REQUIREMENT = stringStart + NAMED_REQUIREMENT + stringEnd
+        specifier = scanner.match(VERSION_PEP440, VERSION_LEGACY)
+        if specifier is None:
+            scanner.pos = pos
+            break
+
+        specifiers.append(specifier)
+
+    if parenthesized and not scanner.accept(")"):
+        # Without the closing parenthesis, this is not a version specifier
+        scanner.pos = start
+
+        return ""
+
+    return ",".join(specifiers)
+
+
+@lru_cache(maxsize=4096)
+def _parse_requirement(
+    requirement_string,
+):  # type: (str) -> Tuple[str, Optional[str], frozenset, str, VersionConstraint, Optional[BaseMarker]]
+    """
+    Parses a requirement string into its name, url, extras,
+    version constraint and marker.
+
+    The same requirements being found over and over in the dependencies
+    of packages, the results are cached and shared.
+    """
+    scanner = _Scanner(requirement_string)
+
+    name = scanner.match(_IDENTIFIER_RE)
+    if name is None:
+        raise scanner.error()
+
+    extras = []
+    if scanner.accept("["):
+        extra = scanner.match(_IDENTIFIER_RE)
+        if extra is not None:
+            extras.append(extra)
+
+            while scanner.accept(","):
+                extra = scanner.match(_IDENTIFIER_RE)
+                if extra is None:
+                    raise scanner.error()
+
+                extras.append(extra)
+
+        scanner.expect("]")
+
+    url = None
+    specifier = ""
+    if scanner.accept("@"):
+        url = scanner.match(_URL_RE)
+        if url is None:
+            raise scanner.error()
+    else:
+        specifier = _parse_version_specifier(scanner)
+
+    marker = None
+    if scanner.accept(";"):
+        try:
+            marker = parse_marker(requirement_string[scanner.pos :].strip(" \t\n\r"))
+        except InvalidMarker:
+            raise scanner.error()
+
+        if marker.is_any():
+            # An empty marker is not a valid one
+            raise scanner.error()
+    else:
+        scanner.skip_whitespace()
+        if scanner.pos != len(requirement_string):
+            raise scanner.error()
+
+    constraint = specifier or "*"
+
+    return (
+        name,
+        url,
+        frozenset(extras),
+        constraint,
+        parse_constraint(constraint),
+        marker,
+    )
 
 
 class Requirement(object):
@@ -204,35 +318,31 @@ class Requirement(object):
     """
 
     def __init__(self, requirement_string):
-        try:
-            req = REQUIREMENT.parseString(requirement_string)
-        except ParseException as e:
-            raise InvalidRequirement(
-                'Invalid requirement, parse error at "{0!r}"'.format(
-                    requirement_string[e.loc : e.loc + 8]
-                )
-            )
-
-        self.name = req.name
-        if req.url:
-            parsed_url = urlparse.urlparse(req.url)
+        (
+            name,
+            url,
+            extras,
+            pretty_constraint,
+            constraint,
+            marker,
+        ) = _parse_requirement(requirement_string)
+
+        self.name = name
+        if url:
+            parsed_url = urlparse.urlparse(url)
             if not (parsed_url.scheme and parsed_url.netloc) or (
                 not parsed_url.scheme and not parsed_url.netloc
             ):
                 raise InvalidRequirement("Invalid URL given")
-            self.url = req.url
+            self.url = url
         else:
             self.url = None
 
-        self.extras = set(req.extras.asList() if req.extras else [])
-        constraint = req.specifier
-        if not constraint:
-            constraint = "*"
-
-        self.constraint = parse_constraint(constraint)
-        self.pretty_constraint = constraint
+        self.extras = extras
+        self.constraint = constraint
+        self.pretty_constraint = pretty_constraint
 
-        self.marker = req.marker if req.marker else None
+        self.marker = marker if marker else None
 
     def __str__(self):
         parts = [self.name]
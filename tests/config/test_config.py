@@ -14,3 +14,17 @@ def test_config_get_from_environment_variable(config, environ):
 
     os.environ["POETRY_VIRTUALENVS_CREATE"] = "false"
     assert not config.get("virtualenvs.create")
+
+
+def test_config_get_normalizes_max_workers_from_environment_variable(config, environ):
+    assert config.get("installer.max-workers") is None
+
+    os.environ["POETRY_INSTALLER_MAX_WORKERS"] = "4"
+    assert 4 == config.get("installer.max-workers")
+
+
+def test_config_get_normalizes_pool_timeout_from_environment_variable(config, environ):
+    assert config.get("pool.timeout") is None
+
+    os.environ["POETRY_POOL_TIMEOUT"] = "10"
+    assert 10 == config.get("pool.timeout")
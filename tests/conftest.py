@@ -11,8 +11,8 @@ import pytest
 from poetry.config.config import Config as BaseConfig
 from poetry.config.dict_config_source import DictConfigSource
 from poetry.utils._compat import Path
-from tests.helpers import mock_clone
 from tests.helpers import mock_download
+from tests.helpers import mock_export
 
 
 class Config(BaseConfig):
@@ -87,11 +87,27 @@ def environ():
 @pytest.fixture(autouse=True)
 def git_mock(mocker):
     # Patch git module to not actually clone projects
-    mocker.patch("poetry.vcs.git.Git.clone", new=mock_clone)
-    mocker.patch("poetry.vcs.git.Git.checkout", new=lambda *_: None)
-    p = mocker.patch("poetry.vcs.git.Git.rev_parse")
+    cache_dir = tempfile.mkdtemp(prefix="poetry_git_cache_")
+    mocker.patch("poetry.vcs.git_cache.CACHE_DIR", cache_dir)
+    mocker.patch("poetry.vcs.git_cache.GitCache.export", new=mock_export)
+    p = mocker.patch("poetry.vcs.git_cache.GitCache.revision")
     p.return_value = "9cf87a285a2d3fbb0b9fa621997b3acc3631ed24"
 
+    yield
+
+    shutil.rmtree(cache_dir)
+
+
+@pytest.fixture(autouse=True)
+def path_metadata_cache(mocker):
+    # Do not share the metadata of path dependencies between tests
+    cache_dir = tempfile.mkdtemp(prefix="poetry_path_metadata_")
+    mocker.patch("poetry.puzzle.path_metadata_cache.CACHE_DIR", cache_dir)
+
+    yield
+
+    shutil.rmtree(cache_dir)
+
 
 @pytest.fixture
 def http():
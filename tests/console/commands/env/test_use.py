@@ -1,3 +1,4 @@
+import json
 import os
 import shutil
 import sys
@@ -24,6 +25,19 @@ def remove_venv(path):
     shutil.rmtree(path)
 
 
+def get_interpreter_info(version_info=(3, 7, 1)):
+    return json.dumps(
+        {
+            "marker_env": {"version_info": list(version_info) + ["final", 0]},
+            "base_prefix": "/prefix",
+            "sys_path": [],
+            "config_vars": {},
+            "pip_version": "19.1",
+            "purelib": None,
+        }
+    )
+
+
 def check_output_wrapper(version=Version.parse("3.7.1")):
     def check_output(cmd, *args, **kwargs):
         if "sys.version_info[:3]" in cmd:
@@ -48,7 +62,7 @@ def test_activate_activates_non_existing_virtualenv_no_envs_file(app, tmp_dir, m
     )
     mocker.patch(
         "poetry.utils._compat.subprocess.Popen.communicate",
-        side_effect=[("/prefix", None), ("/prefix", None)],
+        side_effect=[(get_interpreter_info(), None)] * 2,
     )
     m = mocker.patch("poetry.utils.env.EnvManager.build_venv", side_effect=build_venv)
 
@@ -108,7 +122,7 @@ def test_get_prefers_explicitly_activated_virtualenvs_over_env_var(
     )
     mocker.patch(
         "poetry.utils._compat.subprocess.Popen.communicate",
-        side_effect=[("/prefix", None), ("/prefix", None), ("/prefix", None)],
+        side_effect=[(get_interpreter_info(current_python), None)] * 3,
     )
 
     command = app.find("env use")
@@ -154,7 +168,7 @@ def test_get_prefers_explicitly_activated_non_existing_virtualenvs_over_env_var(
     )
     mocker.patch(
         "poetry.utils._compat.subprocess.Popen.communicate",
-        side_effect=[("/prefix", None), ("/prefix", None), ("/prefix", None)],
+        side_effect=[(get_interpreter_info(current_python), None)] * 3,
     )
     mocker.patch("poetry.utils.env.EnvManager.build_venv", side_effect=build_venv)
 
@@ -0,0 +1,17 @@
+import pytest
+
+from cleo.testers import CommandTester
+
+
+@pytest.mark.parametrize("jobs", ["foo", "0", "-1"])
+def test_build_rejects_invalid_number_of_jobs(app, mocker, jobs):
+    builder = mocker.patch("poetry.masonry.Builder")
+    command = app.find("build")
+    tester = CommandTester(command)
+
+    assert 1 == tester.execute("--jobs={}".format(jobs))
+    assert 0 == builder.call_count
+    assert (
+        "The number of jobs must be a positive integer, got {}.\n".format(jobs)
+        == tester.io.fetch_error()
+    )
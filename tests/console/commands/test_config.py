@@ -13,6 +13,8 @@ def test_list_displays_default_value_if_not_set(app, config):
     tester.execute("--list")
 
     expected = """cache-dir = "/foo"
+installer.max-workers = null
+pool.timeout = null
 virtualenvs.create = true
 virtualenvs.in-project = false
 virtualenvs.path = {path}  # /foo{sep}virtualenvs
@@ -32,6 +34,8 @@ def test_list_displays_set_get_setting(app, config):
     tester.execute("--list")
 
     expected = """cache-dir = "/foo"
+installer.max-workers = null
+pool.timeout = null
 virtualenvs.create = false
 virtualenvs.in-project = false
 virtualenvs.path = {path}  # /foo{sep}virtualenvs
@@ -79,6 +83,8 @@ def test_list_displays_set_get_local_setting(app, config):
     tester.execute("--list")
 
     expected = """cache-dir = "/foo"
+installer.max-workers = null
+pool.timeout = null
 virtualenvs.create = false
 virtualenvs.in-project = false
 virtualenvs.path = {path}  # /foo{sep}virtualenvs
@@ -1,11 +1,24 @@
 import sys
 
+import pytest
+
 from cleo.testers import CommandTester
 
 from poetry.utils._compat import Path
 from tests.helpers import get_package
 
 
+@pytest.fixture(autouse=True)
+def no_path_metadata_cache(mocker):
+    # Path.open is mocked by these tests
+    # so the files of path dependencies cannot be digested
+    for method in ["directory_metadata", "file_metadata"]:
+        mocker.patch(
+            "poetry.puzzle.path_metadata_cache.PathMetadataCache." + method,
+            new=lambda self, path, factory: factory(),
+        )
+
+
 def test_basic_interactive(app, mocker, poetry):
     command = app.find("init")
     command._pool = poetry.pool
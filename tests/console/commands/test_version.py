@@ -2,7 +2,7 @@ import pytest
 
 from cleo import CommandTester
 
-from poetry.console.commands import VersionCommand
+from poetry.console.commands.version import VersionCommand
 
 
 @pytest.fixture()
@@ -4,7 +4,7 @@ import pytest
 
 from cleo import ApplicationTester
 
-from poetry.console import Application as BaseApplication
+from poetry.console.application import Application as BaseApplication
 from poetry.factory import Factory
 from poetry.installation.noop_installer import NoopInstaller
 from poetry.packages import Locker as BaseLocker
@@ -14,8 +14,8 @@ from poetry.repositories import Repository as BaseRepository
 from poetry.repositories.exceptions import PackageNotFound
 from poetry.utils._compat import Path
 from poetry.utils.toml_file import TomlFile
-from tests.helpers import mock_clone
 from tests.helpers import mock_download
+from tests.helpers import mock_export
 
 
 @pytest.fixture()
@@ -43,9 +43,8 @@ def setup(mocker, installer, installed, config):
     p.return_value = installed
 
     # Patch git module to not actually clone projects
-    mocker.patch("poetry.vcs.git.Git.clone", new=mock_clone)
-    mocker.patch("poetry.vcs.git.Git.checkout", new=lambda *_: None)
-    p = mocker.patch("poetry.vcs.git.Git.rev_parse")
+    mocker.patch("poetry.vcs.git_cache.GitCache.export", new=mock_export)
+    p = mocker.patch("poetry.vcs.git_cache.GitCache.revision")
     p.return_value = "9cf87a285a2d3fbb0b9fa621997b3acc3631ed24"
 
     # Patch download to not download anything but to just copy from fixtures
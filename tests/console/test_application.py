@@ -0,0 +1,27 @@
+from poetry.console.application import COMMANDS
+
+
+def test_application_only_loads_the_command_being_run(app, app_tester):
+    assert "install" not in app.commands
+
+    app_tester.execute("about")
+
+    assert "about" in app.commands
+    assert "install" not in app.commands
+
+
+def test_application_lists_all_commands(app, app_tester):
+    app_tester.execute("")
+
+    output = app_tester.io.fetch_output()
+    for name in COMMANDS:
+        assert name in output
+        assert name in app.commands
+
+
+def test_application_finds_commands_not_loaded_yet(app):
+    assert "env" not in app.commands
+
+    command = app.find("env list")
+
+    assert "list" == command.name
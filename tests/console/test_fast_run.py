@@ -0,0 +1,132 @@
+import os
+import sys
+
+import pytest
+
+from poetry.console.fast_run import prepare
+from poetry.console.fast_run import script_command
+from poetry.utils._compat import Path
+from poetry.utils.env import EnvManager
+
+
+PYPROJECT = """\
+[tool.poetry]
+name = "Simple_Project"
+version = "1.2.3"
+description = ""
+authors = ["Poetry <poetry@example.com>"]
+
+[tool.poetry.scripts]
+foo = "foo.bar:baz"
+"""
+
+
+@pytest.fixture
+def project(tmp_dir, environ, mocker):
+    mocker.patch("poetry.console.fast_run.CONFIG_DIR", str(Path(tmp_dir, "config")))
+    for var in ["VIRTUAL_ENV", "CONDA_PREFIX", "CONDA_DEFAULT_ENV"]:
+        os.environ.pop(var, None)
+
+    os.environ["POETRY_VIRTUALENVS_PATH"] = str(Path(tmp_dir, "virtualenvs"))
+
+    path = Path(tmp_dir, "project")
+    (path / "src").mkdir(parents=True)
+    with (path / "pyproject.toml").open("w", encoding="utf-8") as f:
+        f.write(PYPROJECT)
+
+    return path
+
+
+def test_prepare_uses_the_in_project_venv(project):
+    venv = project / ".venv"
+    (venv / "bin").mkdir(parents=True)
+    (venv / "bin" / "python").touch()
+
+    bin, args, env = prepare(["python", "-V"], project / "src")
+
+    assert str(venv / "bin" / "python") == bin
+    assert ["-V"] == args
+    assert str(venv) == env["VIRTUAL_ENV"]
+    assert env["PATH"].startswith(str(venv / "bin") + os.pathsep)
+
+
+def test_prepare_uses_the_venv_registered_in_envs_file(project):
+    venvs = Path(os.environ["POETRY_VIRTUALENVS_PATH"])
+    name = EnvManager.generate_env_name("simple-project", str(project))
+    venv = venvs / "{}-py3.6".format(name)
+    venv.mkdir(parents=True)
+    with (venvs / "envs.toml").open("w", encoding="utf-8") as f:
+        f.write('[{}]\nminor = "3.6"\npatch = "3.6.8"\n'.format(name))
+
+    bin, args, env = prepare(["foo", "bar"], project)
+
+    assert "python" == bin
+    assert script_command("foo.bar:baz", ["foo", "bar"])[1:] == args
+    assert str(venv) == env["VIRTUAL_ENV"]
+
+
+def test_prepare_runs_scripts_of_flat_layout_projects(project):
+    (project / ".venv").mkdir()
+    (project / "simple_project").mkdir()
+    (project / "src" / "simple_project").mkdir()
+
+    bin, args, _ = prepare(["foo", "bar"], project)
+
+    assert "python" == bin
+    assert script_command("foo.bar:baz", ["foo", "bar"])[1:] == args
+
+
+def test_prepare_gives_up_on_scripts_of_src_layout_projects(project):
+    (project / ".venv").mkdir()
+    (project / "src" / "simple_project.py").touch()
+
+    assert prepare(["foo", "bar"], project) is None
+    assert prepare(["python", "-V"], project) is not None
+
+
+def test_prepare_gives_up_on_scripts_of_packages_from_src(project):
+    (project / ".venv").mkdir()
+    with (project / "pyproject.toml").open("w", encoding="utf-8") as f:
+        f.write(
+            PYPROJECT.replace(
+                "[tool.poetry.scripts]",
+                'packages = [{ include = "foo", from = "src" }]\n\n'
+                "[tool.poetry.scripts]",
+            )
+        )
+
+    assert prepare(["foo", "bar"], project) is None
+
+
+def test_prepare_uses_the_activated_venv(project, tmp_dir):
+    os.environ["VIRTUAL_ENV"] = tmp_dir
+
+    _, _, env = prepare(["python", "-V"], project)
+
+    assert tmp_dir == env["VIRTUAL_ENV"]
+
+
+def test_prepare_gives_up_if_the_venv_does_not_exist(project):
+    assert prepare(["python", "-V"], project) is None
+
+
+def test_prepare_gives_up_if_no_venv_is_used(project):
+    os.environ["POETRY_VIRTUALENVS_CREATE"] = "false"
+    name = "{}-py{}".format(
+        EnvManager.generate_env_name("simple-project", str(project)),
+        ".".join(str(v) for v in sys.version_info[:2]),
+    )
+    Path(os.environ["POETRY_VIRTUALENVS_PATH"], name).mkdir(parents=True)
+
+    assert prepare(["python", "-V"], project) is None
+
+
+def test_script_command():
+    assert [
+        "python",
+        "-c",
+        "import sys; "
+        "from importlib import import_module; "
+        "sys.argv = ['foo', '-v']; "
+        "import_module('foo.bar').baz()",
+    ] == script_command({"callable": "foo.bar:baz"}, ["foo", "-v"])
@@ -81,6 +81,12 @@ def mock_clone(_, source, dest):
     copy_or_symlink(folder, dest)
 
 
+def mock_export(_, url, reference, dest):
+    mock_clone(_, url, dest)
+
+    return "9cf87a285a2d3fbb0b9fa621997b3acc3631ed24"
+
+
 def mock_download(self, url, dest):
     parts = urlparse.urlparse(url)
 
@@ -1,6 +1,7 @@
 from __future__ import unicode_literals
 
 import sys
+import threading
 
 import pytest
 
@@ -337,6 +338,46 @@ def test_run_whitelist_add(installer, locker, repo, package):
     assert locker.written_data == expected
 
 
+def test_run_lock_without_update_keeps_locked_versions(
+    installer, locker, repo, package
+):
+    locker.locked(True)
+    locker.mock_lock_data(
+        {
+            "package": [
+                {
+                    "name": "A",
+                    "version": "1.0",
+                    "category": "main",
+                    "optional": False,
+                    "platform": "*",
+                    "python-versions": "*",
+                    "checksum": [],
+                }
+            ],
+            "metadata": {
+                "python-versions": "*",
+                "platform": "*",
+                "content-hash": "123456789",
+                "hashes": {"A": []},
+            },
+        }
+    )
+    repo.add_package(get_package("A", "1.0"))
+    repo.add_package(get_package("A", "1.1"))
+    repo.add_package(get_package("B", "1.1"))
+
+    package.add_dependency("A", "^1.0")
+    package.add_dependency("B", "^1.0")
+
+    installer.lock(update=False)
+
+    installer.run()
+    expected = fixture("with-dependencies")
+
+    assert locker.written_data == expected
+
+
 def test_run_whitelist_remove(installer, locker, repo, package, installed):
     locker.locked(True)
     locker.mock_lock_data(
@@ -1557,3 +1598,77 @@ def test_installer_uses_prereleases_if_they_are_compatible(
     installer.run()
 
     assert len(installer.installer.installs) == 2
+
+
+class ConcurrentInstaller(NoopInstaller):
+    def __init__(self):
+        super(ConcurrentInstaller, self).__init__()
+
+        self._started = {}
+        self._lock = threading.Lock()
+        self.concurrent = set()
+
+    def expect(self, *names):
+        for name in names:
+            self._started[name] = threading.Event()
+
+    def install(self, package):
+        started = self._started.get(package.name)
+        if started is not None:
+            started.set()
+
+            # Waiting for the other packages of the group to be started
+            if all(event.wait(5) for event in self._started.values()):
+                self.concurrent.add(package.name)
+
+        with self._lock:
+            super(ConcurrentInstaller, self).install(package)
+
+
+def test_run_installs_independent_packages_concurrently(
+    package, pool, locker, env, installed, repo, config
+):
+    config.merge({"installer": {"max-workers": 2}})
+    installer = Installer(
+        NullIO(), env, package, locker, pool, installed=installed, config=config
+    )
+    installer._installer = ConcurrentInstaller()
+    installer.installer.expect("b", "c")
+
+    package_a = get_package("A", "1.0")
+    package_a.add_dependency("B", "^1.0")
+    package_a.add_dependency("C", "^1.0")
+    repo.add_package(package_a)
+    repo.add_package(get_package("B", "1.0"))
+    repo.add_package(get_package("C", "1.0"))
+
+    package.add_dependency("A", "^1.0")
+
+    installer.run()
+
+    installs = installer.installer.installs
+    assert {"b", "c"} == installer.installer.concurrent
+    assert {"b", "c"} == {pkg.name for pkg in installs[:2]}
+    assert "a" == installs[2].name
+
+
+def test_run_installs_packages_one_at_a_time_with_a_single_worker(
+    package, pool, locker, env, installed, repo, config
+):
+    config.merge({"installer": {"max-workers": 1}})
+    installer = Installer(
+        NullIO(), env, package, locker, pool, installed=installed, config=config
+    )
+
+    package_a = get_package("A", "1.0")
+    package_a.add_dependency("B", "^1.0")
+    package_a.add_dependency("C", "^1.0")
+    repo.add_package(package_a)
+    repo.add_package(get_package("B", "1.0"))
+    repo.add_package(get_package("C", "1.0"))
+
+    package.add_dependency("A", "^1.0")
+
+    installer.run()
+
+    assert ["b", "c", "a"] == [pkg.name for pkg in installer.installer.installs]
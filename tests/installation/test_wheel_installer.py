@@ -0,0 +1,238 @@
+import csv
+import hashlib
+import os
+import shutil
+import zipfile
+
+import pytest
+
+from poetry.installation.wheel_installer import WheelInstallationError
+from poetry.installation.wheel_installer import WheelInstaller
+from poetry.io.null_io import NullIO
+from poetry.packages.package import Package
+from poetry.packages.utils.link import Link
+from poetry.repositories.legacy_repository import LegacyRepository
+from poetry.repositories.pool import Pool
+from poetry.repositories.pypi_repository import PyPiRepository
+from poetry.utils._compat import Path
+from poetry.utils.artifact_cache import ArtifactCache
+from poetry.utils.env import MockEnv
+
+
+@pytest.fixture
+def env(tmp_dir):
+    return MockEnv(path=Path(tmp_dir) / "venv", is_venv=True)
+
+
+@pytest.fixture
+def repository():
+    return LegacyRepository("foo", "https://foo.bar/simple")
+
+
+@pytest.fixture
+def pool(repository):
+    return Pool([repository])
+
+
+@pytest.fixture
+def installer(env, pool):
+    return WheelInstaller(env, NullIO(), pool)
+
+
+@pytest.fixture
+def wheel(tmp_dir):
+    path = Path(tmp_dir) / "demo-0.1.0-py2.py3-none-any.whl"
+    with zipfile.ZipFile(str(path), "w") as zf:
+        zf.writestr("demo/__init__.py", "def main():\n    return 0\n")
+        zf.writestr("demo/sub/__init__.py", "")
+        zf.writestr(
+            "demo-0.1.0.dist-info/WHEEL",
+            "Wheel-Version: 1.0\nRoot-Is-Purelib: true\nTag: py2.py3-none-any\n",
+        )
+        zf.writestr(
+            "demo-0.1.0.dist-info/METADATA",
+            "Metadata-Version: 2.1\nName: demo\nVersion: 0.1.0\n",
+        )
+        zf.writestr(
+            "demo-0.1.0.dist-info/entry_points.txt",
+            "[console_scripts]\ndemo = demo:main\n",
+        )
+        zf.writestr("demo-0.1.0.data/scripts/demo-legacy", "#!python\nprint(1)\n")
+        zf.writestr("demo-0.1.0.dist-info/RECORD", "")
+
+    return path
+
+
+def get_package(wheel):
+    with wheel.open("rb") as f:
+        h = hashlib.sha256(f.read()).hexdigest()
+
+    package = Package("demo", "0.1.0")
+    package.source_type = "legacy"
+    package.source_reference = "foo"
+    package.source_url = "https://foo.bar/simple"
+    package.files = [
+        {"file": "demo-0.1.0.tar.gz", "hash": "sha256:123456"},
+        {"file": wheel.name, "hash": "sha256:{}".format(h)},
+    ]
+
+    return package
+
+
+@pytest.mark.parametrize(
+    "filename,supported",
+    [
+        ("demo-0.1.0-py2.py3-none-any.whl", True),
+        ("demo-0.1.0-py3-none-any.whl", True),
+        ("demo-0.1.0-py36-none-any.whl", True),
+        ("demo-0.1.0-py38-none-any.whl", False),
+        ("demo-0.1.0-py2-none-any.whl", False),
+        ("demo-0.1.0-cp37-cp37m-manylinux1_x86_64.whl", False),
+        ("demo-0.1.0.tar.gz", False),
+    ],
+)
+def test_is_supported_wheel(installer, filename, supported):
+    assert supported == installer.is_supported_wheel(filename)
+
+
+def test_install_wheel(installer, env, wheel):
+    installer.install_wheel(wheel)
+
+    site_packages = env.site_packages
+    dist_info = site_packages / "demo-0.1.0.dist-info"
+
+    assert (site_packages / "demo" / "__init__.py").exists()
+    assert (site_packages / "demo" / "sub" / "__init__.py").exists()
+    assert "poetry\n" == (dist_info / "INSTALLER").read_text()
+
+    script = env.path / "bin" / "demo"
+    assert script.exists()
+    assert os.access(str(script), os.X_OK)
+    content = script.read_text()
+    assert content.startswith("#!python\n")
+    assert "from demo import main" in content
+    assert "sys.exit(main())" in content
+
+    legacy_script = env.path / "bin" / "demo-legacy"
+    assert os.access(str(legacy_script), os.X_OK)
+    assert legacy_script.read_text().startswith("#!python\n")
+
+    with (dist_info / "RECORD").open() as f:
+        records = {row[0]: row for row in csv.reader(f)}
+
+    assert "demo/__init__.py" in records
+    assert records["demo/__init__.py"][1].startswith("sha256=")
+    assert "25" == records["demo/__init__.py"][2]
+    assert "demo-0.1.0.dist-info/INSTALLER" in records
+    assert ["demo-0.1.0.dist-info/RECORD", "", ""] == records[
+        "demo-0.1.0.dist-info/RECORD"
+    ]
+    assert "../../../bin/demo" in records
+    assert "../../../bin/demo-legacy" in records
+
+
+def test_remove(installer, env, wheel):
+    installer.install_wheel(wheel)
+
+    assert installer.remove(Package("demo", "0.1.0"))
+
+    assert not (env.site_packages / "demo").exists()
+    assert not (env.site_packages / "demo-0.1.0.dist-info").exists()
+    assert not (env.path / "bin" / "demo").exists()
+    assert env.site_packages.exists()
+
+    assert not installer.remove(Package("demo", "0.1.0"))
+
+
+def test_remove_leaves_distributions_of_other_installers(installer, env, wheel):
+    installer.install_wheel(wheel)
+    dist_info = env.site_packages / "demo-0.1.0.dist-info"
+    (dist_info / "INSTALLER").write_text(u"pip\n")
+
+    assert not installer.remove(Package("demo", "0.1.0"))
+    assert (env.site_packages / "demo").exists()
+
+    (dist_info / "INSTALLER").unlink()
+
+    assert not installer.remove(Package("demo", "0.1.0"))
+    assert (env.site_packages / "demo").exists()
+
+
+def test_concurrent_writes_share_directories(installer, env):
+    from concurrent.futures import ThreadPoolExecutor
+
+    paths = [
+        env.site_packages / "namespace" / "data" / "file{}.txt".format(i)
+        for i in range(50)
+    ]
+
+    executor = ThreadPoolExecutor(max_workers=8)
+    try:
+        records = list(executor.map(lambda p: installer._write(p, b"data"), paths))
+    finally:
+        executor.shutdown(wait=True)
+
+    assert paths == [path for path, _, _ in records]
+    assert all(path.read_bytes() == b"data" for path in paths)
+
+
+def test_install_downloads_and_verifies_the_locked_wheel(
+    installer, env, repository, wheel, mocker
+):
+    package = get_package(wheel)
+    link = Link(
+        "https://foo.bar/files/{}#sha256={}".format(
+            wheel.name, package.files[1]["hash"][7:]
+        )
+    )
+    mocker.patch.object(repository, "find_links_for_package", return_value=[link])
+    get_artifact = mocker.patch.object(repository, "get_artifact", return_value=wheel)
+
+    assert link == installer.find_link(package)
+
+    installer.install(package)
+
+    get_artifact.assert_called_once_with(link.url, hash=package.files[1]["hash"])
+    assert (env.site_packages / "demo" / "__init__.py").exists()
+
+
+def test_install_fails_on_hash_mismatch(
+    installer, env, repository, wheel, mocker, tmp_dir
+):
+    package = get_package(wheel)
+    package.files[1]["hash"] = "sha256:123456"
+    link = Link("https://foo.bar/files/{}".format(wheel.name))
+    mocker.patch.object(repository, "find_links_for_package", return_value=[link])
+    mocker.patch.object(
+        repository,
+        "_download",
+        side_effect=lambda url, dest: shutil.copyfile(str(wheel), dest),
+    )
+    mocker.patch.object(
+        repository, "_artifact_cache", ArtifactCache(Path(tmp_dir) / "artifacts")
+    )
+
+    with pytest.raises(WheelInstallationError):
+        installer.install(package)
+
+    assert not (env.site_packages / "demo").exists()
+
+
+def test_find_link_ignores_system_environments(pool, wheel):
+    installer = WheelInstaller(MockEnv(is_venv=False), NullIO(), pool)
+
+    assert installer.find_link(get_package(wheel)) is None
+
+
+def test_find_link_uses_pypi_for_packages_without_source(env, wheel, mocker):
+    repository = PyPiRepository()
+    installer = WheelInstaller(env, NullIO(), Pool([repository]))
+    package = get_package(wheel)
+    package.source_type = None
+    package.source_reference = None
+    package.source_url = None
+
+    link = Link("https://files.pythonhosted.org/{}".format(wheel.name))
+    mocker.patch.object(repository, "find_links_for_package", return_value=[link])
+
+    assert link == installer.find_link(package)
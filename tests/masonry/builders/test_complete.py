@@ -12,6 +12,7 @@ import zipfile
 
 import pytest
 
+from clikit.io import BufferedIO
 from clikit.io import NullIO
 
 from poetry import __version__
@@ -478,3 +479,48 @@ def test_package_with_include(mocker):
         assert "package_with_include/__init__.py" in names
         assert "tests/__init__.py" not in names
         assert "src_package/__init__.py" in names
+
+
+def test_complete_is_reproducible(environ):
+    os.environ["SOURCE_DATE_EPOCH"] = "1580601600"
+    module_path = fixtures_dir / "complete"
+    dist = module_path / "dist"
+
+    contents = []
+    for jobs in [1, 4]:
+        builder = CompleteBuilder(
+            Factory().create_poetry(module_path), NullEnv(), NullIO(), jobs=jobs
+        )
+        builder.build()
+
+        contents.append(
+            {path.name: path.read_bytes() for path in sorted(dist.iterdir())}
+        )
+        clear_samples_dist()
+
+    assert contents[0] == contents[1]
+
+    builder.build()
+
+    with tarfile.open(str(dist / "my-package-1.2.3.tar.gz"), "r") as tar:
+        assert {1580601600} == {member.mtime for member in tar.getmembers()}
+
+    with zipfile.ZipFile(str(dist / "my_package-1.2.3-py3-none-any.whl")) as z:
+        assert {(2020, 2, 2, 0, 0, 0)} == {info.date_time for info in z.infolist()}
+
+
+def test_complete_writes_the_wheel_output_after_the_sdist():
+    module_path = fixtures_dir / "complete"
+    io = BufferedIO()
+    builder = CompleteBuilder(
+        Factory().create_poetry(module_path), NullEnv(), io, jobs=4
+    )
+    builder.build()
+
+    assert [
+        " - Building sdist",
+        " - Built my-package-1.2.3.tar.gz",
+        "",
+        " - Building wheel",
+        " - Built my_package-1.2.3-py3-none-any.whl",
+    ] == io.fetch_output().splitlines()
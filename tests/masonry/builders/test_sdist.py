@@ -234,6 +234,22 @@ def test_find_packages():
     assert pkg_data == {"": ["*"]}
 
 
+def test_find_packages_includes_hidden_data_files(tmp_dir):
+    base = Path(tmp_dir) / "source_package"
+    shutil.copytree(str(project("source_package")), str(base))
+    data = base / "src" / "package_src" / "data"
+    data.mkdir()
+    (data / ".hidden").touch()
+
+    poetry = Factory().create_poetry(base)
+    builder = SdistBuilder(poetry, NullEnv(), NullIO())
+    include = PackageInclude(base, "package_src", source="src")
+
+    _, _, pkg_data = builder.find_packages(include)
+
+    assert pkg_data == {"": ["*"], "package_src": ["data/*"]}
+
+
 def test_package():
     poetry = Factory().create_poetry(project("complete"))
 
@@ -0,0 +1,108 @@
+import shutil
+
+import pytest
+
+from clikit.io import BufferedIO
+
+from poetry.factory import Factory
+from poetry.masonry import Builder
+from poetry.masonry.builders.complete import CompleteBuilder
+from poetry.masonry.utils.build_manifest import BuildManifest
+from poetry.utils._compat import Path
+from poetry.utils.env import NullEnv
+
+
+fixtures_dir = Path(__file__).parent / "builders" / "fixtures"
+
+
+@pytest.fixture
+def project(tmp_dir):
+    path = Path(tmp_dir, "complete")
+    shutil.copytree(str(fixtures_dir / "complete"), str(path))
+
+    return path
+
+
+def build(project, fmt="all", force=False):
+    io = BufferedIO()
+    Builder(Factory().create_poetry(project), NullEnv(), io, force=force).build(fmt)
+
+    return io.fetch_output()
+
+
+def test_build_reuses_up_to_date_distributions(project, mocker):
+    build(project)
+
+    spy = mocker.spy(CompleteBuilder, "build")
+    output = build(project)
+
+    assert 0 == spy.call_count
+    assert [
+        " - Skipped my-package-1.2.3.tar.gz (up to date)",
+        " - Skipped my_package-1.2.3-py3-none-any.whl (up to date)",
+    ] == output.splitlines()
+
+    build(project, force=True)
+
+    assert 1 == spy.call_count
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda project: project.joinpath("my_package", "__init__.py").write_text(
+            u"# Changed\n"
+        ),
+        lambda project: project.joinpath("LICENSE").write_text(u"Changed"),
+        lambda project: project.joinpath("dist", "my-package-1.2.3.tar.gz").unlink(),
+        lambda project: project.joinpath(
+            "dist", "my_package-1.2.3-py3-none-any.whl"
+        ).write_bytes(b""),
+    ],
+)
+def test_build_rebuilds_changed_distributions(project, mocker, change):
+    build(project)
+    change(project)
+
+    spy = mocker.spy(CompleteBuilder, "build")
+    build(project)
+
+    assert 1 == spy.call_count
+    assert project.joinpath("dist", "my-package-1.2.3.tar.gz").exists()
+
+
+def test_build_manifest_is_kept_per_format(project, mocker):
+    build(project, "sdist")
+    build(project, "wheel")
+
+    manifest = BuildManifest(project / "dist")
+
+    assert ["my-package-1.2.3.tar.gz"] == manifest.artifacts("sdist")
+    assert ["my_package-1.2.3-py3-none-any.whl"] == manifest.artifacts("wheel")
+    assert [] == manifest.artifacts("all")
+
+    spy = mocker.spy(CompleteBuilder, "build")
+    build(project, "sdist")
+    build(project, "all")
+
+    assert 1 == spy.call_count
+
+
+def test_build_fingerprints_the_project_once(project, mocker):
+    spy = mocker.spy(CompleteBuilder, "fingerprint")
+    build(project)
+
+    assert 1 == spy.call_count
+
+
+def test_forced_build_does_not_fingerprint_the_project(project, mocker):
+    build(project)
+
+    spy = mocker.spy(CompleteBuilder, "fingerprint")
+    build(project, force=True)
+
+    assert 0 == spy.call_count
+    assert [
+        "my-package-1.2.3.tar.gz",
+        "my_package-1.2.3-py3-none-any.whl",
+    ] == BuildManifest(project / "dist").artifacts("all")
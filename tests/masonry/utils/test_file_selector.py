@@ -0,0 +1,65 @@
+from glob import glob
+
+import pytest
+
+from poetry.masonry.utils.file_selector import FileSelector
+from poetry.utils._compat import Path
+
+
+FIXTURES = Path(__file__).parent.parent / "builders" / "fixtures"
+
+
+@pytest.fixture(autouse=True)
+def no_vcs(mocker):
+    mocker.patch("poetry.masonry.utils.file_selector.get_vcs", return_value=None)
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        "**/*.xml",
+        "**/data/",
+        "**/*/item*",
+        "*/my_package/**",
+        "*/my_package/*/",
+        "**/__init__.py",
+        "**/[!_]*.py",
+        "**/sub_pkg?/**/*.json",
+        "**/sub_pkg*/**",
+        "complete/my_package/sub_pkg1/extra_file.xml",
+        "**/README.rst/**",
+        "*/README.rs?/**",
+        "**",
+        "**/.*",
+        "*",
+    ],
+)
+def test_excluded_files_match_glob(pattern):
+    expected = {
+        Path(path).relative_to(FIXTURES).as_posix()
+        for path in glob(Path(FIXTURES, pattern).as_posix(), recursive=True)
+    }
+
+    assert expected == FileSelector(FIXTURES, [pattern]).find_excluded_files()
+
+
+def test_is_excluded_checks_parent_directories():
+    selector = FileSelector(FIXTURES / "complete", ["my_package/sub_pkg2/"])
+
+    assert selector.is_excluded("my_package/sub_pkg2/data2/data.json")
+    assert selector.is_excluded(Path("my_package/sub_pkg2"))
+    assert not selector.is_excluded("my_package/sub_pkg1/__init__.py")
+    assert not selector.is_excluded(FIXTURES / "complete/my_package/sub_pkg2")
+
+
+def test_vcs_is_queried_once(mocker):
+    vcs = mocker.MagicMock()
+    vcs.get_ignored_files.return_value = ["my_package/data1/test.json"]
+    mocker.patch("poetry.masonry.utils.file_selector.get_vcs", return_value=vcs)
+
+    selector = FileSelector(FIXTURES / "complete", ["**/*.xml"])
+
+    assert selector.is_excluded("my_package/data1/test.json")
+    assert selector.is_excluded("my_package/sub_pkg1/extra_file.xml")
+    assert not selector.is_excluded("my_package/__init__.py")
+    assert 1 == vcs.get_ignored_files.call_count
@@ -0,0 +1,24 @@
+import poetry.puzzle  # noqa  # isort:skip
+
+from poetry.mixology.partial_solution import PartialSolution  # isort:skip
+from poetry.packages import Dependency  # isort:skip
+
+
+def test_positive_derivation_after_negative_one_keeps_its_dependency():
+    solution = PartialSolution()
+    solution.derive(Dependency("foo", ">=2.0"), False, None)
+
+    dependency = Dependency(
+        "foo", ">=1.0", allows_prereleases=True, source_name="private"
+    )
+    dependency.extras.append("bar")
+    dependency.python_versions = ">=3.6"
+    solution.derive(dependency, True, None)
+
+    [unsatisfied] = solution.unsatisfied
+
+    assert ">=1.0,<2.0" == str(unsatisfied.constraint)
+    assert ["bar"] == unsatisfied.extras
+    assert "private" == unsatisfied.source_name
+    assert unsatisfied.allows_prereleases()
+    assert ">=3.6" == unsatisfied.python_versions
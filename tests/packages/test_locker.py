@@ -214,6 +214,34 @@ A = []
     assert "Unable to read the lock file" in str(e.value)
 
 
+def test_reading_lock_file_with_unsupported_toml_falls_back_on_tomlkit(locker):
+    content = u"""[[package]]
+category = "main"
+description = '''A multiline
+description'''
+name = "A"
+optional = false
+python-versions = "*"
+version = "1.0.0"
+
+[metadata]
+content-hash = "115cf985d932e9bf5f540555bbdd75decbb62cac81e399375fc19f6277f8c1d8"
+python-versions = "*"
+
+[metadata.files]
+A = []
+"""
+    with locker.lock.open("w", encoding="utf-8") as f:
+        f.write(content)
+
+    assert locker.is_fresh()
+
+    packages = locker.locked_repository().packages
+
+    assert 1 == len(packages)
+    assert "A multiline\ndescription" == packages[0].description
+
+
 def test_locking_legacy_repository_package_should_include_source_section(root, locker):
     package_a = get_package("A", "1.0.0")
     package_a.source_url = "https://foo.bar"
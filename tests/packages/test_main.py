@@ -1,3 +1,5 @@
+import pytest
+
 from poetry.packages import dependency_from_pep_508
 
 
@@ -191,3 +193,37 @@ def test_dependency_from_pep_508_with_url():
     assert "django-utils" == dep.name
     assert dep.is_url()
     assert "https://example.com/django-utils-1.0.0.tar.gz" == dep.url
+
+
+def test_dependency_from_pep_508_returns_independent_dependencies():
+    name = 'requests[security] (>=2.18); python_version >= "3.6"'
+
+    dep = dependency_from_pep_508(name)
+    dep.extras.append("socks")
+    dep.deactivate()
+
+    other = dependency_from_pep_508(name)
+
+    assert other is not dep
+    assert ["security"] == other.extras
+    assert not other.is_optional()
+    assert str(other.constraint) == ">=2.18"
+    assert str(other.marker) == 'python_version >= "3.6"'
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "",
+        "-requests",
+        "requests[security",
+        "requests (>=2.18",
+        "requests >=2.18,",
+        "requests;",
+        'requests; python_version >= "3.6" and',
+        'requests; python_version >= "3.6")',
+    ],
+)
+def test_dependency_from_pep_508_with_invalid_requirement(name):
+    with pytest.raises(ValueError):
+        dependency_from_pep_508(name)
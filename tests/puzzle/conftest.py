@@ -11,9 +11,9 @@ except ImportError:
     import urlparse
 
 
-def mock_clone(self, source, dest):
-    # Checking source to determine which folder we need to copy
-    parts = urlparse.urlparse(source)
+def mock_export(self, url, reference, dest):
+    # Checking the url to determine which folder we need to copy
+    parts = urlparse.urlparse(url)
 
     folder = (
         Path(__file__).parent.parent
@@ -26,13 +26,14 @@ def mock_clone(self, source, dest):
     shutil.rmtree(str(dest))
     shutil.copytree(str(folder), str(dest))
 
+    return "9cf87a285a2d3fbb0b9fa621997b3acc3631ed24"
+
 
 @pytest.fixture(autouse=True)
 def setup(mocker):
     # Patch git module to not actually clone projects
-    mocker.patch("poetry.vcs.git.Git.clone", new=mock_clone)
-    mocker.patch("poetry.vcs.git.Git.checkout", new=lambda *_: None)
-    p = mocker.patch("poetry.vcs.git.Git.rev_parse")
+    mocker.patch("poetry.vcs.git_cache.GitCache.export", new=mock_export)
+    p = mocker.patch("poetry.vcs.git_cache.GitCache.revision")
     p.return_value = "9cf87a285a2d3fbb0b9fa621997b3acc3631ed24"
 
     yield
@@ -0,0 +1,85 @@
+import threading
+
+import pytest
+
+from poetry.puzzle.metadata_cache import MetadataCache
+from tests.helpers import get_package
+
+
+def test_package_returns_copies_of_the_cached_package():
+    cache = MetadataCache()
+    package = get_package("A", "1.0")
+    package.add_dependency("B", "^1.0")
+
+    first = cache.package(("a", "1.0"), lambda: package)
+    first.requires[0].transitive_python_versions = ">=3.6"
+    first.requires = []
+
+    second = cache.package(("a", "1.0"), lambda: None)
+
+    assert first is not second
+    assert second == package
+    assert 1 == len(second.requires)
+    assert "*" == second.requires[0].transitive_python_versions
+    assert "*" == package.requires[0].transitive_python_versions
+
+
+def test_find_packages_returns_copies_of_the_cached_packages():
+    cache = MetadataCache()
+    package = get_package("A", "1.0")
+    package.add_dependency("B", "^1.0")
+
+    [first] = cache.find_packages(("a",), lambda: [package])
+    first.requires[0].transitive_python_versions = ">=3.6"
+    first.requires = []
+
+    [second] = cache.find_packages(("a",), lambda: [])
+
+    assert first is not second
+    assert 1 == len(second.requires)
+    assert "*" == second.requires[0].transitive_python_versions
+    assert "*" == package.requires[0].transitive_python_versions
+
+
+def test_concurrent_requests_retrieve_the_metadata_once():
+    cache = MetadataCache()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def find_packages():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+
+        return [get_package("A", "1.0")]
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(cache.find_packages(("a",), find_packages))
+        )
+        for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+
+    started.wait(5)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert 1 == len(calls)
+    assert [[get_package("A", "1.0")]] * 3 == results
+
+
+def test_failures_are_not_cached():
+    cache = MetadataCache()
+
+    def fail():
+        raise RuntimeError("Unavailable")
+
+    with pytest.raises(RuntimeError):
+        cache.find_packages(("a",), fail)
+
+    assert [] == cache.find_packages(("a",), lambda: [])
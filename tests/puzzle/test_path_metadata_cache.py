@@ -0,0 +1,88 @@
+import pytest
+
+from poetry.puzzle.path_metadata_cache import PathMetadataCache
+from poetry.utils._compat import Path
+
+
+@pytest.fixture
+def cache(tmp_dir):
+    return PathMetadataCache(Path(tmp_dir, "cache"))
+
+
+@pytest.fixture
+def project(tmp_dir):
+    path = Path(tmp_dir, "project")
+    path.mkdir()
+    path.joinpath("setup.py").write_text(u"from setuptools import setup\n")
+
+    return path
+
+
+def test_directory_metadata_is_cached(cache, project):
+    calls = []
+
+    def factory():
+        calls.append(None)
+
+        return {"name": "demo", "version": "0.1.{}".format(len(calls))}
+
+    assert "0.1.1" == cache.directory_metadata(project, factory)["version"]
+    assert "0.1.1" == cache.directory_metadata(project, factory)["version"]
+    assert 1 == len(calls)
+
+    # Other files of the project are not taken into account
+    project.joinpath("README.rst").write_text(u"Demo")
+    assert "0.1.1" == cache.directory_metadata(project, factory)["version"]
+
+
+@pytest.mark.parametrize("filename", ["setup.py", "setup.cfg", "pyproject.toml"])
+def test_directory_metadata_is_invalidated_by_project_files(cache, project, filename):
+    versions = iter(["0.1.1", "0.1.2"])
+
+    def factory():
+        return {"version": next(versions)}
+
+    assert "0.1.1" == cache.directory_metadata(project, factory)["version"]
+
+    project.joinpath(filename).write_text(u"# Changed\n")
+
+    assert "0.1.2" == cache.directory_metadata(project, factory)["version"]
+
+
+def test_directory_metadata_is_keyed_on_the_interpreter(cache, project, mocker):
+    assert {"version": "0.1.1"} == cache.directory_metadata(
+        project, lambda: {"version": "0.1.1"}
+    )
+
+    mocker.patch(
+        "poetry.puzzle.path_metadata_cache.interpreter_tag", return_value="pypy-3.6.9",
+    )
+
+    assert {"version": "0.1.2"} == cache.directory_metadata(
+        project, lambda: {"version": "0.1.2"}
+    )
+
+
+def test_file_metadata_is_keyed_on_content(cache, tmp_dir):
+    first = Path(tmp_dir, "demo-0.1.0.tar.gz")
+    first.write_bytes(b"first")
+    second = Path(tmp_dir, "copy", "demo-0.1.0.tar.gz")
+    second.parent.mkdir()
+    second.write_bytes(b"first")
+
+    assert {"name": "demo"} == cache.file_metadata(first, lambda: {"name": "demo"})
+    assert {"name": "demo"} == cache.file_metadata(second, lambda: {"name": "other"})
+
+    second.write_bytes(b"second")
+
+    assert {"name": "other"} == cache.file_metadata(second, lambda: {"name": "other"})
+
+
+def test_corrupted_entries_are_retrieved_again(cache, project):
+    cache.directory_metadata(project, lambda: {"version": "0.1.1"})
+    for path in cache.cache_dir.glob("directories/*/*.json"):
+        path.write_text(u"{")
+
+    assert {"version": "0.1.2"} == cache.directory_metadata(
+        project, lambda: {"version": "0.1.2"}
+    )
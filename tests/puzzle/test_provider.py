@@ -1,3 +1,5 @@
+import shutil
+
 from subprocess import CalledProcessError
 
 import pytest
@@ -16,6 +18,7 @@ from poetry.utils._compat import Path
 from poetry.utils.env import EnvCommandError
 from poetry.utils.env import MockEnv as BaseMockEnv
 from tests.helpers import get_dependency
+from tests.helpers import get_package
 
 
 class MockEnv(BaseMockEnv):
@@ -414,3 +417,90 @@ def test_search_for_file_wheel_with_extras(provider):
         "foo": [get_dependency("cleo")],
         "bar": [get_dependency("tomlkit")],
     }
+
+
+def test_search_for_uses_prefetched_packages(provider, repository, mocker):
+    repository.add_package(get_package("foo", "1.0.0"))
+    repository.add_package(get_package("foo", "1.1.0"))
+
+    dependency = get_dependency("foo", "^1.0")
+    provider.prefetch(dependency)
+
+    find_packages = mocker.spy(repository, "find_packages")
+    packages = provider.search_for(dependency)
+
+    assert find_packages.call_count == 0
+    assert [p.version.text for p in packages] == ["1.1.0", "1.0.0"]
+
+
+def test_complete_package_uses_prefetched_package(provider, repository, mocker):
+    repository.add_package(get_package("foo", "1.0.0"))
+    repository.add_package(get_package("foo", "1.1.0"))
+
+    dependency = get_dependency("foo", "^1.0")
+    provider.prefetch(dependency)
+    packages = provider.search_for(dependency)
+
+    package = mocker.spy(repository, "package")
+    completed = provider.complete_package(packages[0])
+
+    assert package.call_count == 0
+    assert completed.version.text == "1.1.0"
+
+
+def test_prefetch_uses_locked_version(provider, repository, mocker):
+    repository.add_package(get_package("foo", "1.0.0"))
+    repository.add_package(get_package("foo", "1.1.0"))
+
+    dependency = get_dependency("foo", "^1.0")
+    provider.prefetch(dependency, locked=get_package("foo", "1.0.0"))
+    packages = provider.search_for(dependency)
+
+    package = mocker.spy(repository, "package")
+    provider.complete_package(packages[1])
+
+    assert package.call_count == 0
+
+
+def test_cancel_prefetches_discards_unused_results(provider, repository, mocker):
+    repository.add_package(get_package("foo", "1.0.0"))
+
+    dependency = get_dependency("foo", "^1.0")
+    provider.prefetch(dependency)
+    provider.cancel_prefetches()
+
+    find_packages = mocker.spy(repository, "find_packages")
+    provider.search_for(dependency)
+
+    assert find_packages.call_count == 1
+
+
+def test_get_package_from_directory_caches_setup_metadata(tmp_dir, mocker):
+    directory = Path(tmp_dir, "demo")
+    shutil.copytree(
+        str(
+            Path(__file__).parent.parent
+            / "fixtures"
+            / "git"
+            / "github.com"
+            / "demo"
+            / "demo"
+        ),
+        str(directory),
+    )
+    get_setup_metadata = mocker.spy(Provider, "get_setup_metadata")
+
+    package = Provider.get_package_from_directory(directory, name="demo")
+    cached = Provider.get_package_from_directory(directory, name="demo")
+
+    assert 1 == get_setup_metadata.call_count
+    assert package.version == cached.version
+    assert package.requires == cached.requires
+    assert package.extras == cached.extras
+
+    with directory.joinpath("setup.py").open("a", encoding="utf-8") as f:
+        f.write(u"\n")
+
+    Provider.get_package_from_directory(directory, name="demo")
+
+    assert 2 == get_setup_metadata.call_count
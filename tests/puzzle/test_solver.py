@@ -1,3 +1,5 @@
+import time
+
 import pytest
 
 from clikit.io import NullIO
@@ -5,6 +7,7 @@ from clikit.io import NullIO
 from poetry.packages import ProjectPackage
 from poetry.packages import dependency_from_pep_508
 from poetry.puzzle import Solver
+from poetry.puzzle.provider import Provider
 from poetry.puzzle.exceptions import SolverProblemError
 from poetry.repositories.installed_repository import InstalledRepository
 from poetry.repositories.pool import Pool
@@ -879,6 +882,111 @@ def test_solver_duplicate_dependencies_sub_dependencies(solver, repo, package):
     assert str(op.package.marker) == 'python_version >= "3.4"'
 
 
+def test_solver_duplicate_dependencies_solves_branches_concurrently(
+    solver, repo, package
+):
+    package.python_versions = "~2.7 || ^3.4"
+    package.add_dependency("A")
+    package.add_dependency("D")
+
+    package_a = get_package("A", "1.0")
+    package_a.add_dependency("B", {"version": "^1.0", "python": "<3.4"})
+    package_a.add_dependency("B", {"version": "^2.0", "python": ">=3.4,<3.6"})
+    package_a.add_dependency("B", {"version": "^3.0", "python": ">=3.6"})
+
+    package_b10 = get_package("B", "1.0")
+    package_b20 = get_package("B", "2.0")
+    package_b30 = get_package("B", "3.0")
+    for package_b in [package_b10, package_b20, package_b30]:
+        package_b.add_dependency("C", "^1.0")
+
+    package_c = get_package("C", "1.0")
+    package_d = get_package("D", "1.0")
+
+    for pkg in [package_a, package_b10, package_b20, package_b30, package_c]:
+        repo.add_package(pkg)
+    repo.add_package(package_d)
+
+    ops = solver.solve()
+
+    check_solver_result(
+        ops,
+        [
+            {"job": "install", "package": package_c},
+            {"job": "install", "package": package_b10},
+            {"job": "install", "package": package_b20},
+            {"job": "install", "package": package_b30},
+            {"job": "install", "package": package_a},
+            {"job": "install", "package": package_d},
+        ],
+    )
+
+    assert "~2.7 || ^3.4" == package.python_versions
+    assert str(ops[1].package.marker) == 'python_version < "3.4"'
+    assert (
+        str(ops[2].package.marker)
+        == 'python_version >= "3.4" and python_version < "3.6"'
+    )
+    assert str(ops[3].package.marker) == 'python_version >= "3.6"'
+
+
+def test_solver_duplicate_dependencies_inspects_local_packages_one_at_a_time(
+    solver, repo, package, mocker
+):
+    search_for_file = Provider.search_for_file
+    running = []
+    overlaps = []
+
+    def search_for_file_slowly(self, dependency):
+        running.append(dependency)
+        overlaps.append(len(running))
+        time.sleep(0.05)
+        try:
+            return search_for_file(self, dependency)
+        finally:
+            running.remove(dependency)
+
+    mocker.patch.object(Provider, "search_for_file", new=search_for_file_slowly)
+
+    package.python_versions = "~2.7 || ^3.4"
+    package.add_dependency("A")
+    package.add_dependency(
+        "demo",
+        {
+            "path": (
+                Path(__file__).parent.parent
+                / "fixtures"
+                / "distributions"
+                / "demo-0.1.0-py2.py3-none-any.whl"
+            ).as_posix()
+        },
+    )
+
+    package_a = get_package("A", "1.0")
+    package_a.add_dependency("B", {"version": "^1.0", "python": "<3.4"})
+    package_a.add_dependency("B", {"version": "^2.0", "python": ">=3.4"})
+
+    package_b10 = get_package("B", "1.0")
+    package_b20 = get_package("B", "2.0")
+    pendulum = get_package("pendulum", "2.0.3")
+    for pkg in [package_a, package_b10, package_b20, pendulum]:
+        repo.add_package(pkg)
+
+    ops = solver.solve()
+
+    check_solver_result(
+        ops,
+        [
+            {"job": "install", "package": package_b10},
+            {"job": "install", "package": package_b20},
+            {"job": "install", "package": pendulum},
+            {"job": "install", "package": package_a},
+            {"job": "install", "package": get_package("demo", "0.1.0")},
+        ],
+    )
+    assert {1} == set(overlaps)
+
+
 def test_solver_fails_if_dependency_name_does_not_match_package(solver, repo, package):
     package.add_dependency("my-demo", {"git": "https://github.com/demo/demo.git"})
 
@@ -1121,6 +1229,59 @@ def test_solver_sets_appropriate_markers_when_solving(solver, repo, package):
     assert str(ops[1].package.marker) == ""
 
 
+def test_solver_merges_markers_of_packages_shared_by_several_dependencies(
+    solver, repo, package
+):
+    package.add_dependency("A", "^1.0")
+    package.add_dependency("B", "^1.0")
+    package.add_dependency("C", "^1.0", category="dev")
+
+    package_a = get_package("A", "1.0.0")
+    package_a.requires.append(
+        dependency_from_pep_508('D (>=1.0); sys_platform == "win32"')
+    )
+    package_b = get_package("B", "1.0.0")
+    package_b.requires.append(
+        dependency_from_pep_508('D (>=1.0); sys_platform == "linux"')
+    )
+    package_c = get_package("C", "1.0.0")
+    package_c.add_dependency("F", "^1.0")
+    package_d = get_package("D", "1.0.0")
+    package_d.add_dependency("E", "^1.0")
+    package_e = get_package("E", "1.0.0")
+    package_f = get_package("F", "1.0.0")
+
+    for pkg in [package_a, package_b, package_c, package_d, package_e, package_f]:
+        repo.add_package(pkg)
+
+    ops = solver.solve()
+
+    check_solver_result(
+        ops,
+        [
+            {"job": "install", "package": package_e},
+            {"job": "install", "package": package_d},
+            {"job": "install", "package": package_f},
+            {"job": "install", "package": package_a},
+            {"job": "install", "package": package_b},
+            {"job": "install", "package": package_c},
+        ],
+    )
+
+    packages = {op.package.name: op.package for op in ops}
+    assert [2, 1, 1, 0, 0, 0] == [op.priority for op in ops]
+    assert "main" == packages["d"].category
+    assert "main" == packages["e"].category
+    assert "dev" == packages["c"].category
+    assert "dev" == packages["f"].category
+    assert 'sys_platform == "win32" or sys_platform == "linux"' == str(
+        packages["d"].marker
+    )
+    assert 'sys_platform == "win32" or sys_platform == "linux"' == str(
+        packages["e"].marker
+    )
+
+
 def test_solver_does_not_trigger_new_resolution_on_duplicate_dependencies_if_only_extras(
     solver, repo, package
 ):
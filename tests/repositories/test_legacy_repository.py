@@ -1,3 +1,4 @@
+import json
 import shutil
 
 import pytest
@@ -7,6 +8,7 @@ from poetry.repositories.auth import Auth
 from poetry.repositories.exceptions import PackageNotFound
 from poetry.repositories.legacy_repository import LegacyRepository
 from poetry.repositories.legacy_repository import Page
+from poetry.semver import Version
 from poetry.utils._compat import PY35
 from poetry.utils._compat import Path
 
@@ -37,6 +39,12 @@ class MockRepository(LegacyRepository):
         with fixture.open(encoding="utf-8") as f:
             return Page(self._url + endpoint, f.read(), {})
 
+    def _open_remote_file(self, url):
+        filename = urlparse.urlparse(url).path.rsplit("/")[-1]
+        filepath = self.FIXTURES.parent / "pypi.org" / "dists" / filename
+
+        return filepath.open("rb")
+
     def _download(self, url, dest):
         filename = urlparse.urlparse(url).path.rsplit("/")[-1]
         filepath = self.FIXTURES.parent / "pypi.org" / "dists" / filename
@@ -72,6 +80,89 @@ def test_sdist_format_support():
     assert bz2_links[0].filename == "poetry-0.1.1.tar.bz2"
 
 
+def test_page_parses_anchors_without_building_a_document():
+    content = b"""<!DOCTYPE html>
+<html>
+  <body>
+    <!-- <a href="poetry-0.0.1.tar.gz">poetry-0.0.1.tar.gz</a> -->
+    <A HREF="poetry-0.1.0.tar.gz#sha256=abcdef" data-requires-python=">=3.6">x</A>
+    <a class=link href=poetry-0.1.0-py3-none-any.whl>poetry-0.1.0-py3-none-any.whl</a>
+    <a href='poetry-0.2.0.zip' data-requires-python="&gt;=2.7, !=3.0.*">y</a>
+    <a href="poetry-0.2.0.exe">poetry-0.2.0.exe</a>
+    <a name="no-href">z</a>
+  </body>
+</html>"""
+    page = Page(
+        "https://foo.bar/simple/poetry",
+        content,
+        {"Content-Type": "text/html; charset=utf-8"},
+    )
+
+    assert ["0.1.0", "0.2.0"] == [v.text for v in page.versions]
+
+    links = list(page.links_for_version(Version.parse("0.1.0")))
+    assert [
+        "https://foo.bar/simple/poetry/poetry-0.1.0.tar.gz#sha256=abcdef",
+        "https://foo.bar/simple/poetry/poetry-0.1.0-py3-none-any.whl",
+    ] == [link.url for link in links]
+    assert "abcdef" == links[0].hash
+    assert ">=3.6" == links[0].requires_python
+    assert links[1].requires_python is None
+
+    links = list(page.links_for_version(Version.parse("0.2.0")))
+    assert [">=2.7, !=3.0.*"] == [link.requires_python for link in links]
+    assert [] == list(page.links_for_version(Version.parse("1.0.0")))
+
+
+def test_page_unescapes_attributes_once():
+    content = b'<a href="poetry-0.1.0.tar.gz" data-requires-python="&amp;gt;=3.6">x</a>'
+    page = Page(
+        "https://foo.bar/simple/poetry",
+        content,
+        {"Content-Type": "text/html; charset=utf-8"},
+    )
+
+    assert ["&gt;=3.6"] == [link.requires_python for link in page.links]
+
+
+def test_page_supports_the_json_simple_api():
+    content = json.dumps(
+        {
+            "meta": {"api-version": "1.0"},
+            "name": "poetry",
+            "files": [
+                {
+                    "filename": "poetry-0.1.0.tar.gz",
+                    "url": "https://files.foo.bar/poetry-0.1.0.tar.gz",
+                    "hashes": {"md5": "123456", "sha256": "abcdef"},
+                    "requires-python": ">=3.6",
+                },
+                {
+                    "filename": "poetry-0.1.0-py3-none-any.whl",
+                    "url": "../../files/poetry-0.1.0-py3-none-any.whl",
+                    "hashes": {},
+                },
+            ],
+        }
+    ).encode("utf-8")
+    page = Page(
+        "https://foo.bar/simple/poetry/",
+        content,
+        {"Content-Type": "application/vnd.pypi.simple.v1+json"},
+    )
+
+    assert ["0.1.0"] == [v.text for v in page.versions]
+
+    links = list(page.links)
+    assert [
+        "https://files.foo.bar/poetry-0.1.0.tar.gz#sha256=abcdef",
+        "https://foo.bar/files/poetry-0.1.0-py3-none-any.whl",
+    ] == [link.url for link in links]
+    assert ("sha256", "abcdef") == (links[0].hash_name, links[0].hash)
+    assert ">=3.6" == links[0].requires_python
+    assert links[1].hash is None
+
+
 def test_missing_version():
     repo = MockRepository()
 
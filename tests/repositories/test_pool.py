@@ -1,9 +1,41 @@
+import threading
+import time
+
 import pytest
 
 from poetry.repositories import Pool
 from poetry.repositories import Repository
+from requests.exceptions import ConnectTimeout
+
 from poetry.repositories.exceptions import PackageNotFound
+from poetry.repositories.exceptions import RepositoryTimeout
 from poetry.repositories.legacy_repository import LegacyRepository
+from tests.helpers import get_package
+
+
+class NamedRepository(Repository):
+    def __init__(self, name, packages=None, delay=0, release=None):
+        super(NamedRepository, self).__init__(packages)
+
+        self._name = name
+        self._delay = delay
+        self._release = release
+
+    def _wait(self):
+        if self._release is not None:
+            self._release.wait(5)
+
+        time.sleep(self._delay)
+
+    def package(self, name, version, extras=None):
+        self._wait()
+
+        return super(NamedRepository, self).package(name, version, extras=extras)
+
+    def find_packages(self, *args, **kwargs):
+        self._wait()
+
+        return super(NamedRepository, self).find_packages(*args, **kwargs)
 
 
 def test_pool_raises_package_not_found_when_no_package_is_found():
@@ -69,3 +101,164 @@ def test_repository_with_normal_default_and_secondary_repositories():
     assert pool.repository("foo") is repo1
     assert pool.repository("bar") is repo2
     assert pool.has_default()
+
+
+def test_package_prefers_the_repositories_in_order():
+    release = threading.Event()
+    first = NamedRepository("first", [get_package("foo", "1.0.0")], release=release)
+    second = NamedRepository("second", [get_package("foo", "1.0.0")])
+    first.packages[0].source_url = "first"
+    second.packages[0].source_url = "second"
+    pool = Pool([first, second])
+
+    threading.Timer(0.05, release.set).start()
+    package = pool.package("foo", "1.0.0")
+
+    assert "first" == package.source_url
+
+
+def test_package_does_not_query_repositories_of_lower_priority(mocker):
+    first = NamedRepository("first", [get_package("foo", "1.0.0")])
+    second = NamedRepository("second", [get_package("foo", "1.0.0")])
+    package = mocker.spy(second, "package")
+    pool = Pool([first, second])
+
+    assert "foo" == pool.package("foo", "1.0.0").name
+    assert 0 == package.call_count
+    assert "second" not in pool.stats
+
+
+def test_package_falls_back_to_repositories_of_lower_priority():
+    first = NamedRepository("first")
+    second = NamedRepository("second", [get_package("foo", "1.0.0")])
+    second.packages[0].source_url = "second"
+    pool = Pool([first, second])
+
+    assert "second" == pool.package("foo", "1.0.0").source_url
+    assert 1 == pool.stats["first"]["requests"]
+    assert 1 == pool.stats["second"]["requests"]
+
+
+def test_package_fails_when_a_repository_does_not_answer_in_time(mocker):
+    release = threading.Event()
+    first = NamedRepository("first", [get_package("foo", "1.0.0")], release=release)
+    second = NamedRepository("second", [get_package("foo", "1.0.0")])
+    package = mocker.spy(second, "package")
+    pool = Pool([first, second], timeout=0.1)
+
+    try:
+        with pytest.raises(RepositoryTimeout):
+            pool.package("foo", "1.0.0")
+    finally:
+        release.set()
+        pool.close()
+
+    assert 0 == package.call_count
+    assert 1 == pool.stats["first"]["timeouts"]
+
+
+def test_package_fails_when_a_request_to_a_repository_times_out(mocker):
+    repo = NamedRepository("foo")
+    mocker.patch.object(repo, "package", side_effect=ConnectTimeout())
+    pool = Pool([repo], timeout=0.1)
+
+    try:
+        with pytest.raises(RepositoryTimeout):
+            pool.package("foo", "1.0.0")
+    finally:
+        pool.close()
+
+    assert 1 == pool.stats["foo"]["timeouts"]
+
+
+def test_timeout_does_not_count_the_time_spent_waiting_for_a_thread():
+    repo = NamedRepository("foo", [get_package("foo", "1.0.0")], delay=0.15)
+    pool = Pool([repo], timeout=0.25)
+    pool.CONCURRENT_LOOKUPS = 1
+
+    errors = []
+
+    def lookup():
+        try:
+            pool.package("foo", "1.0.0")
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=lookup) for _ in range(2)]
+    try:
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+    finally:
+        pool.close()
+
+    assert [] == errors
+    assert 2 == pool.stats["foo"]["requests"]
+
+
+def test_timeout_is_passed_to_the_repositories():
+    first = NamedRepository("first")
+    pool = Pool([first], timeout=10)
+    second = NamedRepository("second")
+    pool.add_repository(second)
+
+    assert 10 == first.timeout
+    assert 10 == second.timeout
+
+    pool.timeout = 5
+
+    assert 5 == first.timeout
+    assert 5 == second.timeout
+
+
+def test_find_packages_queries_repositories_concurrently():
+    first = NamedRepository("first", [get_package("foo", "1.0.0")], delay=0.2)
+    second = NamedRepository("second", [get_package("foo", "2.0.0")], delay=0.2)
+    pool = Pool([first, second])
+
+    start = time.time()
+    packages = pool.find_packages("foo")
+
+    assert time.time() - start < 0.4
+    assert ["1.0.0", "2.0.0"] == [p.version.text for p in packages]
+    assert 1 == pool.stats["first"]["requests"]
+    assert 1 == pool.stats["second"]["requests"]
+
+
+def test_find_packages_fails_when_a_repository_does_not_answer_in_time():
+    release = threading.Event()
+    first = NamedRepository("first", [get_package("foo", "1.0.0")], release=release)
+    second = NamedRepository("second", [get_package("foo", "2.0.0")])
+    pool = Pool([first, second], timeout=0.1)
+
+    try:
+        with pytest.raises(RepositoryTimeout):
+            pool.find_packages("foo")
+    finally:
+        release.set()
+        pool.close()
+
+    assert 1 == pool.stats["first"]["timeouts"]
+    assert 0 == pool.stats["second"]["timeouts"]
+
+
+def test_close_stops_the_threads_of_the_pool():
+    first = NamedRepository("first", [get_package("foo", "1.0.0")])
+    second = NamedRepository("second", [get_package("foo", "2.0.0")])
+    pool = Pool([first, second])
+
+    pool.find_packages("foo")
+    executor = pool._executor
+    pool.close()
+
+    assert executor is not None
+    assert pool._executor is None
+    with pytest.raises(RuntimeError):
+        executor.submit(time.time)
+
+    # The threads are started again when needed
+    assert 2 == len(pool.find_packages("foo"))
+
+    pool.close()
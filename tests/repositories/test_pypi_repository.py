@@ -13,6 +13,7 @@ from poetry.repositories.pypi_repository import PyPiRepository
 from poetry.utils._compat import PY35
 from poetry.utils._compat import Path
 from poetry.utils._compat import encode
+from poetry.utils.remote_file import LazyRemoteFile
 
 
 class MockRepository(PyPiRepository):
@@ -46,6 +47,11 @@ class MockRepository(PyPiRepository):
         with fixture.open(encoding="utf-8") as f:
             return json.loads(f.read())
 
+    def _open_remote_file(self, url):
+        filename = url.split("/")[-1]
+
+        return (self.DIST_FIXTURES / filename).open("rb")
+
     def _download(self, url, dest):
         filename = url.split("/")[-1]
 
@@ -208,3 +214,179 @@ def test_get_should_invalid_cache_on_too_many_redirects_error(mocker):
     repository._get("https://pypi.org/pypi/async-timeout/json")
 
     assert delete_cache.called
+
+
+def test_find_packages_skips_yanked_releases():
+    class YankingRepository(MockRepository):
+        def _get(self, url):
+            data = super(YankingRepository, self)._get(url)
+            for file_info in data["releases"]["2.18.4"]:
+                file_info["yanked"] = True
+
+            return data
+
+    repo = YankingRepository()
+
+    versions = [p.version.text for p in repo.find_packages("requests", "^2.18")]
+    assert "2.18.4" not in versions
+
+    packages = repo.find_packages("requests", "2.18.4")
+    assert [p.version.text for p in packages] == ["2.18.4"]
+
+
+def test_release_index_is_persisted_and_revalidated(http, mocker, tmp_dir):
+    mocker.patch("poetry.repositories.pypi_repository.CACHE_DIR", tmp_dir)
+
+    fixture = MockRepository.JSON_FIXTURES / "requests.json"
+    with fixture.open(encoding="utf-8") as f:
+        content = f.read()
+
+    http.register_uri(
+        http.GET,
+        "https://pypi.org/pypi/requests/json",
+        responses=[
+            http.Response(
+                body=content, etag='"abcdef"', cache_control="max-age=0", status=200
+            ),
+            http.Response(body="", etag='"abcdef"', status=304),
+        ],
+    )
+
+    packages = PyPiRepository().find_packages("requests", "^2.18")
+    assert len(packages) == 5
+
+    packages = PyPiRepository().find_packages("requests", "^2.18")
+    assert len(packages) == 5
+
+    assert http.last_request().headers["If-None-Match"] == '"abcdef"'
+
+
+def test_release_index_recovers_from_too_many_redirects(http, mocker, tmp_dir):
+    mocker.patch("poetry.repositories.pypi_repository.CACHE_DIR", tmp_dir)
+
+    fixture = MockRepository.JSON_FIXTURES / "requests.json"
+    with fixture.open(encoding="utf-8") as f:
+        http.register_uri(
+            http.GET, "https://pypi.org/pypi/requests/json", body=f.read()
+        )
+
+    repository = PyPiRepository()
+    get = repository._index_session.get
+    mocker.patch.object(
+        repository._index_session,
+        "get",
+        side_effect=[TooManyRedirects(), get("https://pypi.org/pypi/requests/json")],
+    )
+    delete_cache = mocker.patch.object(repository._cache_control_cache, "delete")
+
+    assert len(repository.find_packages("requests", "^2.18")) == 5
+    assert delete_cache.called
+
+
+def test_release_index_recovers_from_corrupted_entries(http, mocker, tmp_dir):
+    mocker.patch("poetry.repositories.pypi_repository.CACHE_DIR", tmp_dir)
+
+    fixture = MockRepository.JSON_FIXTURES / "requests.json"
+    with fixture.open(encoding="utf-8") as f:
+        http.register_uri(
+            http.GET, "https://pypi.org/pypi/requests/json", body=f.read()
+        )
+
+    repository = PyPiRepository()
+    repository._cache.store("index").forever("requests", {"releases": {}})
+
+    assert len(repository.find_packages("requests", "^2.18")) == 5
+
+    releases = repository._cache.store("index").get("requests")["releases"]
+    assert {"yanked": False} == releases["2.18.4"]
+
+
+def _serve_wheel(http, url, content, ranges=True):
+    requested = []
+
+    def callback(request, uri, headers):
+        byte_range = request.headers.get("Range")
+        requested.append(byte_range)
+        if not ranges or byte_range is None:
+            return [200, headers, content]
+
+        start, end = byte_range[len("bytes=") :].split("-")
+        if not start:
+            start, end = max(len(content) - int(end), 0), len(content) - 1
+
+        start, end = int(start), min(int(end), len(content) - 1)
+        headers["Content-Range"] = "bytes {}-{}/{}".format(start, end, len(content))
+
+        return [206, headers, content[start : end + 1]]
+
+    http.register_uri(http.GET, url, body=callback)
+
+    return requested
+
+
+def test_get_info_from_wheel_only_retrieves_needed_parts(http, mocker):
+    fixture = MockRepository.DIST_FIXTURES / "ipython-7.5.0-py3-none-any.whl"
+    with fixture.open("rb") as f:
+        content = f.read()
+
+    url = "https://files.pythonhosted.org/ipython-7.5.0-py3-none-any.whl"
+    requested = _serve_wheel(http, url, content)
+    download = mocker.patch(
+        "poetry.repositories.pypi_repository.PyPiRepository._download"
+    )
+
+    repo = PyPiRepository()
+    repo._open_remote_file = lambda url: LazyRemoteFile(url, chunk_size=4096)
+    info = repo._get_info_from_wheel(url)
+
+    assert info == repo._inspector.inspect_wheel(fixture)
+    assert not download.called
+    assert None not in requested
+    assert len(requested) < len(content) // 4096
+
+
+def test_get_info_from_wheel_downloads_if_ranges_are_not_supported(
+    http, mocker, tmp_dir
+):
+    mocker.patch("poetry.utils.artifact_cache.CACHE_DIR", tmp_dir)
+    fixture = MockRepository.DIST_FIXTURES / "ipython-7.5.0-py3-none-any.whl"
+    with fixture.open("rb") as f:
+        content = f.read()
+
+    url = "https://files.pythonhosted.org/ipython-7.5.0-py3-none-any.whl"
+    _serve_wheel(http, url, content, ranges=False)
+    download = mocker.patch(
+        "poetry.repositories.pypi_repository.PyPiRepository._download",
+        side_effect=lambda url, dest: shutil.copyfile(str(fixture), dest),
+    )
+
+    repo = PyPiRepository()
+    info = repo._get_info_from_wheel(url)
+
+    assert info == repo._inspector.inspect_wheel(fixture)
+    assert download.called
+
+    # The downloaded wheel is kept in the artifact cache
+    download.reset_mock()
+    assert info == repo._get_info_from_wheel(url)
+    assert not download.called
+
+
+@pytest.mark.parametrize("status", [403, 416, 501])
+def test_get_info_from_wheel_downloads_if_ranges_are_refused(
+    http, mocker, tmp_dir, status
+):
+    mocker.patch("poetry.utils.artifact_cache.CACHE_DIR", tmp_dir)
+    fixture = MockRepository.DIST_FIXTURES / "ipython-7.5.0-py3-none-any.whl"
+
+    url = "https://files.pythonhosted.org/ipython-7.5.0-py3-none-any.whl"
+    http.register_uri(http.GET, url, status=status)
+    download = mocker.patch(
+        "poetry.repositories.pypi_repository.PyPiRepository._download",
+        side_effect=lambda url, dest: shutil.copyfile(str(fixture), dest),
+    )
+
+    repo = PyPiRepository()
+
+    assert repo._inspector.inspect_wheel(fixture) == repo._get_info_from_wheel(url)
+    assert download.called
@@ -0,0 +1,49 @@
+from poetry.semver import Version
+from poetry.semver import VersionRange
+from poetry.semver import parse_constraint
+from poetry.semver.memoize import LRUCache
+from poetry.semver.memoize import memoize_operation
+
+
+def test_lru_cache_discards_least_recently_used_items():
+    cache = LRUCache(2)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert 1 == cache.get("a")
+
+    cache.set("c", 3)
+
+    assert 2 == len(cache)
+    assert 1 == cache.get("a")
+    assert cache.get("b") is None
+    assert 3 == cache.get("c")
+
+
+def test_memoized_operations_are_keyed_on_operands():
+    calls = []
+
+    class Operand(object):
+        @memoize_operation(maxsize=8)
+        def combine(self, other):
+            calls.append((self, other))
+
+            return (self, other)
+
+    a, b = Operand(), Operand()
+
+    assert (a, b) == a.combine(b)
+    assert (a, b) == a.combine(b)
+    assert (b, a) == b.combine(a)
+    assert [(a, b), (b, a)] == calls
+
+
+def test_memoized_constraint_operations_return_the_same_results():
+    range_ = VersionRange(Version.parse("1.0.0"), Version.parse("2.0.0"), True)
+    union = parse_constraint(">=1.5.0,<1.6.0 || >=3.0.0")
+
+    for _ in range(2):
+        assert str(range_.intersect(union)) == ">=1.5.0,<1.6.0"
+        assert range_.allows_any(union)
+        assert not range_.allows_all(union)
+        assert str(union.difference(range_)) == ">=3.0.0"
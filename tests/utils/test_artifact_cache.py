@@ -0,0 +1,111 @@
+import hashlib
+import os
+
+import pytest
+
+from poetry.utils._compat import Path
+from poetry.utils.artifact_cache import ArtifactCache
+from poetry.utils.artifact_cache import ArtifactHashMismatch
+
+
+@pytest.fixture(autouse=True)
+def new_process():
+    # Every test starts like a new process, which has not used any artifact
+    ArtifactCache._used.clear()
+
+
+@pytest.fixture
+def cache(tmp_dir):
+    return ArtifactCache(Path(tmp_dir) / "artifacts")
+
+
+class Downloader(object):
+    def __init__(self, contents):
+        self._contents = contents
+        self.downloads = []
+
+    def __call__(self, url, dest):
+        self.downloads.append(url)
+
+        with open(dest, "wb") as f:
+            f.write(self._contents[url.split("/")[-1]])
+
+
+def sha256(content):
+    return hashlib.sha256(content).hexdigest()
+
+
+def test_get_downloads_artifacts_once(cache):
+    download = Downloader({"demo-0.1.0.tar.gz": b"demo"})
+    url = "https://foo.bar/demo-0.1.0.tar.gz"
+
+    path = cache.get(url, download=download)
+
+    assert "demo-0.1.0.tar.gz" == path.name
+    assert b"demo" == path.read_bytes()
+    assert path == cache.get(url, download=download)
+    assert [url] == download.downloads
+
+
+def test_get_finds_artifacts_by_hash_from_any_url(cache):
+    download = Downloader({"demo-0.1.0.tar.gz": b"demo"})
+    hash = "sha256:{}".format(sha256(b"demo"))
+
+    path = cache.get("https://foo.bar/demo-0.1.0.tar.gz", hash=hash, download=download)
+    other = cache.get(
+        "https://mirror.bar/demo-0.1.0.tar.gz#sha256={}".format(sha256(b"demo")),
+        download=download,
+    )
+
+    assert path == other
+    assert ["https://foo.bar/demo-0.1.0.tar.gz"] == download.downloads
+
+
+def test_get_checks_the_hash_of_downloaded_artifacts(cache):
+    download = Downloader({"demo-0.1.0.tar.gz": b"demo"})
+
+    with pytest.raises(ArtifactHashMismatch):
+        cache.get(
+            "https://foo.bar/demo-0.1.0.tar.gz", hash="md5:123456", download=download,
+        )
+
+    assert cache.find("https://foo.bar/demo-0.1.0.tar.gz") is None
+
+
+def test_evict_removes_least_recently_used_artifacts(tmp_dir):
+    cache = ArtifactCache(Path(tmp_dir) / "artifacts", max_size=10)
+    download = Downloader(
+        {"a-1.0.tar.gz": b"aaaa", "b-1.0.tar.gz": b"bbbb", "c-1.0.tar.gz": b"cccc"}
+    )
+
+    a = cache.get("https://foo.bar/a-1.0.tar.gz", download=download)
+    b = cache.get("https://foo.bar/b-1.0.tar.gz", download=download)
+    os.utime(str(a.parent), (1, 1))
+    os.utime(str(b.parent), (2, 2))
+    ArtifactCache._used.clear()
+
+    # Using a, which makes b the least recently used artifact
+    assert a == cache.get("https://foo.bar/a-1.0.tar.gz", download=download)
+
+    c = cache.get("https://foo.bar/c-1.0.tar.gz", download=download)
+
+    assert a.exists()
+    assert not b.exists()
+    assert c.exists()
+    assert cache.find("https://foo.bar/b-1.0.tar.gz") is None
+
+
+def test_evict_keeps_artifacts_used_by_the_process(tmp_dir):
+    cache = ArtifactCache(Path(tmp_dir) / "artifacts", max_size=10)
+    download = Downloader(
+        {"a-1.0.tar.gz": b"aaaa", "b-1.0.tar.gz": b"bbbb", "c-1.0.tar.gz": b"cccc"}
+    )
+
+    a = cache.get("https://foo.bar/a-1.0.tar.gz", download=download)
+    b = cache.get("https://foo.bar/b-1.0.tar.gz", download=download)
+    c = cache.get("https://foo.bar/c-1.0.tar.gz", download=download)
+
+    # The artifacts may still be installed by concurrent workers
+    assert a.exists()
+    assert b.exists()
+    assert c.exists()
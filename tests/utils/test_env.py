@@ -1,3 +1,4 @@
+import json
 import os
 import shutil
 import sys
@@ -11,6 +12,7 @@ from poetry.factory import Factory
 from poetry.semver import Version
 from poetry.utils._compat import WINDOWS
 from poetry.utils._compat import Path
+from poetry.utils._compat import decode
 from poetry.utils.env import EnvCommandError
 from poetry.utils.env import EnvManager
 from poetry.utils.env import NoCompatiblePythonVersionFound
@@ -23,6 +25,22 @@ MINIMAL_SCRIPT = """\
 print("Minimal Output"),
 """
 
+
+def get_interpreter_info(version_info=(3, 7, 1)):
+    return json.dumps(
+        {
+            "marker_env": {"version_info": list(version_info) + ["final", 0]},
+            "base_prefix": "/prefix",
+            "sys_path": [],
+            "config_vars": {},
+            "pip_version": "19.1",
+            "purelib": None,
+        }
+    )
+
+
+INTERPRETER_INFO = get_interpreter_info()
+
 # Script expected to fail.
 ERRORING_SCRIPT = """\
 import nullpackage
@@ -115,7 +133,7 @@ def test_activate_activates_non_existing_virtualenv_no_envs_file(
     )
     mocker.patch(
         "poetry.utils._compat.subprocess.Popen.communicate",
-        side_effect=[("/prefix", None), ("/prefix", None)],
+        side_effect=[(INTERPRETER_INFO, None), (INTERPRETER_INFO, None)],
     )
     m = mocker.patch("poetry.utils.env.EnvManager.build_venv", side_effect=build_venv)
 
@@ -154,7 +172,7 @@ def test_activate_activates_existing_virtualenv_no_envs_file(
     )
     mocker.patch(
         "poetry.utils._compat.subprocess.Popen.communicate",
-        side_effect=[("/prefix", None)],
+        side_effect=[(INTERPRETER_INFO, None)],
     )
     m = mocker.patch("poetry.utils.env.EnvManager.build_venv", side_effect=build_venv)
 
@@ -195,7 +213,7 @@ def test_activate_activates_same_virtualenv_with_envs_file(
     )
     mocker.patch(
         "poetry.utils._compat.subprocess.Popen.communicate",
-        side_effect=[("/prefix", None)],
+        side_effect=[(INTERPRETER_INFO, None)],
     )
     m = mocker.patch("poetry.utils.env.EnvManager.create_venv")
 
@@ -234,7 +252,11 @@ def test_activate_activates_different_virtualenv_with_envs_file(
     )
     mocker.patch(
         "poetry.utils._compat.subprocess.Popen.communicate",
-        side_effect=[("/prefix", None), ("/prefix", None), ("/prefix", None)],
+        side_effect=[
+            (INTERPRETER_INFO, None),
+            (INTERPRETER_INFO, None),
+            (INTERPRETER_INFO, None),
+        ],
     )
     m = mocker.patch("poetry.utils.env.EnvManager.build_venv", side_effect=build_venv)
 
@@ -276,11 +298,10 @@ def test_activate_activates_recreates_for_different_patch(
     mocker.patch(
         "poetry.utils._compat.subprocess.Popen.communicate",
         side_effect=[
-            ("/prefix", None),
-            ('{"version_info": [3, 7, 0]}', None),
-            ("/prefix", None),
-            ("/prefix", None),
-            ("/prefix", None),
+            (get_interpreter_info((3, 7, 0)), None),
+            (INTERPRETER_INFO, None),
+            (INTERPRETER_INFO, None),
+            (INTERPRETER_INFO, None),
         ],
     )
     build_venv_m = mocker.patch(
@@ -332,7 +353,11 @@ def test_activate_does_not_recreate_when_switching_minor(
     )
     mocker.patch(
         "poetry.utils._compat.subprocess.Popen.communicate",
-        side_effect=[("/prefix", None), ("/prefix", None), ("/prefix", None)],
+        side_effect=[
+            (INTERPRETER_INFO, None),
+            (INTERPRETER_INFO, None),
+            (INTERPRETER_INFO, None),
+        ],
     )
     build_venv_m = mocker.patch(
         "poetry.utils.env.EnvManager.build_venv", side_effect=build_venv
@@ -448,7 +473,7 @@ def test_get_prefers_explicitly_activated_virtualenvs_over_env_var(
     )
     mocker.patch(
         "poetry.utils._compat.subprocess.Popen.communicate",
-        side_effect=[("/prefix", None)],
+        side_effect=[(INTERPRETER_INFO, None)],
     )
 
     env = manager.get()
@@ -760,7 +785,7 @@ def test_activate_with_in_project_setting_does_not_fail_if_no_venvs_dir(
     )
     mocker.patch(
         "poetry.utils._compat.subprocess.Popen.communicate",
-        side_effect=[("/prefix", None), ("/prefix", None)],
+        side_effect=[(INTERPRETER_INFO, None), (INTERPRETER_INFO, None)],
     )
     m = mocker.patch("poetry.utils.env.EnvManager.build_venv")
 
@@ -798,3 +823,67 @@ def test_env_site_packages_should_find_the_site_packages_directory_if_root(tmp_d
     env = VirtualEnv(Path(tmp_dir), Path(tmp_dir))
 
     assert site_packages == env.site_packages
+
+
+def test_virtualenv_info_is_retrieved_once_and_persisted(tmp_venv, mocker):
+    run = mocker.spy(VirtualEnv, "run")
+
+    venv = VirtualEnv(tmp_venv.path)
+
+    assert venv.version_info[:3] == tuple(sys.version_info[:3])
+    assert venv.config_var("py_version_nodot") == "{}{}".format(*sys.version_info[:2])
+    assert venv.sys_path
+    assert venv.pip_version > Version.parse("0.0")
+    assert 0 == run.call_count
+    assert (tmp_venv.path / VirtualEnv.INFO_FILE).exists()
+
+
+def test_virtualenv_config_vars_are_the_same_once_persisted(tmp_venv):
+    names = ["Py_DEBUG", "SIZEOF_VOID_P", "SOABI", "py_version_nodot", "UNKNOWN"]
+    output = tmp_venv.run(
+        "python",
+        "-c",
+        "import sysconfig; "
+        "print('\\n'.join(str(sysconfig.get_config_var(n)) for n in {!r}))".format(
+            names
+        ),
+    )
+    expected = [
+        {"None": None, "1": 1, "0": 0}.get(value, value)
+        for value in output.strip().splitlines()
+    ]
+
+    assert expected == [tmp_venv.config_var(name) for name in names]
+    assert expected == [VirtualEnv(tmp_venv.path).config_var(name) for name in names]
+
+    # Information persisted by earlier versions
+    info = json.loads(
+        (tmp_venv.path / VirtualEnv.INFO_FILE).read_text(encoding="utf-8")
+    )
+    info["config_vars"]["Py_DEBUG"] = 0
+    info["config_vars"]["SIZEOF_VOID_P"] = 8
+    (tmp_venv.path / VirtualEnv.INFO_FILE).write_text(
+        decode(json.dumps(info)), encoding="utf-8"
+    )
+
+    venv = VirtualEnv(tmp_venv.path)
+    assert 0 == venv.config_var("Py_DEBUG")
+    assert "8" == venv.config_var("SIZEOF_VOID_P")
+
+
+def test_virtualenv_info_is_retrieved_again_if_the_interpreter_changed(
+    tmp_venv, mocker
+):
+    info_file = tmp_venv.path / VirtualEnv.INFO_FILE
+    assert tmp_venv.info
+
+    info = json.loads(info_file.read_text(encoding="utf-8"))
+    info["key"][2] += 1
+    info["marker_env"]["python_full_version"] = "0.0.0"
+    info_file.write_text(decode(json.dumps(info)), encoding="utf-8")
+
+    run = mocker.spy(VirtualEnv, "run")
+    venv = VirtualEnv(tmp_venv.path)
+
+    assert venv.marker_env["python_full_version"] != "0.0.0"
+    assert 1 == run.call_count
@@ -1,6 +1,10 @@
+import os
+
 from poetry.utils._compat import Path
+from poetry.utils.helpers import atomic_write
 from poetry.utils.helpers import get_cert
 from poetry.utils.helpers import get_client_cert
+from poetry.utils.helpers import interpreter_tag
 from poetry.utils.helpers import parse_requires
 
 
@@ -65,3 +69,32 @@ def test_get_client_cert(config):
     config.merge({"certificates": {"foo": {"client-cert": client_cert}}})
 
     assert get_client_cert(config, "foo") == Path(client_cert)
+
+
+def test_interpreter_tag(mocker):
+    mocker.patch("platform.python_implementation", return_value="PyPy")
+    mocker.patch("sys.version_info", (3, 6, 9, "final", 0))
+
+    assert "pypy-3.6.9" == interpreter_tag()
+
+
+def test_atomic_write_replaces_the_file(tmp_dir):
+    path = Path(tmp_dir) / "file.json"
+    path.write_bytes(b"old")
+
+    atomic_write(path, b"new")
+
+    assert b"new" == path.read_bytes()
+    assert ["file.json"] == os.listdir(tmp_dir)
+
+
+def test_atomic_write_keeps_the_file_if_it_cannot_be_replaced(tmp_dir, mocker):
+    path = Path(tmp_dir) / "file.json"
+    path.write_bytes(b"old")
+    mocker.patch("os.replace", side_effect=OSError)
+    mocker.patch("os.rename", side_effect=OSError)
+
+    atomic_write(path, b"new")
+
+    assert b"old" == path.read_bytes()
+    assert ["file.json"] == os.listdir(tmp_dir)
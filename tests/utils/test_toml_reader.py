@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import pytest
+
+from poetry.utils.toml_reader import TOMLReaderError
+from poetry.utils.toml_reader import loads
+
+
+def test_loads():
+    content = """
+# comment
+a = "x\\"y\\\\z\\u00e9\\t"
+b = 'lit\\eral'
+"q.k" = true
+
+[t.u]
+v = [1, 2,
+  # comment
+  3,]
+
+[t]
+w = {}
+x = { y = "1", z = [ "a" ] }  # comment
+
+[[t.arr]]
+k = 1
+
+[t.arr.sub]
+m = false
+
+[[t.arr]]
+k = -2
+"""
+
+    assert {
+        "a": 'x"y\\zé\t',
+        "b": "lit\\eral",
+        "q.k": True,
+        "t": {
+            "u": {"v": [1, 2, 3]},
+            "w": {},
+            "x": {"y": "1", "z": ["a"]},
+            "arr": [{"k": 1, "sub": {"m": False}}, {"k": -2}],
+        },
+    } == loads(content)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        'a = """multiline"""',
+        "a = 1.5",
+        "a = 1979-05-27",
+        "[a]\nb.c = 1",
+        "[a]\nb = 1\n[a]\nc = 2",
+        "a = 1\na = 2",
+        "a = 1\n[a]",
+        'a = "\\x"',
+        "a = [1 2]",
+        "a = 1 b = 2",
+        'a = "unterminated',
+        "[a\nb = 1",
+    ],
+)
+def test_loads_rejects_unsupported_or_invalid_content(content):
+    with pytest.raises(TOMLReaderError):
+        loads(content)
@@ -0,0 +1,141 @@
+import subprocess
+
+import pytest
+
+from poetry.puzzle.provider import Provider
+from poetry.utils._compat import Path
+from poetry.vcs.git import Git
+from poetry.vcs.git_cache import GitCache
+
+
+def git(path, *args):
+    return (
+        subprocess.check_output(["git", "-C", str(path)] + list(args)).decode().strip()
+    )
+
+
+def commit(path, filename, content):
+    with path.joinpath(filename).open("w", encoding="utf-8") as f:
+        f.write(content)
+
+    git(path, "add", filename)
+    git(
+        path,
+        "-c",
+        "user.name=Poetry",
+        "-c",
+        "user.email=poetry@example.com",
+        "commit",
+        "-q",
+        "-m",
+        filename,
+    )
+
+    return git(path, "rev-parse", "HEAD")
+
+
+@pytest.fixture(autouse=True)
+def git_mock():
+    # Use the real git commands
+    pass
+
+
+@pytest.fixture
+def repository(tmp_dir):
+    path = Path(tmp_dir, "repository")
+    path.mkdir()
+    git(path, "init", "-q")
+
+    return path
+
+
+@pytest.fixture
+def cache(tmp_dir):
+    return GitCache(Path(tmp_dir, "cache"))
+
+
+def test_revision_resolves_references(repository, cache):
+    first = commit(repository, "setup.py", u"")
+    git(repository, "tag", "v1.0")
+    second = commit(repository, "README.rst", u"")
+
+    url = repository.as_posix()
+    assert second == cache.revision(url)
+    assert first == cache.revision(url, "v1.0")
+    assert first == cache.revision(url, first[:7])
+
+
+def test_known_revisions_do_not_fetch(repository, cache, mocker):
+    first = commit(repository, "setup.py", u"")
+    url = repository.as_posix()
+    cache.revision(url)
+
+    run = mocker.spy(Git, "run")
+    cached = GitCache(cache.cache_dir)
+
+    assert first == cached.revision(url, first)
+    assert not any("fetch" in c[0] for c in run.call_args_list)
+
+    second = commit(repository, "README.rst", u"")
+    assert second == cached.revision(url)
+    assert any("fetch" in c[0] for c in run.call_args_list)
+
+
+def test_export_checks_out_the_reference(repository, cache, tmp_dir):
+    first = commit(repository, "setup.py", u"")
+    commit(repository, "README.rst", u"")
+
+    url = repository.as_posix()
+    dest = Path(tmp_dir, "export")
+
+    assert first == cache.export(url, first, dest)
+    assert (dest / "setup.py").exists()
+    assert not (dest / "README.rst").exists()
+    assert url == git(dest, "remote", "get-url", "origin")
+
+
+def test_metadata_is_stored_by_revision(cache):
+    url = "https://github.com/demo/demo.git"
+    metadata = {"name": "demo", "version": "0.1.2", "requires": ["pendulum>=1.4.4"]}
+
+    assert cache.metadata(url, "9cf87a285a2d3fbb0b9fa621997b3acc3631ed24") is None
+
+    cache.store_metadata(url, "9cf87a285a2d3fbb0b9fa621997b3acc3631ed24", metadata)
+
+    assert metadata == cache.metadata(url, "9cf87a285a2d3fbb0b9fa621997b3acc3631ed24")
+    assert cache.metadata(url, "0" * 40) is None
+
+
+def test_metadata_is_stored_by_interpreter(cache, mocker):
+    url = "https://github.com/demo/demo.git"
+    revision = "9cf87a285a2d3fbb0b9fa621997b3acc3631ed24"
+    cache.store_metadata(url, revision, {"name": "demo"})
+
+    mocker.patch("poetry.vcs.git_cache.interpreter_tag", return_value="pypy-3.6.9")
+
+    assert cache.metadata(url, revision) is None
+
+
+def test_get_package_from_vcs_reuses_cached_metadata(repository, tmp_dir, mocker):
+    mocker.patch("poetry.vcs.git_cache.CACHE_DIR", str(Path(tmp_dir, "cache")))
+    revision = commit(
+        repository,
+        "setup.py",
+        u"from setuptools import setup\n\n"
+        u'setup(name="demo", version="0.1.2", install_requires=["pendulum>=1.4.4"])\n',
+    )
+
+    url = repository.as_posix()
+    package = Provider.get_package_from_vcs("git", url, revision)
+
+    assert "demo" == package.name
+    assert "0.1.2" == package.version.text
+    assert revision == package.source_reference
+
+    export = mocker.spy(GitCache, "export")
+    cached = Provider.get_package_from_vcs("git", url, revision)
+
+    assert 0 == export.call_count
+    assert package.name == cached.name
+    assert package.version == cached.version
+    assert package.requires == cached.requires
@@ -2,10 +2,12 @@ import os
 
 import pytest
 
+from poetry.version.markers import InvalidMarker
 from poetry.version.markers import MarkerUnion
 from poetry.version.markers import MultiMarker
 from poetry.version.markers import SingleMarker
 from poetry.version.markers import parse_marker
+from poetry.version.markers import validate_markers
 
 
 def test_single_marker():
@@ -37,6 +39,29 @@ def test_single_marker():
     assert str(m.constraint) == "<2.7.0 || >=2.8.0,<3.0.0 || >=3.2.0"
 
 
+def test_parse_marker_with_nested_groups_and_no_whitespace():
+    m = parse_marker("((python_version<'3.6'or os.name=='nt'))and extra=='test'")
+
+    assert isinstance(m, MultiMarker)
+    assert str(m) == '(python_version < "3.6" or os_name == "nt") and extra == "test"'
+
+
+@pytest.mark.parametrize(
+    "marker",
+    [
+        'python_version >= "3.6" and',
+        'python_version >= "3.6")',
+        '(python_version >= "3.6"',
+        "python_version >= 3.6",
+        'python_version ~ "3.6"',
+        'extras == "test"',
+    ],
+)
+def test_parse_invalid_marker(marker):
+    with pytest.raises(InvalidMarker):
+        parse_marker(marker)
+
+
 def test_single_marker_intersect():
     m = parse_marker('sys_platform == "darwin"')
 
@@ -479,3 +504,44 @@ def test_parse_version_like_markers(marker, env):
     m = parse_marker(marker)
 
     assert m.validate(env)
+
+
+def test_validate_markers():
+    markers = [
+        parse_marker('sys_platform == "win32"'),
+        parse_marker('python_version >= "3.6" and sys_platform == "linux"'),
+        parse_marker('sys_platform == "win32"'),
+        parse_marker('python_version < "3.6" or os_name == "nt"'),
+        parse_marker(""),
+        parse_marker("<empty>"),
+    ]
+    environment = {"python_version": "3.7", "sys_platform": "linux", "os_name": "nt"}
+
+    assert [True, True, True, True, True, False] == validate_markers(markers, None)
+    assert [False, True, False, True, True, False] == validate_markers(
+        markers, environment
+    )
+    assert [m.validate(environment) for m in markers] == validate_markers(
+        markers, environment
+    )
+
+
+def test_marker_evaluator_is_compiled_once():
+    marker = parse_marker('python_version >= "3.6" and sys_platform == "linux"')
+
+    assert marker.evaluator is marker.evaluator
+    assert marker.evaluator({"python_version": "3.7", "sys_platform": "linux"})
+    assert not marker.evaluator({"python_version": "3.5", "sys_platform": "linux"})
+
+
+def test_marker_union_append_invalidates_evaluator():
+    # The markers returned by parse_marker() are cached and shared
+    # so the ones modified here are built directly.
+    union = MarkerUnion(SingleMarker("sys_platform", "win32"))
+    environment = {"sys_platform": "linux"}
+
+    assert not union.validate(environment)
+
+    union.append(SingleMarker("sys_platform", "linux"))
+
+    assert union.validate(environment)